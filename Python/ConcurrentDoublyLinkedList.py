@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018 Jared Gillespie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import threading
+
+
+class Node:
+    """A node containing data with a pointer to a next and previous node, and a lock guarding both.
+    i.e. Node1 <-> Node2
+
+    The version is odd while the next pointer is being changed, and is increased on every change, so readers can
+    tell whether the links they followed are still current.
+    """
+    __slots__ = ('data', 'next', 'prev', 'lock', 'version', 'removed')
+
+    def __init__(self, data=None):
+        self.data = data
+        self.next = None
+        self.prev = None
+        self.lock = threading.Lock()
+        self.version = 0
+        self.removed = False
+
+    def __repr__(self):
+        return 'Node(%r)' % (self.data,)
+
+
+class ConcurrentDoublyLinkedList:
+    """A doubly linked list which many threads can change at once, with a lock per node rather than one for the list.
+
+    The list sits between a head and a tail sentinel node. Writers lock only the nodes whose links they change, always
+    in list order, so operations on different parts of the list run in parallel and can't deadlock. Operations by
+    index or by value walk the list hand-over-hand, locking each node before letting go of the one behind it.
+
+    Readers take no locks. Iteration follows the next pointers, which a removed node keeps, and skips removed nodes,
+    so it never blocks or fails but may miss changes made while it runs. snapshot() returns a consistent copy by
+    checking each node's version after the walk, and only locks the list if writers keep changing it.
+
+    >>> my_list = ConcurrentDoublyLinkedList()
+    >>> threads = [threading.Thread(target=lambda: [my_list.append(i) for i in range(100)]) for _ in range(4)]
+    >>> for thread in threads: thread.start()
+    >>> for thread in threads: thread.join()
+    >>> len(my_list), sorted(my_list) == sorted(list(range(100)) * 4)
+    (400, True)
+    """
+
+    # Optimistic snapshot walks to try before locking the list
+    _SNAPSHOT_ATTEMPTS = 3
+
+    def __init__(self, elements=None):
+        """Instantiates a new instance of a ConcurrentDoublyLinkedList.
+
+        :param elements: Optional. The elements initialize with.
+        :exception: TypeError is raised if 'elements' is not iterable.
+
+        >>> my_list = ConcurrentDoublyLinkedList()
+        >>> my_list
+        []
+
+        >>> my_list = ConcurrentDoublyLinkedList([3, 4, 5])
+        >>> my_list
+        [3, 4, 5]
+        """
+        self._head = Node()
+        self._tail = Node()
+        self._head.next = self._tail
+        self._tail.prev = self._head
+
+        if elements is not None:
+            self.extend(elements)
+
+    def __contains__(self, item) -> bool:
+        return any(data == item for data in self)
+
+    def __eq__(self, other):
+        if isinstance(other, ConcurrentDoublyLinkedList):
+            return self.snapshot() == other.snapshot()
+        elif isinstance(other, list):
+            return self.snapshot() == other
+        else:
+            return NotImplemented
+
+    def __iter__(self):
+        node = self._head.next
+        while node is not self._tail:
+            if not node.removed:
+                yield node.data
+            node = node.next
+
+    def __len__(self):
+        return len(self._nodes())
+
+    def __repr__(self):
+        return str(self.snapshot())
+
+    @property
+    def size(self) -> int:
+        """Returns the size of the list.
+        This takes a snapshot, so it's O(n), as there is no shared counter for writers to contend on.
+
+        :return: The size.
+
+        >>> my_list = ConcurrentDoublyLinkedList([1, 2, 3])
+        >>> my_list.size
+        3
+        """
+        return len(self._nodes())
+
+    def append(self, data):
+        """Appends the data to the end of the list.
+
+        :param data: The data to append.
+
+        >>> my_list = ConcurrentDoublyLinkedList([3, 4])
+        >>> my_list.append(1)
+        >>> my_list
+        [3, 4, 1]
+        """
+        tail = self._tail
+        while True:
+            pred = tail.prev
+            pred.lock.acquire()
+            tail.lock.acquire()
+            try:
+                # The last node may have changed before its lock was taken
+                if tail.prev is pred and not pred.removed:
+                    self._link(pred, data, tail)
+                    return
+            finally:
+                tail.lock.release()
+                pred.lock.release()
+
+    def extend(self, other):
+        """Extends the list with the elements of another, appending them one at a time.
+
+        :param other: An iterable to extend the list with.
+        :exception: TypeError is raised if 'other' is not iterable.
+
+        >>> my_list = ConcurrentDoublyLinkedList([1])
+        >>> my_list.extend([2, 3, 4])
+        >>> my_list
+        [1, 2, 3, 4]
+        """
+        try:
+            elements = iter(other)
+        except TypeError:
+            raise TypeError("other must be iterable") from None
+
+        for data in elements:
+            self.append(data)
+
+    def get(self, index: int):
+        """Gets the data at the specified index.
+        Negative indices aren't supported, as the size can change while the list is walked.
+
+        :param index: The index to retrieve.
+        :return: The data.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = ConcurrentDoublyLinkedList([4, 6, 2])
+        >>> my_list.get(1)
+        6
+        """
+        pred = self._lock_before(index)
+        try:
+            node = pred.next
+            if node is self._tail:
+                raise IndexError("index is out of range")
+
+            return node.data
+        finally:
+            pred.lock.release()
+
+    def insert(self, index: int, data):
+        """Inserts the data at the given index.
+        If an element exists at the given position, the element is inserted before it.
+        Negative indices aren't supported, as the size can change while the list is walked.
+
+        :param index: The index to insert at.
+        :param data: The data to insert.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = ConcurrentDoublyLinkedList([1, 3])
+        >>> my_list.insert(1, 2)
+        >>> my_list
+        [1, 2, 3]
+        """
+        pred = self._lock_before(index)
+        try:
+            succ = pred.next
+            succ.lock.acquire()
+            try:
+                self._link(pred, data, succ)
+            finally:
+                succ.lock.release()
+        finally:
+            pred.lock.release()
+
+    def is_empty(self) -> bool:
+        """Returns True if the list is empty, otherwise False.
+
+        :return: A boolean indicating whether the list is empty.
+
+        >>> my_list = ConcurrentDoublyLinkedList()
+        >>> my_list.is_empty()
+        True
+        """
+        return self._head.next is self._tail
+
+    def pop(self):
+        """Removes and returns the data from the beginning of the list.
+
+        :return: The data.
+        :exception: IndexError is raised if list is empty.
+
+        >>> my_list = ConcurrentDoublyLinkedList([1, 2, 3])
+        >>> my_list.pop()
+        1
+        """
+        head = self._head
+        head.lock.acquire()
+        try:
+            if head.next is self._tail:
+                raise IndexError("list is empty")
+
+            return self._unlink_next(head)
+        finally:
+            head.lock.release()
+
+    def pop_last(self):
+        """Removes and returns the data from the end of the list.
+
+        :return: The data.
+        :exception: IndexError is raised if list is empty.
+
+        >>> my_list = ConcurrentDoublyLinkedList([1, 2, 3])
+        >>> my_list.pop_last()
+        3
+        """
+        head = self._head
+        tail = self._tail
+        while True:
+            node = tail.prev
+            if node is head:
+                # An append may be half done, so only the locks can tell whether the list is really empty
+                with head.lock, tail.lock:
+                    if head.next is tail:
+                        raise IndexError("list is empty")
+                continue
+
+            pred = node.prev
+            pred.lock.acquire()
+            node.lock.acquire()
+            tail.lock.acquire()
+            try:
+                # The last two nodes may have changed before their locks were taken
+                if tail.prev is node and node.prev is pred and not node.removed:
+                    return self._unlink(pred, node, tail)
+            finally:
+                tail.lock.release()
+                node.lock.release()
+                pred.lock.release()
+
+    def prepend(self, data):
+        """Prepends the data to the beginning of the list.
+
+        :param data: The data to prepend.
+
+        >>> my_list = ConcurrentDoublyLinkedList([3, 4])
+        >>> my_list.prepend(1)
+        >>> my_list
+        [1, 3, 4]
+        """
+        head = self._head
+        head.lock.acquire()
+        try:
+            succ = head.next
+            succ.lock.acquire()
+            try:
+                self._link(head, data, succ)
+            finally:
+                succ.lock.release()
+        finally:
+            head.lock.release()
+
+    def remove(self, index: int):
+        """Removes and returns the data at the given index.
+        Negative indices aren't supported, as the size can change while the list is walked.
+
+        :param index: The index to remove.
+        :return: The data at the index.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = ConcurrentDoublyLinkedList([4, 7, 2])
+        >>> my_list.remove(1)
+        7
+        """
+        pred = self._lock_before(index)
+        try:
+            if pred.next is self._tail:
+                raise IndexError("index is out of range")
+
+            return self._unlink_next(pred)
+        finally:
+            pred.lock.release()
+
+    def remove_item(self, data):
+        """Removes the first occurrence of the given data.
+
+        :param data: The data to remove.
+        :exception: ValueError is raised if item is not found.
+
+        >>> my_list = ConcurrentDoublyLinkedList([3, 4, 3])
+        >>> my_list.remove_item(3)
+        >>> my_list
+        [4, 3]
+        """
+        pred = self._head
+        pred.lock.acquire()
+        try:
+            while True:
+                node = pred.next
+                if node is self._tail:
+                    raise ValueError("item not found")
+
+                if node.data == data:
+                    self._unlink_next(pred)
+                    return
+
+                # Hand-over-hand: hold the next node before letting go of this one
+                node.lock.acquire()
+                pred.lock.release()
+                pred = node
+        finally:
+            pred.lock.release()
+
+    def snapshot(self) -> list:
+        """Returns a list of the elements as they all were at a single moment.
+
+        :return: The list.
+
+        >>> my_list = ConcurrentDoublyLinkedList([1, 2, 3])
+        >>> my_list.snapshot()
+        [1, 2, 3]
+        """
+        return [node.data for node in self._nodes()]
+
+    def _nodes(self) -> list:
+        """Returns the nodes in the list at a single moment.
+
+        The list is walked without locks, noting each node's version before following its next pointer. If no node
+        has changed by the end of the walk, the links followed were all current at once. Otherwise the walk is tried
+        again, and if writers keep winning, the list is locked from end to end instead.
+        """
+        tail = self._tail
+        for attempt in range(self._SNAPSHOT_ATTEMPTS):
+            seen = []
+            node = self._head
+            while node is not tail:
+                version = node.version
+                if version & 1:
+                    break
+                seen.append((node, version))
+                node = node.next
+            else:
+                if all(node.version == version for node, version in seen):
+                    return [node for node, version in seen[1:]]
+
+        return self._locked_nodes()
+
+    def _locked_nodes(self) -> list:
+        """Returns the nodes in the list, holding every lock in list order while they're gathered."""
+        locked = [self._head]
+        self._head.lock.acquire()
+        try:
+            node = self._head.next
+            while node is not None:
+                node.lock.acquire()
+                locked.append(node)
+                node = node.next
+        finally:
+            for node in reversed(locked):
+                node.lock.release()
+
+        return locked[1:-1]
+
+    def _lock_before(self, index: int) -> Node:
+        """Walks hand-over-hand to the node before a non-negative index, and returns it locked.
+        The head sentinel is returned for index 0.
+        """
+        if index < 0:
+            raise IndexError("index is out of range")
+
+        node = self._head
+        node.lock.acquire()
+        for i in range(index):
+            next_node = node.next
+            if next_node is self._tail:
+                node.lock.release()
+                raise IndexError("index is out of range")
+
+            next_node.lock.acquire()
+            node.lock.release()
+            node = next_node
+
+        return node
+
+    def _link(self, pred: Node, data, succ: Node):
+        """Links a new node containing the data between two adjacent nodes. Both must be locked."""
+        node = Node(data)
+        node.prev = pred
+        node.next = succ
+
+        # Readers only follow next pointers, so the node is in the list once its predecessor points to it
+        pred.version += 1
+        pred.next = node
+        pred.version += 1
+
+        succ.prev = node
+
+    def _unlink_next(self, pred: Node):
+        """Unlinks the node after a locked node, which must not be the tail, and returns its data."""
+        node = pred.next
+        node.lock.acquire()
+        try:
+            succ = node.next
+            succ.lock.acquire()
+            try:
+                return self._unlink(pred, node, succ)
+            finally:
+                succ.lock.release()
+        finally:
+            node.lock.release()
+
+    def _unlink(self, pred: Node, node: Node, succ: Node):
+        """Unlinks a node from between its neighbours, and returns its data. All three must be locked.
+        The node keeps its own links, so a reader standing on it can still walk on to the rest of the list.
+        """
+        node.removed = True
+
+        pred.version += 1
+        pred.next = succ
+        pred.version += 1
+
+        succ.prev = pred
+
+        return node.data
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
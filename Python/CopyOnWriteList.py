@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018 Jared Gillespie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import collections
+
+
+class CopyOnWriteList:
+    """A list whose copies share storage until either side changes it.
+
+    The elements are stored in chunks of up to 'chunk_size' elements. Copying the list only copies the
+    references to its chunks, and a chunk is copied the first time it is changed by a list which doesn't
+    own it. Copying a large list which then changes slowly therefore costs only the chunks which change.
+
+    The chunks are kept in a deque, so inserting or removing at either end costs O(chunk_size).
+    """
+
+    def __init__(self, elements=None, chunk_size: int = 256):
+        """Instantiates a new instance of a CopyOnWriteList.
+
+        :param elements: Optional. The elements initialize with.
+        :param chunk_size: Optional. The number of elements per chunk.
+        :exception: TypeError is raised if 'elements' is not iterable.
+        :exception: ValueError is raised if 'chunk_size' is < 1.
+
+        >>> my_list = CopyOnWriteList()
+        >>> my_list
+        []
+
+        >>> my_list = CopyOnWriteList([3, 4, 5])
+        >>> my_list
+        [3, 4, 5]
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be > 0")
+
+        self._chunk_size = chunk_size
+        self._chunks = collections.deque()
+        self._owned = collections.deque()
+        self._size = 0
+
+        if elements is not None:
+            self.extend(elements)
+
+    def __contains__(self, item) -> bool:
+        for chunk in self._chunks:
+            if item in chunk:
+                return True
+
+        return False
+
+    def __delitem__(self, index):
+        if not isinstance(index, slice):
+            self.pop(index)
+            return
+
+        start, stop, step = index.indices(self._size)
+        if step != 1:
+            elements = list(self)
+            del elements[index]
+            self._replace(elements)
+            return
+
+        if start >= stop:
+            return
+
+        chunks, owned = [], []
+        offset = 0
+
+        for chunk, is_owned in zip(self._chunks, self._owned):
+            end = offset + len(chunk)
+
+            if end <= start or offset >= stop:
+                chunks.append(chunk)
+                owned.append(is_owned)
+            elif start > offset or stop < end:
+                # Partially removed, so the chunk is changed and must be owned
+                chunk = chunk[:max(0, start - offset)] + chunk[min(len(chunk), stop - offset):]
+                chunks.append(chunk)
+                owned.append(True)
+
+            offset = end
+
+        self._chunks = collections.deque(chunks)
+        self._owned = collections.deque(owned)
+        self._size -= stop - start
+
+    def __eq__(self, other):
+        if isinstance(other, (CopyOnWriteList, list)):
+            if len(self) != len(other):
+                return False
+
+            for self_data, other_data in zip(self, other):
+                if self_data != other_data:
+                    return False
+
+            return True
+        else:
+            return NotImplemented
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step != 1:
+                return list(self)[index]
+
+            elements = []
+            offset = 0
+
+            for chunk in self._chunks:
+                end = offset + len(chunk)
+                if end > start:
+                    elements.extend(chunk[max(0, start - offset):stop - offset])
+                if end >= stop:
+                    break
+                offset = end
+
+            return elements
+
+        chunk_index, offset = self._locate(index)
+
+        return self._chunks[chunk_index][offset]
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return str(list(self))
+
+    def __reversed__(self):
+        for chunk in reversed(self._chunks):
+            yield from reversed(chunk)
+
+    def append(self, data):
+        """Appends the data to the end of the list.
+
+        :param data: The data to append.
+
+        >>> my_list = CopyOnWriteList([3, 4])
+        >>> my_list.append(1)
+        >>> my_list
+        [3, 4, 1]
+        """
+        chunks = self._chunks
+        self._size += 1
+
+        if chunks and len(chunks[-1]) < self._chunk_size:
+            if self._owned[-1]:
+                chunks[-1].append(data)
+            else:
+                self._own(len(chunks) - 1).append(data)
+        else:
+            chunks.append([data])
+            self._owned.append(True)
+
+    def copy(self):
+        """Returns a copy of the list, which shares its chunks with the list until either changes them.
+
+        :return: A copy of the list.
+
+        >>> my_list = CopyOnWriteList([1, 2, 3])
+        >>> list_copy = my_list.copy()
+        >>> list_copy.append(4)
+        >>> my_list, list_copy
+        ([1, 2, 3], [1, 2, 3, 4])
+        """
+        list_copy = CopyOnWriteList(chunk_size=self._chunk_size)
+        list_copy._chunks = self._chunks.copy()
+        list_copy._owned = collections.deque([False] * len(self._chunks))
+        list_copy._size = self._size
+
+        self._owned = collections.deque([False] * len(self._chunks))
+
+        return list_copy
+
+    def extend(self, other):
+        """Extends the list with the elements of another.
+
+        :param other: An iterable to extend the list with.
+        :exception: TypeError is raised if 'other' is not iterable.
+
+        >>> my_list = CopyOnWriteList([1])
+        >>> my_list.extend([2, 3, 4])
+        >>> my_list
+        [1, 2, 3, 4]
+        """
+        elements = list(other)
+        if not elements:
+            return
+
+        size = self._chunk_size
+        start = 0
+
+        if self._chunks and len(self._chunks[-1]) < size:
+            start = size - len(self._chunks[-1])
+            self._own(len(self._chunks) - 1).extend(elements[:start])
+
+        for i in range(start, len(elements), size):
+            self._chunks.append(elements[i:i + size])
+            self._owned.append(True)
+
+        self._size += len(elements)
+
+    def insert(self, index: int, data):
+        """Inserts the data at the given index.
+        If an element exists at the given position, the element is inserted before it.
+
+        :param index: The index to insert at.
+        :param data: The data to insert.
+
+        >>> my_list = CopyOnWriteList([1, 3])
+        >>> my_list.insert(1, 2)
+        >>> my_list.insert(0, 0)
+        >>> my_list
+        [0, 1, 2, 3]
+        """
+        if index < 0:
+            index = max(0, self._size + index)
+
+        if index >= self._size:
+            self.append(data)
+            return
+
+        chunk_index, offset = self._locate(index)
+
+        if offset == 0 and chunk_index == 0 and len(self._chunks[0]) >= self._chunk_size:
+            # Inserting at the front of a full list, so start a new chunk rather than splitting
+            self._chunks.appendleft([data])
+            self._owned.appendleft(True)
+        else:
+            chunk = self._own(chunk_index)
+            chunk.insert(offset, data)
+
+            if len(chunk) > self._chunk_size:
+                half = len(chunk) // 2
+                self._chunks[chunk_index] = chunk[half:]
+                self._chunks.insert(chunk_index, chunk[:half])
+                self._owned.insert(chunk_index, True)
+
+        self._size += 1
+
+    def pop(self, index: int = -1):
+        """Removes and returns the data at the given index, the end of the list by default.
+
+        :param index: Optional. The index to remove.
+        :return: The data.
+        :exception: IndexError is raised if the index is out of bounds.
+
+        >>> my_list = CopyOnWriteList([1, 2, 3])
+        >>> my_list.pop(), my_list.pop(0), my_list
+        (3, 1, [2])
+        """
+        chunks = self._chunks
+
+        # Fast path for the end of the list, which is the common case
+        if index == -1 and chunks and self._owned[-1] and len(chunks[-1]) > 1:
+            self._size -= 1
+            return chunks[-1].pop()
+
+        chunk_index, offset = self._locate(index)
+        chunk = self._own(chunk_index)
+        data = chunk.pop(offset)
+
+        if not chunk:
+            del self._chunks[chunk_index]
+            del self._owned[chunk_index]
+
+        self._size -= 1
+
+        return data
+
+    def reverse(self):
+        """Reverses the list.
+
+        >>> my_list = CopyOnWriteList([1, 2, 3])
+        >>> my_list.reverse()
+        >>> my_list
+        [3, 2, 1]
+        """
+        self._chunks = collections.deque(chunk[::-1] for chunk in reversed(self._chunks))
+        self._owned = collections.deque([True] * len(self._chunks))
+
+    def _locate(self, index: int):
+        """Returns the chunk index and offset within the chunk of an index."""
+        if index < -self._size or index >= self._size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index += self._size
+
+        chunks = self._chunks
+
+        # Fast paths for either end, otherwise walk the chunks from the closer end
+        if index < len(chunks[0]):
+            return 0, index
+
+        if index >= self._size - len(chunks[-1]):
+            return len(chunks) - 1, index - (self._size - len(chunks[-1]))
+
+        if index < self._size // 2:
+            for chunk_index, chunk in enumerate(chunks):
+                if index < len(chunk):
+                    return chunk_index, index
+                index -= len(chunk)
+        else:
+            index = self._size - index
+            for chunk_index, chunk in zip(range(len(chunks) - 1, -1, -1), reversed(chunks)):
+                if index <= len(chunk):
+                    return chunk_index, len(chunk) - index
+                index -= len(chunk)
+
+    def _own(self, chunk_index: int):
+        """Returns the chunk at the given index, copying it first if it's shared."""
+        if not self._owned[chunk_index]:
+            self._chunks[chunk_index] = self._chunks[chunk_index][:]
+            self._owned[chunk_index] = True
+
+        return self._chunks[chunk_index]
+
+    def _replace(self, elements: list):
+        self._chunks = collections.deque()
+        self._owned = collections.deque()
+        self._size = 0
+        self.extend(elements)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
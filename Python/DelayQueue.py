@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018 Jared Gillespie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import math
+
+
+class Timer:
+    """A handle to an item scheduled in a DelayQueue, which can be used to cancel it."""
+    def __init__(self, item, deadline):
+        self.item = item
+        self.deadline = deadline
+        self._tick = 0
+        self._level = -1
+        self._slot = None
+
+    def __repr__(self):
+        return 'Timer(%r, %r)' % (self.item, self.deadline)
+
+
+class DelayQueue:
+    """A queue of items which become available once their deadline has passed.
+
+    Items are held in a hierarchical timing wheel. Each level of the wheel has 'wheel_size' slots, and
+    each slot of a level spans 'wheel_size' times as many ticks as a slot of the level below it. When the
+    lowest level wraps around, the next due slot of the level above is cascaded down into it.
+    Scheduling and cancelling an item are O(1), and items are due at most one tick after their deadline.
+    """
+
+    def __init__(self, tick: float = 1.0, wheel_size: int = 64, levels: int = 4, start: float = 0):
+        """Instantiates a new instance of a DelayQueue.
+
+        :param tick: Optional. The resolution of the wheel, in the same unit as deadlines.
+        :param wheel_size: Optional. The number of slots per level. Must be a power of two.
+        :param levels: Optional. The number of levels.
+        :param start: Optional. The current time.
+        :exception: ValueError is raised if 'tick' is <= 0, 'wheel_size' is not a power of two > 1,
+            or 'levels' is < 1.
+
+        >>> my_queue = DelayQueue()
+        >>> my_queue
+        []
+        """
+        if tick <= 0:
+            raise ValueError("tick must be > 0")
+
+        if wheel_size < 2 or wheel_size & (wheel_size - 1):
+            raise ValueError("wheel_size must be a power of two > 1")
+
+        if levels < 1:
+            raise ValueError("levels must be > 0")
+
+        self._tick = tick
+        self._bits = wheel_size.bit_length() - 1
+        self._mask = wheel_size - 1
+        self._levels = levels
+        self._current = math.floor(start / tick)
+
+        # Slots are dicts used as insertion-ordered sets, so timers can be removed in O(1)
+        self._wheels = [[dict() for _ in range(wheel_size)] for _ in range(levels)]
+        self._level_sizes = [0] * levels
+        self._overflow = dict()
+        self._ready = dict()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        timers = list(self._ready)
+        timers.extend(self._overflow)
+        for wheel in self._wheels:
+            for slot in wheel:
+                timers.extend(slot)
+
+        timers.sort(key=lambda timer: timer._tick)
+
+        return str([timer.item for timer in timers])
+
+    @property
+    def size(self):
+        """Returns the number of scheduled items.
+
+        :return: The size.
+
+        >>> my_queue = DelayQueue()
+        >>> _ = my_queue.schedule('a', 5)
+        >>> my_queue.size
+        1
+        """
+        return self._size
+
+    def is_empty(self) -> bool:
+        """Returns True if no items are scheduled, otherwise False.
+
+        :return: A boolean indicating whether the queue is empty.
+
+        >>> my_queue = DelayQueue()
+        >>> my_queue.is_empty()
+        True
+        """
+        return self._size == 0
+
+    def schedule(self, item, deadline) -> Timer:
+        """Schedules an item to become available at the given deadline.
+
+        :param item: The item.
+        :param deadline: The time at which the item is due.
+        :return: A timer which can be used to cancel the item.
+
+        >>> my_queue = DelayQueue()
+        >>> _ = my_queue.schedule('b', 20)
+        >>> _ = my_queue.schedule('a', 10)
+        >>> my_queue
+        ['a', 'b']
+        """
+        timer = Timer(item, deadline)
+        timer._tick = math.ceil(deadline / self._tick)
+
+        self._place(timer)
+        self._size += 1
+
+        return timer
+
+    def cancel(self, timer: Timer) -> bool:
+        """Cancels a scheduled item.
+
+        :param timer: The timer returned when the item was scheduled.
+        :return: True if the item was cancelled, or False if it was already due or cancelled.
+
+        >>> my_queue = DelayQueue()
+        >>> timer = my_queue.schedule('a', 10)
+        >>> my_queue.cancel(timer), my_queue.cancel(timer), my_queue
+        (True, False, [])
+        """
+        if timer._slot is None:
+            return False
+
+        del timer._slot[timer]
+        if timer._level >= 0:
+            self._level_sizes[timer._level] -= 1
+
+        timer._slot = None
+        self._size -= 1
+
+        return True
+
+    def poll_expired(self, now) -> list:
+        """Advances the queue to the given time, and retrieves and removes every item which is due.
+
+        :param now: The current time.
+        :return: A list of the due items, in the order they became due.
+
+        >>> my_queue = DelayQueue(tick=0.5)
+        >>> _ = my_queue.schedule('a', 2)
+        >>> _ = my_queue.schedule('b', 1000)
+        >>> _ = my_queue.schedule('c', 1)
+        >>> my_queue.poll_expired(1.5), my_queue
+        (['c'], ['a', 'b'])
+
+        >>> my_queue.poll_expired(10000), my_queue
+        (['a', 'b'], [])
+        """
+        expired = []
+        self._collect(self._ready, expired)
+
+        target = math.floor(now / self._tick)
+        bits, mask, levels = self._bits, self._mask, self._levels
+        wheels, level_sizes = self._wheels, self._level_sizes
+
+        while self._current < target:
+            # Skip ahead over levels which are empty, rather than stepping one tick at a time
+            if self._size == len(self._overflow):
+                shift = levels * bits if self._overflow else None
+            else:
+                level = 0
+                while level_sizes[level] == 0:
+                    level += 1
+                shift = level * bits
+
+            if shift is None:
+                self._current = target
+                break
+
+            current = min(target, ((self._current >> shift) + 1) << shift) if shift else self._current + 1
+            self._current = current
+
+            # Cascade every level whose lower digits have wrapped around, highest first
+            if self._overflow and current & ((1 << (levels * bits)) - 1) == 0:
+                self._cascade(self._overflow, -1)
+
+            for level in range(levels - 1, 0, -1):
+                if current & ((1 << (level * bits)) - 1) == 0:
+                    slot = wheels[level][(current >> (level * bits)) & mask]
+                    if slot:
+                        self._cascade(slot, level)
+
+            self._collect(self._ready, expired)
+
+            slot = wheels[0][current & mask]
+            if slot:
+                level_sizes[0] -= len(slot)
+                self._collect(slot, expired)
+
+        return expired
+
+    def _cascade(self, slot: dict, level: int):
+        timers = list(slot)
+        slot.clear()
+
+        if level >= 0:
+            self._level_sizes[level] -= len(timers)
+
+        for timer in timers:
+            self._place(timer)
+
+    def _collect(self, slot: dict, expired: list):
+        for timer in slot:
+            timer._slot = None
+            expired.append(timer.item)
+
+        self._size -= len(slot)
+        slot.clear()
+
+    def _place(self, timer: Timer):
+        tick, current, bits = timer._tick, self._current, self._bits
+
+        if tick <= current:
+            timer._level = -1
+            slot = self._ready
+        else:
+            # The level is the lowest one above which the tick and the current tick agree
+            level = 0
+            while level < self._levels and (tick >> ((level + 1) * bits)) != (current >> ((level + 1) * bits)):
+                level += 1
+
+            if level == self._levels:
+                timer._level = -1
+                slot = self._overflow
+            else:
+                timer._level = level
+                slot = self._wheels[level][(tick >> (level * bits)) & self._mask]
+                self._level_sizes[level] += 1
+
+        slot[timer] = None
+        timer._slot = slot
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
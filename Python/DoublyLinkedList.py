@@ -21,7 +21,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-import collections
+import array
+import collections.abc
+
+from Queue import _as_view, _elements_of, _to_numpy
+from SinglyLinkedList import _buffer_elements, _dump, _load, _sort_nodes
 
 
 class Node:
@@ -30,6 +34,8 @@ class Node:
 
     There are no restrictions on what type of data can be contained within the node.
     """
+    __slots__ = ('data', 'next', 'prev')
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -48,12 +54,28 @@ class Node:
 class DoublyLinkedList:
     """A list of doubly linked nodes containing data.
     i.e. NULL <- Node1 <-> Node2 -> NULL
+
+    Optionally, up to 'pool_size' removed nodes are kept in a free-list and reused for inserted data,
+    which saves allocating a node on every insert for queue-like workloads.
+
+    Optionally, an 'indexed' list keeps a map from each piece of data to the nodes containing it, which makes
+    'in', count and remove_item O(1) on average. The data must then be hashable.
     """
 
-    def __init__(self, elements=None):
+    def __new__(cls, elements=None, pool_size: int = 0, indexed: bool = False, typecode=None):
+        if cls is DoublyLinkedList and typecode is not None:
+            cls = ObjectDoublyLinkedList if typecode == 'O' else TypedDoublyLinkedList
+
+        return super().__new__(cls)
+
+    def __init__(self, elements=None, pool_size: int = 0, indexed: bool = False, typecode=None):
         """Instantiates a new instance of a DoublyLinkedList.
 
         :param elements: Optional. The elements initialize with.
+        :param pool_size: Optional. The maximum number of removed nodes to keep for reuse.
+        :param indexed: Optional. Whether to keep a map from data to nodes for fast lookups.
+        :param typecode: Optional. An array typecode. If given, a compact TypedDoublyLinkedList is created instead,
+            or an ObjectDoublyLinkedList for 'O'.
         :exception: TypeError is raised if 'elements' is not iterable.
 
         >>> my_list = DoublyLinkedList()
@@ -68,6 +90,11 @@ class DoublyLinkedList:
         self._tail = None
         self._size = 0
         self._iter_node = None
+        self._version = 0
+        self._pool = None
+        self._pool_size = pool_size
+        self._pool_count = 0
+        self._lookup = {} if indexed else None
 
         if elements is not None:
             self.extend(elements)
@@ -89,10 +116,14 @@ class DoublyLinkedList:
         return new_list
 
     def __contains__(self, item) -> bool:
+        if self._lookup is not None:
+            return item in self._lookup
+
         node = self._head
         while node is not None:
             if node.data == item:
                 return True
+            node = node.next
 
         return False
 
@@ -100,38 +131,22 @@ class DoublyLinkedList:
         self.remove_item(key)
 
     def __eq__(self, other):
-        if isinstance(other, DoublyLinkedList):
-            if self.size != other.size:
-                return False
-            else:
-                self_node = self._head
-                other_node = other._head
-
-                while self_node is not None and other_node is not None:
-                    if self_node.data != other_node.data:
-                        return False
-                    self_node = self_node.next
-                    other_node = other_node.next
-
-                return True
-        elif isinstance(other, list):
+        if isinstance(other, (DoublyLinkedList, list)):
             if self.size != len(other):
                 return False
 
-            self_node = self._head
-            i = 0
-
-            while self_node is not None:
-                if self_node.data != other[i]:
+            for self_data, other_data in zip(self, other):
+                if self_data != other_data:
                     return False
-                self_node = self_node.next
-                i += 1
 
             return True
         else:
             return NotImplemented
 
-    def __getitem__(self, index: int):
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return View(self, index)
+
         return self.get(index)
 
     def __iadd__(self, other):
@@ -141,7 +156,12 @@ class DoublyLinkedList:
         return self._size
 
     def __iter__(self):
-        return self
+        node = self._head
+        while node is not None:
+            # Step ahead first, so the current element can be removed while iterating
+            next_node = node.next
+            yield node.data
+            node = next_node
 
     def __next__(self):
         if self._head is None:
@@ -157,6 +177,10 @@ class DoublyLinkedList:
 
         return self._iter_node.data
 
+    def __reduce__(self):
+        # Pickle the elements as a flat list, rather than following each link recursively
+        return self.__class__, (list(self), self._pool_size, self._lookup is not None)
+
     def __repr__(self):
         s = []
         node = self._head
@@ -213,16 +237,59 @@ class DoublyLinkedList:
         [3, 4, 1]
         """
         self._size += 1
+        self._version += 1
 
         if self._head is None:
-            node = Node(data)
+            node = self._acquire(data)
             self._head = node
             self._tail = node
         else:
-            self._tail.next = Node(data)
+            self._tail.next = self._acquire(data)
             self._tail.next.prev = self._tail
             self._tail = self._tail.next
 
+    def clear(self):
+        """Removes all the elements from the list.
+        The links between the nodes are broken as they're removed, so reference counting frees them straight away,
+        rather than leaving reference cycles for the garbage collector.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3])
+        >>> my_list.clear()
+        >>> my_list
+        []
+        """
+        node = self._head
+        while node is not None:
+            next_node = node.next
+            node.prev = None
+            node.next = None
+            node = next_node
+
+        self._head = None
+        self._tail = None
+        self._size = 0
+        self._iter_node = None
+        self._version += 1
+
+        if self._lookup is not None:
+            self._lookup = {}
+
+    def concat_move(self, other):
+        """Moves all the elements of another list onto the end of the list, leaving the other list empty.
+        The nodes are relinked rather than copied, so this is O(1).
+
+        :param other: The DoublyLinkedList to move the elements from.
+        :exception: TypeError is raised if 'other' is not a DoublyLinkedList.
+        :exception: ValueError is raised if 'other' is the list itself.
+
+        >>> my_list1 = DoublyLinkedList([1, 2])
+        >>> my_list2 = DoublyLinkedList([3, 4])
+        >>> my_list1.concat_move(my_list2)
+        >>> my_list1, my_list2
+        ([1, 2, 3, 4], [])
+        """
+        self.splice(other, self._size)
+
     def copy(self):
         """Returns a copy of the list.
 
@@ -236,7 +303,7 @@ class DoublyLinkedList:
         >>> my_list.copy()
         [5, 7, -1]
         """
-        list_copy = DoublyLinkedList()
+        list_copy = DoublyLinkedList(pool_size=self._pool_size, indexed=self._lookup is not None)
 
         node = self._head
         while node is not None:
@@ -245,10 +312,38 @@ class DoublyLinkedList:
 
         return list_copy
 
+    def count(self, data) -> int:
+        """Returns the number of occurrences of the given data.
+
+        :param data: The data to count.
+        :return: The number of occurrences.
+
+        >>> my_list = DoublyLinkedList([3, 4, 3])
+        >>> my_list.count(3)
+        2
+
+        >>> my_list = DoublyLinkedList([3, 4, 3], indexed=True)
+        >>> my_list.count(3), my_list.count(5)
+        (2, 0)
+        """
+        if self._lookup is not None:
+            return len(self._lookup.get(data, ()))
+
+        count = 0
+
+        node = self._head
+        while node is not None:
+            if node.data == data:
+                count += 1
+            node = node.next
+
+        return count
+
     def extend(self, other):
         """Extends the list with the elements of another.
 
-         :param other: A list or DoublyLinkedList to extend the list with.
+         :param other: A list, DoublyLinkedList or ndarray to extend the list with. An ndarray's elements are read
+            as Python objects, in C order.
          :exception: TypeError is raised if 'other' is not iterable.
 
          >>> my_list = DoublyLinkedList([1])
@@ -262,36 +357,85 @@ class DoublyLinkedList:
          >>> my_list1
          [1, 2, 3, 4, 5]
          """
-        if isinstance(other, collections.Iterable):
-            if self._head is None:
-                added_head = False
-                node = None
-
-                for data in other:
-                    if not added_head:
-                        self._head = Node(data)
-                        node = self._head
-                        added_head = True
+        if isinstance(other, collections.abc.Iterable):
+            # Without a pool or an index, nodes can be created directly
+            acquire = Node if self._pool is None and self._lookup is None else self._acquire
+            tail = self._tail
+            count = 0
+
+            try:
+                for data in _elements_of(other):
+                    node = acquire(data)
+                    if tail is None:
+                        self._head = node
                     else:
-                        node.next = Node(data)
-                        node.next.prev = node
-                        node = node.next
-                    self._size += 1
-
-                self._tail = node
-            else:
-                tail = self._tail
-
-                for data in other:
-                    tail.next = Node(data)
-                    tail.next.prev = tail
-                    tail = tail.next
-                    self._size += 1
-
+                        tail.next = node
+                        node.prev = tail
+                    tail = node
+                    count += 1
+            finally:
                 self._tail = tail
+                self._size += count
+                self._version += 1
         else:
             raise TypeError("other must be iterable")
 
+    @classmethod
+    def from_buffer(cls, buffer, typecode=None):
+        """Returns a new list of the elements of a buffer-protocol object, e.g. an array or bytes.
+
+        :param buffer: The buffer-protocol object.
+        :param typecode: Optional. An array typecode. If given, a TypedDoublyLinkedList is created, copying the
+            buffer directly into its data column.
+        :return: The list.
+        :exception: TypeError is raised if 'buffer' doesn't support the buffer protocol.
+
+        >>> DoublyLinkedList.from_buffer(array.array('q', [1, 2, 3]))
+        [1, 2, 3]
+
+        >>> DoublyLinkedList.from_buffer(array.array('d', [1, 2, 3]), typecode='d').typecode
+        'd'
+        """
+        if typecode is not None:
+            return cls(memoryview(buffer), typecode=typecode)
+
+        return cls(_buffer_elements(buffer))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Returns a new list of the elements serialized by to_bytes().
+        Untyped elements are unpickled, which can run arbitrary code, so the data must come from a trusted source.
+
+        :param data: The bytes, or any bytes-like object.
+        :return: The list.
+        :exception: ValueError is raised if the data isn't a serialized list, or is truncated.
+
+        >>> DoublyLinkedList.from_bytes(DoublyLinkedList([1, 'a', None]).to_bytes())
+        [1, 'a', None]
+
+        >>> DoublyLinkedList.from_bytes(DoublyLinkedList([1, 2], typecode='q').to_bytes()).typecode
+        'q'
+        """
+        typecode, elements = _load(data)
+
+        return cls(elements, typecode=typecode)
+
+    @classmethod
+    def from_numpy(cls, arr, typecode=None):
+        """Returns a new list of the elements of an ndarray, in C order.
+        The list is built in one pass over the buffer, without an intermediate list.
+
+        :param arr: The ndarray, or any buffer-protocol object or iterable.
+        :param typecode: Optional. An array typecode. If given, a TypedDoublyLinkedList is created, copying the
+            buffer directly into its data column when the item types match.
+        :return: The list.
+        :exception: TypeError is raised if an element doesn't fit the typecode.
+
+        >>> DoublyLinkedList.from_numpy(array.array('q', [1, 2, 3]), typecode='q').to_array()
+        array('q', [1, 2, 3])
+        """
+        return cls(arr, typecode=typecode)
+
     def get(self, index: int):
         """Gets the data at the specified index.
 
@@ -315,16 +459,52 @@ class DoublyLinkedList:
         if index < 0:
             index = self.size + index
 
-        if index < self.size // 2:  # closer to head, start search from there
-            node = self._head
-            for i in range(index):
-                node = node.next
-        else:  # otherwise, start from tail
-            node = self._tail
-            for i in range(self.size - index - 1):
-                node = node.prev
+        return self._node_at(index).data
 
-        return node.data
+    def index_of(self, data) -> int:
+        """Returns the index of the first occurrence of the given data.
+        In an indexed list, data that occurs once is found by walking to the nearer end of the list from its node.
+
+        :param data: The data to find.
+        :return: The index.
+        :exception: ValueError is raised if item is not found.
+
+        >>> my_list = DoublyLinkedList([4, 7, 2, 7])
+        >>> my_list.index_of(7)
+        1
+
+        >>> my_list = DoublyLinkedList([4, 7, 2, 7], indexed=True)
+        >>> my_list.index_of(2), my_list.index_of(7)
+        (2, 1)
+        """
+        if self._lookup is not None:
+            nodes = self._lookup.get(data)
+            if nodes is None:
+                raise ValueError("item not found")
+
+            if len(nodes) == 1:
+                prev_node = next_node = next(iter(nodes))
+                steps = 0
+                while True:
+                    prev_node = prev_node.prev
+                    if prev_node is None:
+                        return steps
+                    next_node = next_node.next
+                    if next_node is None:
+                        return self._size - steps - 1
+                    steps += 1
+
+        index = 0
+
+        node = self._first(data)
+        if node is None:
+            raise ValueError("item not found")
+
+        while node.prev is not None:
+            node = node.prev
+            index += 1
+
+        return index
 
     def insert(self, index: int, data):
         """Inserts the data at the given element.
@@ -349,15 +529,16 @@ class DoublyLinkedList:
             index = self.size + index
 
         if self._head is None:
-            self._head = Node(data)
+            self._head = self._acquire(data)
             self._tail = self._head
             self._size += 1
+            self._version += 1
         elif index == 0:
             self.prepend(data)
         elif index == self._size:
             self.append(data)
         else:
-            new_node = Node(data)
+            new_node = self._acquire(data)
 
             if index < self._size // 2:  # closer to head, start search from there
                 node = self._head
@@ -378,6 +559,7 @@ class DoublyLinkedList:
                 self._head = new_node
 
             self._size += 1
+            self._version += 1
 
     def is_empty(self):
         """Returns True if the list is empty, otherwise False.
@@ -417,8 +599,9 @@ class DoublyLinkedList:
             self._tail = None
             self._iter_node = None
             self._size -= 1
+            self._version += 1
 
-            return node.data
+            return self._release(node)
 
         head = self._head
         self._head = head.next
@@ -429,8 +612,9 @@ class DoublyLinkedList:
             self._iter_node = self._head
 
         self._size -= 1
+        self._version += 1
 
-        return head.data
+        return self._release(head)
 
     def pop_last(self):
         """Removes and returns the data from the beginning of the list.
@@ -455,8 +639,9 @@ class DoublyLinkedList:
             self._tail = None
             self._iter_node = None
             self._size -= 1
+            self._version += 1
 
-            return node.data
+            return self._release(node)
 
         tail = self._tail
         self._tail = tail.prev
@@ -467,8 +652,9 @@ class DoublyLinkedList:
             self._iter_node = None
 
         self._size -= 1
+        self._version += 1
 
-        return tail.data
+        return self._release(tail)
 
     def prepend(self, data):
         """Prepends the data to the end of the list.
@@ -486,15 +672,16 @@ class DoublyLinkedList:
          [1, 3, 4]
          """
         self._size += 1
+        self._version += 1
 
         if self._head is None:
-            node = Node(data)
+            node = self._acquire(data)
             self._head = node
             self._tail = node
         else:
             head = self._head
 
-            self._head = Node(data)
+            self._head = self._acquire(data)
             self._head.next = head
             self._head.next.prev = self._head
 
@@ -520,44 +707,31 @@ class DoublyLinkedList:
             index = self.size + index
 
         if index == 0:
-            head = self._head
-            self._head = self._head.next
-
-            # Update iterable ptr
-            if self._iter_node == head:
-                self._iter_node = self._head
-
-            self._size -= 1
-            return head.data
-        else:
-            if index < self.size // 2:  # closer to head, start search from there
-                node = self._head
-                for i in range(index):
-                    node = node.next
-
-            else:  # otherwise, start from tail
-                node = self._tail
-                for i in range(self.size - index - 1):
-                    node = node.prev
+            return self.pop()
 
-            if node.prev is not None:
-                node.prev = node.next
+        if index == self._size - 1:
+            return self.pop_last()
 
-            if node.next is not None:
-                node.next = node.prev
+        if index < self.size // 2:  # closer to head, start search from there
+            node = self._head
+            for i in range(index):
+                node = node.next
 
-            if node is self._head:
-                self._head = node.next
+        else:  # otherwise, start from tail
+            node = self._tail
+            for i in range(self.size - index - 1):
+                node = node.prev
 
-            if node is self._tail:
-                self._tail = node.prev
+        node.prev.next = node.next
+        node.next.prev = node.prev
 
-            # Update iterable ptr
-            if self._iter_node == node:
-                self._iter_node = node.next
+        # Update iterable ptr
+        if self._iter_node == node:
+            self._iter_node = node.next
 
-            self._size -= 1
-            return node.data
+        self._size -= 1
+        self._version += 1
+        return self._release(node)
 
     def remove_item(self, data):
         """Removes the first occurrence of the given data.
@@ -574,33 +748,17 @@ class DoublyLinkedList:
          >>> my_list.remove_item(3)
          >>> my_list
          [4, 3]
-         """
-        next_node = self._head
-
-        while next_node is not None:
-            if next_node.data == data:
-                if next_node.prev is not None:
-                    next_node.prev.next = next_node.next
-
-                if next_node.next is not None:
-                    next_node.next.prev = next_node.prev
-
-                if next_node == self._head:
-                    self._head = next_node.next
-
-                if next_node == self._tail:
-                    self._tail = next_node.prev
-
-                # Update iterable ptr
-                if self._iter_node == next_node:
-                    self._iter_node = next_node.next
-
-                self._size -= 1
-                return
 
-            next_node = next_node.next
+         >>> my_list = DoublyLinkedList([3, 4, 3], indexed=True)
+         >>> my_list.remove_item(4)
+         >>> my_list, 4 in my_list
+         ([3, 3], False)
+         """
+        node = self._first(data)
+        if node is None:
+            raise ValueError("item not found")
 
-        raise ValueError("item not found")
+        self._unlink(node)
 
     def reverse(self):
         """Reverses the list.
@@ -616,6 +774,1353 @@ class DoublyLinkedList:
             node = node.prev
 
         self._head, self._tail = self._tail, self._head
+        self._version += 1
+
+    def sort(self, key=None, reverse: bool = False):
+        """Sorts the list in place by relinking its nodes. The sort is stable, and needs no extra memory.
+        Runs of elements already in order are found and kept, so a nearly sorted list sorts in close to linear time.
+
+        :param key: Optional. A function extracting the value to compare from an element. Called on every comparison.
+        :param reverse: Optional. Whether to sort in descending order.
+
+        >>> my_list = DoublyLinkedList([3, 1, 2])
+        >>> my_list.sort()
+        >>> my_list
+        [1, 2, 3]
+
+        >>> my_list = DoublyLinkedList(['bb', 'a', 'cc', 'd'])
+        >>> my_list.sort(key=len, reverse=True)
+        >>> my_list
+        ['bb', 'cc', 'a', 'd']
+        """
+        self._iter_node = None
+        self._version += 1
+
+        if self._size > 1:
+            try:
+                _sort_nodes(self, key, reverse)
+            finally:
+                # Only the 'next' links are sorted, so restore the 'prev' links to match
+                prev_node = None
+                node = self._head
+                while node is not None:
+                    node.prev = prev_node
+                    prev_node = node
+                    node = node.next
+
+    def splice(self, other, at: int):
+        """Moves all the elements of another list into the list before the given index, leaving the other list empty.
+        The nodes are relinked rather than copied, so this is O(1) once the index is found from the nearer end.
+        If the list is indexed, the elements of the other list are added to its index.
+
+        :param other: The DoublyLinkedList to move the elements from.
+        :param at: The index to move the elements to.
+        :exception: IndexError is raised if 'at' is out of bounds.
+        :exception: TypeError is raised if 'other' is not a DoublyLinkedList.
+        :exception: ValueError is raised if 'other' is the list itself.
+
+        >>> my_list1 = DoublyLinkedList([1, 4])
+        >>> my_list2 = DoublyLinkedList([2, 3])
+        >>> my_list1.splice(my_list2, 1)
+        >>> my_list1, my_list2
+        ([1, 2, 3, 4], [])
+        """
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError("other must be a DoublyLinkedList")
+
+        if other is self:
+            raise ValueError("cannot splice a list into itself")
+
+        if at < -self.size or at > self.size:
+            raise IndexError("index is out of range")
+
+        if at < 0:
+            at = self.size + at
+
+        if isinstance(other, TypedDoublyLinkedList):
+            # A typed list has no nodes to relink, so its elements are moved into new nodes
+            other = DoublyLinkedList(other.split_at(0))
+
+        if other._head is None:
+            return
+
+        head, tail, size = other._head, other._tail, other._size
+        self._take(other)
+
+        next_node = self._node_at(at)
+        prev_node = self._tail if next_node is None else next_node.prev
+
+        head.prev = prev_node
+        if prev_node is None:
+            self._head = head
+        else:
+            prev_node.next = head
+
+        tail.next = next_node
+        if next_node is None:
+            self._tail = tail
+        else:
+            next_node.prev = tail
+
+        self._size += size
+        self._version += 1
+
+    def split_at(self, index: int):
+        """Splits the list in two, keeping the elements before the index and returning a list of the rest.
+        The nodes are relinked rather than copied, so this is O(1) once the index is found from the nearer end.
+        If the list is indexed, the index entries of the moved elements are moved too.
+
+        :param index: The index of the first element to move to the new list. May be the size of the list.
+        :return: A list of the elements from the index onwards.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3, 4])
+        >>> my_list.split_at(1), my_list
+        ([2, 3, 4], [1])
+        """
+        if index < -self.size or index > self.size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index = self.size + index
+
+        new_list = DoublyLinkedList(pool_size=self._pool_size)
+
+        node = self._node_at(index)
+        if node is None:
+            new_list._lookup = None if self._lookup is None else {}
+            return new_list
+
+        new_list._head = node
+        new_list._tail = self._tail
+        new_list._size = self._size - index
+
+        self._tail = node.prev
+        if node.prev is None:
+            self._head = None
+        else:
+            node.prev.next = None
+        node.prev = None
+
+        self._size = index
+        self._iter_node = None
+        self._version += 1
+
+        if self._lookup is not None:
+            if self._head is None:
+                new_list._lookup, self._lookup = self._lookup, {}
+            else:
+                new_list._lookup = {}
+                while node is not None:
+                    self._forget(node)
+                    new_list._lookup.setdefault(node.data, {})[node] = None
+                    node = node.next
+
+        return new_list
+
+    def to_bytes(self) -> bytes:
+        """Returns the list serialized in a compact binary form, which from_bytes() reads back.
+        The elements are pickled in chunks, so they must support pickling.
+
+        :return: The bytes.
+
+        >>> len(DoublyLinkedList([1, 2, 3]).to_bytes()) < 64
+        True
+        """
+        return b''.join(_dump(self, self._size))
+
+    def to_numpy(self, dtype=None):
+        """Returns an ndarray of the elements.
+        Given a dtype, the elements are written straight into the ndarray in one pass.
+
+        :param dtype: Optional. The dtype of the ndarray. Without it, numpy infers one from a temporary list.
+        :return: The ndarray.
+        :exception: ImportError is raised if numpy isn't installed.
+
+        >>> from Queue import numpy
+
+        >>> numpy is None or DoublyLinkedList([1, 2, 3]).to_numpy('q').tolist() == [1, 2, 3]
+        True
+        """
+        return _to_numpy(self, self._size, dtype)
+
+    def cursor(self, index: int = 0):
+        """Returns a cursor positioned at the given index, for editing the list as it is walked.
+
+        :param index: Optional. The index to start at. May be the size of the list, i.e. past the end.
+        :return: The cursor.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3, 4])
+        >>> cursor = my_list.cursor()
+        >>> while not cursor.at_end():
+        ...     if cursor.data % 2 == 0:
+        ...         cursor.insert_before(cursor.remove_here() * 10)
+        ...     else:
+        ...         cursor.move(1)
+        >>> my_list
+        [1, 20, 3, 40]
+        """
+        return Cursor(self, index)
+
+    def _acquire(self, data) -> Node:
+        """Returns a node containing the data, reusing a pooled node if there is one."""
+        node = self._pool
+        if node is None:
+            node = Node(data)
+        else:
+            self._pool = node.next
+            self._pool_count -= 1
+
+            node.data = data
+            node.next = None
+
+        if self._lookup is not None:
+            self._lookup.setdefault(data, {})[node] = None
+
+        return node
+
+    def _release(self, node: Node):
+        """Returns the data of a removed node, and keeps the node for reuse if the pool isn't full."""
+        data = node.data
+
+        if self._lookup is not None:
+            self._forget(node)
+
+        if self._pool_count < self._pool_size:
+            node.data = None
+            node.prev = None
+            node.next = self._pool
+            self._pool = node
+            self._pool_count += 1
+
+        return data
+
+    def _node_at(self, index: int) -> Node:
+        """Returns the node at a non-negative index, walking from the nearer end, or None if the index is the size."""
+        if index == self.size:
+            return None
+
+        if index < self.size // 2:  # closer to head, start search from there
+            node = self._head
+            for i in range(index):
+                node = node.next
+        else:  # otherwise, start from tail
+            node = self._tail
+            for i in range(self.size - index - 1):
+                node = node.prev
+
+        return node
+
+    def _step(self, node: Node, k: int) -> Node:
+        """Returns the node k places after the given node, or before it if k is negative.
+        A node of None is the position past the end of the list.
+        """
+        if k < 0 and node is None:
+            node = self._tail
+            k += 1
+
+        for i in range(k):
+            node = node.next
+        for i in range(-k):
+            node = node.prev
+
+        return node
+
+    def _data_of(self, node: Node):
+        """Returns the data of a node in the list."""
+        return node.data
+
+    def _like(self):
+        """Returns a new, empty list with the same settings as the list."""
+        return DoublyLinkedList(pool_size=self._pool_size, indexed=self._lookup is not None)
+
+    def _take(self, other):
+        """Empties another list whose nodes are about to be linked into the list, taking their lookup entries."""
+        if self._lookup is not None:
+            if not self._lookup and other._lookup is not None:
+                self._lookup, other._lookup = other._lookup, self._lookup
+            else:
+                node = other._head
+                while node is not None:
+                    self._lookup.setdefault(node.data, {})[node] = None
+                    node = node.next
+
+        if other._lookup is not None:
+            other._lookup = {}
+
+        other._head = None
+        other._tail = None
+        other._size = 0
+        other._iter_node = None
+        other._version += 1
+
+    def _assign(self, node: Node, data):
+        """Replaces the data of a node in the list."""
+        if self._lookup is not None:
+            self._forget(node)
+            self._lookup.setdefault(data, {})[node] = None
+
+        node.data = data
+
+    def _first(self, data) -> Node:
+        """Returns the first node containing the data, or None if there isn't one."""
+        if self._lookup is None:
+            node = self._head
+            while node is not None:
+                if node.data == data:
+                    return node
+                node = node.next
+            return None
+
+        nodes = self._lookup.get(data)
+        if nodes is None:
+            return None
+
+        if len(nodes) == 1:
+            return next(iter(nodes))
+
+        # Several nodes contain the data, so find the one nearest the head
+        node = self._head
+        while node not in nodes:
+            node = node.next
+        return node
+
+    def _forget(self, node: Node):
+        """Removes a node from the lookup map."""
+        nodes = self._lookup[node.data]
+        del nodes[node]
+        if not nodes:
+            del self._lookup[node.data]
+
+    def _link_before(self, node: Node, data):
+        """Links a new node containing the data before the given node, or at the end if the node is None."""
+        new_node = self._acquire(data)
+
+        if node is None:
+            new_node.prev = self._tail
+            if self._tail is None:
+                self._head = new_node
+            else:
+                self._tail.next = new_node
+            self._tail = new_node
+        else:
+            new_node.prev = node.prev
+            new_node.next = node
+            if node.prev is None:
+                self._head = new_node
+            else:
+                node.prev.next = new_node
+            node.prev = new_node
+
+        self._size += 1
+        self._version += 1
+
+    def _unlink(self, node: Node):
+        """Unlinks a node from the list, and returns its data."""
+        if node.prev is None:
+            self._head = node.next
+        else:
+            node.prev.next = node.next
+
+        if node.next is None:
+            self._tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        # Update iterable ptr
+        if self._iter_node == node:
+            self._iter_node = node.next
+
+        self._size -= 1
+        self._version += 1
+
+        return self._release(node)
+
+
+class TypedDoublyLinkedList(DoublyLinkedList):
+    """A doubly linked list of numbers, stored as a struct of arrays rather than as a node object per element.
+
+    Each element has a slot in three parallel array.array columns: its data, in the given typecode, and the slots of
+    the previous and next elements, with -1 for none. Removed slots are kept in a free-list and reused. An element
+    costs the item size of the typecode plus 16 bytes, instead of a node object and a boxed number.
+
+    While the slots are in list order, e.g. after compact(), get, count, 'in', index_of and to_array run on the
+    columns directly rather than following the links.
+    """
+
+    def __init__(self, elements=None, pool_size: int = 0, indexed: bool = False, typecode=None):
+        """Instantiates a new instance of a TypedDoublyLinkedList.
+
+        :param elements: Optional. The elements initialize with.
+        :param pool_size: Ignored, as removed slots are always reused.
+        :param indexed: Not supported, as lookups can be done on the columns directly.
+        :param typecode: The array typecode of the elements, e.g. 'q' or 'd'.
+        :exception: TypeError is raised if 'elements' is not iterable, or an element doesn't fit the typecode.
+        :exception: ValueError is raised if 'typecode' is not a valid typecode, or 'indexed' is given.
+
+        >>> my_list = DoublyLinkedList(typecode='q')
+        >>> my_list
+        []
+
+        >>> my_list = DoublyLinkedList([3, 4, 5], typecode='q')
+        >>> my_list
+        [3, 4, 5]
+        """
+        if typecode is None:
+            raise ValueError("typecode is required")
+
+        if indexed:
+            raise ValueError("a typed list can't be indexed")
+
+        self._typecode = typecode
+        self._data = self._column()
+        self._prev = array.array('q')
+        self._next = array.array('q')
+        self._head = -1
+        self._tail = -1
+        self._free = -1
+        self._size = 0
+        self._sequential = True
+        self._iter_node = None
+        self._version = 0
+        self._pool_size = 0
+        self._lookup = None
+
+        if elements is not None:
+            self.extend(elements)
+
+    def __contains__(self, item) -> bool:
+        if len(self._data) == self._size:
+            return item in self._data
+
+        return any(data == item for data in self)
+
+    def __iter__(self):
+        slot = self._head
+        while slot >= 0:
+            # Step ahead first, so the current element can be removed while iterating
+            next_slot = self._next[slot]
+            yield self._data[slot]
+            slot = next_slot
+
+    def __next__(self):
+        if self._size == 0:
+            raise StopIteration()
+
+        if self._iter_node is None:
+            self._iter_node = self._head
+        else:
+            self._iter_node = self._next[self._iter_node]
+
+            if self._iter_node < 0:
+                self._iter_node = None
+                raise StopIteration()
+
+        return self._data[self._iter_node]
+
+    def __reduce__(self):
+        return DoublyLinkedList, (self.to_array(), 0, False, self.typecode)
+
+    def __repr__(self):
+        return str(list(self))
+
+    def __reversed__(self):
+        slot = self._tail
+        while slot >= 0:
+            prev_slot = self._prev[slot]
+            yield self._data[slot]
+            slot = prev_slot
+
+    @property
+    def typecode(self):
+        return self._typecode
+
+    def append(self, data):
+        """Appends the data to the end of the list.
+
+        :param data: The data to append.
+        :exception: TypeError is raised if the data doesn't fit the typecode.
+
+        >>> my_list = DoublyLinkedList([3, 4], typecode='q')
+        >>> my_list.append(1)
+        >>> my_list
+        [3, 4, 1]
+        """
+        self._link_before(None, data)
+
+    def clear(self):
+        """Removes all the elements from the list, freeing the columns.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3], typecode='q')
+        >>> my_list.clear()
+        >>> my_list
+        []
+        """
+        self._rebuild(self._column())
+        self._version += 1
+
+    def compact(self):
+        """Moves the elements into slots in list order, and frees the space of removed slots.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3], typecode='q')
+        >>> my_list.reverse()
+        >>> my_list.compact()
+        >>> my_list, my_list.to_array()
+        ([3, 2, 1], array('q', [3, 2, 1]))
+        """
+        self._rebuild(self.to_array())
+        self._version += 1
+
+    def copy(self):
+        """Returns a copy of the list.
+
+        :return: A copy of the list.
+
+        >>> my_list = DoublyLinkedList([5, 7, -1], typecode='q')
+        >>> my_list.copy()
+        [5, 7, -1]
+        """
+        list_copy = self._like()
+
+        list_copy._data = self._data[:]
+        list_copy._prev = self._prev[:]
+        list_copy._next = self._next[:]
+        list_copy._head = self._head
+        list_copy._tail = self._tail
+        list_copy._free = self._free
+        list_copy._size = self._size
+        list_copy._sequential = self._sequential
+
+        return list_copy
+
+    def count(self, data) -> int:
+        """Returns the number of occurrences of the given data.
+
+        :param data: The data to count.
+        :return: The number of occurrences.
+
+        >>> my_list = DoublyLinkedList([3, 4, 3], typecode='q')
+        >>> my_list.count(3)
+        2
+        """
+        if len(self._data) == self._size:
+            return self._data.count(data)
+
+        return sum(1 for item in self if item == data)
+
+    def extend(self, other):
+        """Extends the list with the elements of another.
+
+        :param other: An array, buffer-protocol object or iterable to extend the list with.
+        :exception: TypeError is raised if 'other' is not iterable, or an element doesn't fit the typecode.
+
+        >>> my_list = DoublyLinkedList([1], typecode='q')
+        >>> my_list.extend(array.array('q', [2, 3, 4]))
+        >>> my_list
+        [1, 2, 3, 4]
+        """
+        if other is self:
+            other = self.to_array()
+
+        if isinstance(other, collections.abc.Iterable):
+            self._link_many(None, self._convert(other))
+            self._version += 1
+        else:
+            raise TypeError("other must be iterable")
+
+    def get(self, index: int):
+        """Gets the data at the specified index.
+
+        :param index: The index to retrieve.
+        :return: The data.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = DoublyLinkedList([5, 2, -1, 2], typecode='q')
+        >>> my_list.get(-2)
+        -1
+        """
+        if index < -self.size or index >= self.size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index = self.size + index
+
+        return self._data[self._node_at(index)]
+
+    def index_of(self, data) -> int:
+        """Returns the index of the first occurrence of the given data.
+
+        :param data: The data to find.
+        :return: The index.
+        :exception: ValueError is raised if item is not found.
+
+        >>> my_list = DoublyLinkedList([4, 7, 2, 7], typecode='q')
+        >>> my_list.index_of(7)
+        1
+        """
+        if self._sequential:
+            try:
+                return self._data.index(data)
+            except ValueError:
+                raise ValueError("item not found") from None
+
+        for index, item in enumerate(self):
+            if item == data:
+                return index
+
+        raise ValueError("item not found")
+
+    def insert(self, index: int, data):
+        """Inserts the data at the given element.
+        If an element exists at the given position, the element is inserted before it.
+
+        :param index: The index to insert at.
+        :param data: The data to insert.
+        :exception: IndexError is raised if index is out of bounds.
+        :exception: TypeError is raised if the data doesn't fit the typecode.
+
+        >>> my_list = DoublyLinkedList([1, 3], typecode='q')
+        >>> my_list.insert(1, 2)
+        >>> my_list
+        [1, 2, 3]
+        """
+        if index < -self.size or index > self.size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index = self.size + index
+
+        self._link_before(self._node_at(index), data)
+
+    def pop(self):
+        """Removes and returns the data from the beginning of the list.
+
+        :return: The data.
+        :exception: IndexError is raised if list is empty.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3], typecode='q')
+        >>> my_list.pop()
+        1
+        """
+        if self._size == 0:
+            raise IndexError("list is empty")
+
+        return self._unlink(self._head)
+
+    def pop_last(self):
+        """Removes and returns the data from the end of the list.
+
+        :return: The data.
+        :exception: IndexError is raised if list is empty.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3], typecode='q')
+        >>> my_list.pop_last()
+        3
+        """
+        if self._size == 0:
+            raise IndexError("list is empty")
+
+        return self._unlink(self._tail)
+
+    def prepend(self, data):
+        """Prepends the data to the beginning of the list.
+
+        :param data: The data to prepend.
+        :exception: TypeError is raised if the data doesn't fit the typecode.
+
+        >>> my_list = DoublyLinkedList([3, 4], typecode='q')
+        >>> my_list.prepend(1)
+        >>> my_list
+        [1, 3, 4]
+        """
+        self._link_before(self._node_at(0), data)
+
+    def remove(self, index: int):
+        """Removes and returns the data at the given index.
+
+        :param index: The index to remove.
+        :return: The data at the index.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = DoublyLinkedList([4, 7, 2], typecode='q')
+        >>> my_list.remove(1)
+        7
+        """
+        if index < -self.size or index >= self.size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index = self.size + index
+
+        return self._unlink(self._node_at(index))
+
+    def remove_item(self, data):
+        """Removes the first occurrence of the given data.
+
+        :param data: The data to remove.
+        :exception: ValueError is raised if item is not found.
+
+        >>> my_list = DoublyLinkedList([3, 4, 3], typecode='q')
+        >>> my_list.remove_item(3)
+        >>> my_list
+        [4, 3]
+        """
+        slot = self._head
+        while slot >= 0:
+            if self._data[slot] == data:
+                self._unlink(slot)
+                return
+            slot = self._next[slot]
+
+        raise ValueError("item not found")
+
+    def reverse(self):
+        """Reverses the list. Only the link columns are swapped, so this is O(1).
+
+        >>> my_list = DoublyLinkedList([1, 2, 3], typecode='q')
+        >>> my_list.reverse()
+        >>> my_list
+        [3, 2, 1]
+        """
+        self._prev, self._next = self._next, self._prev
+        self._head, self._tail = self._tail, self._head
+
+        self._sequential = self._sequential and self._size < 2
+        self._version += 1
+
+    def sort(self, key=None, reverse: bool = False):
+        """Sorts the list, keeping equal elements in their original order.
+        The elements are sorted as an array and laid out again in list order, as with compact().
+
+        :param key: Optional. A function extracting the value to compare from an element.
+        :param reverse: Optional. Whether to sort in descending order.
+
+        >>> my_list = DoublyLinkedList([3, 1, 2], typecode='q')
+        >>> my_list.sort()
+        >>> my_list
+        [1, 2, 3]
+        """
+        self._rebuild(self._column(sorted(self, key=key, reverse=reverse)))
+        self._version += 1
+
+    def splice(self, other, at: int):
+        """Moves all the elements of another list into the list before the given index, leaving the other list empty.
+        The elements are copied into new slots, as the lists don't share columns.
+
+        :param other: The DoublyLinkedList to move the elements from.
+        :param at: The index to move the elements to.
+        :exception: IndexError is raised if 'at' is out of bounds.
+        :exception: TypeError is raised if 'other' is not a DoublyLinkedList, or an element doesn't fit the typecode.
+        :exception: ValueError is raised if 'other' is the list itself.
+
+        >>> my_list1 = DoublyLinkedList([1, 4], typecode='q')
+        >>> my_list2 = DoublyLinkedList([2, 3], typecode='q')
+        >>> my_list1.splice(my_list2, 1)
+        >>> my_list1, my_list2
+        ([1, 2, 3, 4], [])
+        """
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError("other must be a DoublyLinkedList")
+
+        if other is self:
+            raise ValueError("cannot splice a list into itself")
+
+        if at < -self.size or at > self.size:
+            raise IndexError("index is out of range")
+
+        if at < 0:
+            at = self.size + at
+
+        # Convert first, so nothing is moved if the elements don't fit the typecode
+        if isinstance(other, TypedDoublyLinkedList):
+            view = self._convert(other.to_array())
+        else:
+            view = self._convert(list(other))
+
+        other.split_at(0)
+
+        self._link_many(self._node_at(at), view)
+        self._version += 1
+
+    def split_at(self, index: int):
+        """Splits the list in two, keeping the elements before the index and returning a list of the rest.
+
+        :param index: The index of the first element to move to the new list. May be the size of the list.
+        :return: A list of the elements from the index onwards.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3, 4], typecode='q')
+        >>> my_list.split_at(1), my_list
+        ([2, 3, 4], [1])
+        """
+        if index < -self.size or index > self.size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index = self.size + index
+
+        new_list = self._like()
+
+        if index == 0:
+            new_list._rebuild(self.to_array())
+            self._rebuild(self._column())
+        elif index < self._size:
+            slots = []
+            slot = self._node_at(index)
+            while slot >= 0:
+                slots.append(slot)
+                slot = self._next[slot]
+
+            new_list._rebuild(self._column([self._data[slot] for slot in slots]))
+
+            self._tail = self._prev[slots[0]]
+            self._next[self._tail] = -1
+            self._size = index
+            self._iter_node = None
+
+            # Free the highest slots first, so any at the end of the columns are truncated rather than kept
+            for slot in sorted(slots, reverse=True):
+                self._release(slot)
+
+        self._version += 1
+
+        return new_list
+
+    def to_array(self):
+        """Returns an array of the elements, in list order.
+        It can be passed to anything taking a buffer, e.g. numpy.frombuffer, without a further copy.
+
+        :return: The array.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3], typecode='d')
+        >>> my_list.to_array()
+        array('d', [1.0, 2.0, 3.0])
+        """
+        if self._sequential:
+            return self._data[:]
+
+        return self._column(self)
+
+    def to_bytes(self) -> bytes:
+        """Returns the list serialized in a compact binary form, which from_bytes() reads back.
+        The elements are written as the raw bytes of their array.
+
+        :return: The bytes.
+
+        >>> len(DoublyLinkedList([1, 2, 3], typecode='q').to_bytes())
+        39
+        """
+        return b''.join(_dump(self.to_array(), self._size, self.typecode))
+
+    def to_numpy(self, dtype=None):
+        """Returns an ndarray of the elements.
+        The ndarray wraps the array from to_array(), so the elements are copied only once.
+
+        :param dtype: Optional. The dtype of the ndarray. Defaults to the typecode.
+        :return: The ndarray.
+        :exception: ImportError is raised if numpy isn't installed.
+
+        >>> from Queue import numpy
+
+        >>> numpy is None or DoublyLinkedList([1, 2, 3], typecode='d').to_numpy().tolist() == [1.0, 2.0, 3.0]
+        True
+        """
+        return _to_numpy(self.to_array(), self._size, dtype)
+
+    def _column(self, elements=()):
+        """Returns a new data column containing the elements."""
+        return array.array(self._typecode, elements)
+
+    def _convert(self, elements):
+        """Returns the elements as a view for _link_many(), raising TypeError if they don't fit the typecode."""
+        return _as_view(elements, self._typecode)
+
+    def _extend_column(self, view: memoryview):
+        """Appends the elements of a view to the data column."""
+        self._data.frombytes(view.cast('B'))
+
+    def _acquire(self, data) -> int:
+        """Returns a slot containing the data, reusing a free slot if there is one."""
+        slot = self._free
+        if slot < 0:
+            self._data.append(data)
+            self._prev.append(-1)
+            self._next.append(-1)
+            return len(self._data) - 1
+
+        self._data[slot] = data
+        self._free = self._next[slot]
+
+        return slot
+
+    def _release(self, slot: int):
+        """Returns the data of a removed slot, and frees the slot."""
+        data = self._data[slot]
+
+        if slot == len(self._data) - 1:
+            del self._data[slot]
+            del self._prev[slot]
+            del self._next[slot]
+        else:
+            # Both columns link the free slots, so reverse() leaves the free-list intact
+            self._prev[slot] = self._next[slot] = self._free
+            self._free = slot
+
+        return data
+
+    def _node_at(self, index: int):
+        """Returns the slot at a non-negative index, walking from the nearer end, or None if the index is the size."""
+        if index == self._size:
+            return None
+
+        if self._sequential:
+            return index
+
+        if index < self._size // 2:
+            slot = self._head
+            for i in range(index):
+                slot = self._next[slot]
+        else:
+            slot = self._tail
+            for i in range(self._size - index - 1):
+                slot = self._prev[slot]
+
+        return slot
+
+    def _step(self, slot: int, k: int):
+        """Returns the slot k places after the given slot, or before it if k is negative.
+        A slot of None is the position past the end of the list.
+        """
+        if k == 0:
+            return slot
+        if k < 0 and slot is None:
+            slot = self._tail
+            k += 1
+
+        links = self._next if k > 0 else self._prev
+        for i in range(abs(k)):
+            slot = links[slot]
+
+        return None if slot < 0 else slot
+
+    def _data_of(self, slot: int):
+        """Returns the data of a slot in the list."""
+        return self._data[slot]
+
+    def _like(self):
+        """Returns a new, empty list with the same typecode as the list."""
+        return DoublyLinkedList(typecode=self.typecode)
+
+    def _assign(self, slot: int, data):
+        """Replaces the data of a slot in the list."""
+        self._data[slot] = data
+
+    def _link_before(self, slot: int, data):
+        """Links a new slot containing the data before the given slot, or at the end if the slot is None."""
+        new_slot = self._acquire(data)
+
+        if slot is None:
+            prev_slot = self._tail
+            self._tail = new_slot
+        else:
+            prev_slot = self._prev[slot]
+            self._prev[slot] = new_slot
+            self._sequential = False
+
+        self._prev[new_slot] = prev_slot
+        self._next[new_slot] = -1 if slot is None else slot
+
+        if prev_slot < 0:
+            self._head = new_slot
+        else:
+            self._next[prev_slot] = new_slot
+
+        self._size += 1
+        self._version += 1
+
+    def _link_many(self, slot: int, view: memoryview):
+        """Links new slots containing the data of a view before the given slot, or at the end if the slot is None.
+        The slots are added to the end of the columns in bulk.
+        """
+        n = len(view)
+        if not n:
+            return
+
+        start = len(self._data)
+        last = start + n - 1
+
+        self._extend_column(view)
+        self._prev.extend(range(start - 1, last))
+        self._next.extend(range(start + 1, last + 2))
+
+        if slot is None:
+            prev_slot = self._tail
+            self._tail = last
+            self._next[last] = -1
+        else:
+            prev_slot = self._prev[slot]
+            self._prev[slot] = last
+            self._next[last] = slot
+            self._sequential = False
+
+        self._prev[start] = prev_slot
+        if prev_slot < 0:
+            self._head = start
+        else:
+            self._next[prev_slot] = start
+
+        self._size += n
+
+    def _unlink(self, slot: int):
+        """Unlinks a slot from the list, and returns its data."""
+        prev_slot = self._prev[slot]
+        next_slot = self._next[slot]
+
+        if prev_slot < 0:
+            self._head = next_slot
+        else:
+            self._next[prev_slot] = next_slot
+
+        if next_slot < 0:
+            self._tail = prev_slot
+        else:
+            self._prev[next_slot] = prev_slot
+
+        # Update iterable ptr
+        if self._iter_node == slot:
+            self._iter_node = None if next_slot < 0 else next_slot
+
+        # Only removing the last slot keeps the slots in list order, as it's truncated rather than freed
+        if slot != len(self._data) - 1:
+            self._sequential = False
+
+        self._size -= 1
+        self._version += 1
+
+        return self._release(slot)
+
+    def _rebuild(self, data: array.array):
+        """Replaces the elements with those of an array, in slots in list order."""
+        n = len(data)
+
+        self._data = data
+        self._prev = array.array('q', range(-1, n - 1))
+        self._next = array.array('q', range(1, n + 1))
+        if n:
+            self._next[-1] = -1
+
+        self._head = 0 if n else -1
+        self._tail = n - 1
+        self._free = -1
+        self._size = n
+        self._sequential = True
+        self._iter_node = None
+
+
+class ObjectDoublyLinkedList(TypedDoublyLinkedList):
+    """A doubly linked list of any data, stored in slots of parallel columns like a TypedDoublyLinkedList.
+
+    The data is kept in a Python list and the links in arrays of slot numbers, so the elements form no reference
+    cycles. The garbage collector tracks the one data column rather than a node per element, which keeps full
+    collections short, and dropping the list frees its elements by reference counting alone.
+
+    to_array() returns a Python list, and to_bytes() pickles the elements, as for a DoublyLinkedList.
+    """
+
+    def __init__(self, elements=None, pool_size: int = 0, indexed: bool = False, typecode='O'):
+        """Instantiates a new instance of an ObjectDoublyLinkedList.
+
+        :param elements: Optional. The elements initialize with.
+        :param pool_size: Ignored, as removed slots are always reused.
+        :param indexed: Not supported, as for a TypedDoublyLinkedList.
+        :param typecode: Ignored, as the typecode is always 'O'.
+        :exception: TypeError is raised if 'elements' is not iterable.
+        :exception: ValueError is raised if 'indexed' is given.
+
+        >>> my_list = DoublyLinkedList([3, 'a', None], typecode='O')
+        >>> my_list, my_list.typecode
+        ([3, 'a', None], 'O')
+        """
+        super().__init__(elements, pool_size, indexed, 'O')
+
+    def to_bytes(self) -> bytes:
+        """Returns the list serialized in a compact binary form, which from_bytes() reads back.
+        The elements are pickled in chunks, so they must support pickling.
+
+        :return: The bytes.
+
+        >>> ObjectDoublyLinkedList.from_bytes(DoublyLinkedList([1, 'a'], typecode='O').to_bytes())
+        [1, 'a']
+        """
+        return b''.join(_dump(self, self._size))
+
+    def _column(self, elements=()):
+        """Returns a new data column containing the elements."""
+        return list(elements)
+
+    def _convert(self, elements):
+        """Returns the elements as a list for _link_many()."""
+        return list(_elements_of(elements))
+
+    def _extend_column(self, view: list):
+        """Appends the elements of a list to the data column."""
+        self._data.extend(view)
+
+    def _release(self, slot: int):
+        """Returns the data of a removed slot, and frees the slot."""
+        data = super()._release(slot)
+
+        # Drop the column's reference, so the data isn't kept alive by a free slot
+        if slot < len(self._data):
+            self._data[slot] = None
+
+        return data
+
+
+class Cursor:
+    """A position within a DoublyLinkedList, which can be moved and can edit the list around it in O(1).
+
+    A cursor is positioned at an element, or past the last element. Any number of cursors can walk the same
+    list, but once the list is changed by anything other than the cursor itself, the cursor is invalidated.
+    """
+
+    def __init__(self, linked_list: DoublyLinkedList, index: int = 0):
+        """Instantiates a new instance of a Cursor.
+
+        :param linked_list: The list.
+        :param index: Optional. The index to start at. May be the size of the list, i.e. past the end.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3])
+        >>> Cursor(my_list, 1)
+        Cursor(index=1, data=2)
+        """
+        if index < 0 or index > linked_list.size:
+            raise IndexError("index is out of range")
+
+        self._list = linked_list
+        self._version = linked_list._version
+        self._index = index
+        self._node = linked_list._node_at(index)
+
+    def __repr__(self):
+        if self._node is None:
+            return 'Cursor(index=%d, at end)' % self._index
+        return 'Cursor(index=%d, data=%r)' % (self._index, self._list._data_of(self._node))
+
+    @property
+    def data(self):
+        """Returns the data at the cursor.
+
+        :return: The data.
+        :exception: IndexError is raised if the cursor is past the end.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+        """
+        return self._list._data_of(self._current())
+
+    @data.setter
+    def data(self, value):
+        self._list._assign(self._current(), value)
+
+    @property
+    def index(self) -> int:
+        """Returns the index of the cursor.
+
+        :return: The index.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+        """
+        self._check()
+        return self._index
+
+    def at_end(self) -> bool:
+        """Returns True if the cursor is past the last element, otherwise False.
+
+        :return: A boolean indicating whether the cursor is past the end.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+        """
+        self._check()
+        return self._node is None
+
+    def insert_after(self, data):
+        """Inserts the data after the element at the cursor. The cursor doesn't move.
+
+        :param data: The data to insert.
+        :exception: IndexError is raised if the cursor is past the end.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+
+        >>> my_list = DoublyLinkedList([1, 3])
+        >>> cursor = my_list.cursor()
+        >>> cursor.insert_after(2)
+        >>> cursor, my_list
+        (Cursor(index=0, data=1), [1, 2, 3])
+        """
+        node = self._current()
+
+        self._list._link_before(self._list._step(node, 1), data)
+        self._version = self._list._version
+
+    def insert_before(self, data):
+        """Inserts the data before the element at the cursor, or at the end if the cursor is past the end.
+        The cursor stays on the same element.
+
+        :param data: The data to insert.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+
+        >>> my_list = DoublyLinkedList([1, 3])
+        >>> cursor = my_list.cursor(1)
+        >>> cursor.insert_before(2)
+        >>> cursor, my_list
+        (Cursor(index=2, data=3), [1, 2, 3])
+        """
+        self._check()
+
+        self._list._link_before(self._node, data)
+        self._version = self._list._version
+        self._index += 1
+
+    def move(self, k: int):
+        """Moves the cursor by k elements, forwards if k is positive or backwards if k is negative.
+
+        :param k: The number of elements to move by.
+        :exception: IndexError is raised if the cursor would move out of bounds.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3])
+        >>> cursor = my_list.cursor()
+        >>> cursor.move(2)
+        >>> cursor.move(-1)
+        >>> cursor
+        Cursor(index=1, data=2)
+
+        >>> my_list = DoublyLinkedList([1, 2, 3], typecode='q')
+        >>> cursor = my_list.cursor(3)
+        >>> cursor.move(0)
+        >>> cursor.move(-1)
+        >>> cursor
+        Cursor(index=2, data=3)
+        """
+        self._check()
+
+        if self._index + k < 0 or self._index + k > self._list.size:
+            raise IndexError("cursor is out of range")
+
+        self._node = self._list._step(self._node, k)
+        self._index += k
+
+    def remove_here(self):
+        """Removes and returns the element at the cursor. The cursor moves to the next element.
+
+        :return: The data.
+        :exception: IndexError is raised if the cursor is past the end.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3])
+        >>> cursor = my_list.cursor(1)
+        >>> cursor.remove_here(), cursor, my_list
+        (2, Cursor(index=1, data=3), [1, 3])
+        """
+        node = self._current()
+        self._node = self._list._step(node, 1)
+
+        data = self._list._unlink(node)
+        self._version = self._list._version
+
+        return data
+
+    def _check(self):
+        if self._version != self._list._version:
+            raise RuntimeError("list changed since the cursor was created")
+
+    def _current(self) -> Node:
+        self._check()
+
+        if self._node is None:
+            raise IndexError("cursor is at the end of the list")
+
+        return self._node
+
+
+class View:
+    """A read-only view of a slice of a DoublyLinkedList, which refers to the list's nodes rather than copying them.
+
+    Only the nodes at either end of the slice are kept, so creating a view costs the walk to those nodes.
+    Once the list is changed structurally, i.e. by adding, removing or reordering elements, the view is invalidated.
+
+    >>> my_list = DoublyLinkedList([1, 2, 3, 4, 5])
+    >>> view = my_list[1:4]
+    >>> view, len(view), list(reversed(view))
+    ([2, 3, 4], 3, [4, 3, 2])
+
+    >>> my_list[::-2]
+    [5, 3, 1]
+    """
+
+    def __init__(self, linked_list: DoublyLinkedList, key: slice):
+        """Instantiates a new instance of a View.
+
+        :param linked_list: The list.
+        :param key: The slice of the list to view.
+        """
+        start, stop, step = key.indices(linked_list.size)
+
+        self._list = linked_list
+        self._version = linked_list._version
+        self._size = len(range(start, stop, step))
+        self._step = step
+        self._first = None
+        self._last = None
+
+        if self._size:
+            self._first = linked_list._node_at(start)
+            self._last = linked_list._node_at(start + (self._size - 1) * step)
+
+    def __iter__(self):
+        return self._walk(self._first, self._step > 0)
+
+    def __len__(self):
+        self._check()
+        return self._size
+
+    def __repr__(self):
+        return str(list(self))
+
+    def __reversed__(self):
+        return self._walk(self._last, self._step < 0)
+
+    def materialize(self) -> DoublyLinkedList:
+        """Returns a new list containing the elements of the view.
+
+        :return: The list.
+        :exception: RuntimeError is raised if the list has changed since the view was created.
+
+        >>> my_list = DoublyLinkedList([1, 2, 3])
+        >>> new_list = my_list[1:].materialize()
+        >>> my_list.append(4)
+        >>> new_list
+        [2, 3]
+        """
+        self._check()
+
+        new_list = self._list._like()
+        new_list.extend(self)
+
+        return new_list
+
+    def _check(self):
+        if self._version != self._list._version:
+            raise RuntimeError("list changed since the view was created")
+
+    def _walk(self, node, forwards: bool):
+        self._check()
+
+        k = abs(self._step) if forwards else -abs(self._step)
+        for i in range(self._size):
+            if i:
+                node = self._list._step(node, k)
+
+            yield self._list._data_of(node)
+            self._check()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018 Jared Gillespie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import collections
+import time
+
+
+class Tenant:
+    """A tenant of a FairQueue, holding its sub-queue, scheduling state and counters."""
+    def __init__(self, name, weight: float, maxlen: int):
+        self.name = name
+        self.weight = weight
+        self.maxlen = maxlen
+        self.enqueued = 0
+        self.dequeued = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._queue = collections.deque()
+        self._deficit = 0.0
+
+    def __repr__(self):
+        return 'Tenant(%r, weight=%r, depth=%d)' % (self.name, self.weight, len(self._queue))
+
+    @property
+    def depth(self):
+        return len(self._queue)
+
+    @property
+    def mean_latency(self):
+        return self.total_latency / self.dequeued if self.dequeued else 0.0
+
+
+class FairQueue:
+    """A queue which multiplexes the items of several tenants, and retrieves them fairly between tenants.
+
+    Each tenant has its own FIFO sub-queue. Tenants with queued items take turns using deficit
+    round-robin: on its turn, a tenant's deficit grows by its weight, and it is served one item per whole
+    unit of deficit. A tenant with twice the weight of another is therefore served twice as often while
+    both have items queued, and a burst from one tenant cannot starve the others.
+    Only tenants with queued items take turns, so get is amortized O(1) regardless of the number of tenants.
+    """
+
+    def __init__(self, weight: float = 1, maxlen: int = None, clock=time.monotonic):
+        """Instantiates a new instance of a FairQueue.
+
+        :param weight: Optional. The weight of tenants which aren't added explicitly.
+        :param maxlen: Optional. The maximum depth of tenants which aren't added explicitly.
+        :param clock: Optional. The function used to time the latency of items.
+        :exception: ValueError is raised if 'weight' is <= 0 or 'maxlen' is < 1.
+
+        >>> my_queue = FairQueue()
+        >>> my_queue
+        {}
+        """
+        self._check(weight, maxlen)
+
+        self._weight = weight
+        self._maxlen = maxlen
+        self._clock = clock
+        self._tenants = dict()
+        self._active = collections.deque()
+        self._turn_started = False
+        self._size = 0
+
+    def __contains__(self, item) -> bool:
+        for tenant in self._active:
+            for data, _ in tenant._queue:
+                if data == item:
+                    return True
+
+        return False
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return str({name: [data for data, _ in reversed(tenant._queue)] for name, tenant in self._tenants.items()})
+
+    @property
+    def size(self):
+        """Returns the number of items in the queue, across all tenants.
+
+        :return: The size.
+
+        >>> my_queue = FairQueue()
+        >>> my_queue.put('a', 1)
+        >>> my_queue.put('b', 2)
+        >>> my_queue.size
+        2
+        """
+        return self._size
+
+    def add_tenant(self, name, weight: float = 1, maxlen: int = None) -> Tenant:
+        """Adds a tenant, or updates the weight and maximum depth of an existing tenant.
+
+        :param name: The name of the tenant.
+        :param weight: Optional. The share of items the tenant is served, relative to other tenants.
+        :param maxlen: Optional. The maximum number of items the tenant can have queued.
+        :return: The tenant.
+        :exception: ValueError is raised if 'weight' is <= 0 or 'maxlen' is < 1.
+
+        >>> my_queue = FairQueue()
+        >>> my_queue.add_tenant('a', weight=2)
+        Tenant('a', weight=2, depth=0)
+        """
+        self._check(weight, maxlen)
+
+        tenant = self._tenants.get(name)
+        if tenant is None:
+            tenant = Tenant(name, weight, maxlen)
+            self._tenants[name] = tenant
+        else:
+            tenant.weight = weight
+            tenant.maxlen = maxlen
+
+        return tenant
+
+    def tenant(self, name) -> Tenant:
+        """Returns a tenant, whose depth and latency counters can be inspected.
+
+        :param name: The name of the tenant.
+        :return: The tenant.
+        :exception: KeyError is raised if the tenant doesn't exist.
+
+        >>> my_queue = FairQueue()
+        >>> my_queue.put('a', 1)
+        >>> my_queue.tenant('a').depth, my_queue.tenant('a').enqueued
+        (1, 1)
+        """
+        return self._tenants[name]
+
+    def is_empty(self) -> bool:
+        """Returns True if the queue is empty, otherwise False.
+
+        :return: A boolean indicating whether the queue is empty.
+
+        >>> my_queue = FairQueue()
+        >>> my_queue.is_empty()
+        True
+        """
+        return self._size == 0
+
+    def put(self, name, data):
+        """Inserts an element at the end of a tenant's queue. The tenant is added if it doesn't exist.
+
+        :param name: The name of the tenant.
+        :param data: The data.
+        :exception: IndexError is raised if the tenant's queue is full.
+
+        >>> my_queue = FairQueue(maxlen=1)
+        >>> my_queue.put('a', 1)
+        >>> my_queue.put('a', 2)
+        Traceback (most recent call last):
+            ...
+        IndexError: tenant queue is full
+        """
+        tenant = self._tenants.get(name)
+        if tenant is None:
+            tenant = self.add_tenant(name, self._weight, self._maxlen)
+
+        if tenant.maxlen is not None and len(tenant._queue) >= tenant.maxlen:
+            raise IndexError('tenant queue is full')
+
+        if not tenant._queue:
+            self._active.append(tenant)
+
+        tenant._queue.append((data, self._clock()))
+        tenant.enqueued += 1
+        self._size += 1
+
+    def get(self):
+        """Retrieves and removes the next element, in weighted round-robin order between tenants.
+
+        :return: The retrieved data.
+        :exception: IndexError is raised if the queue is empty.
+
+        >>> my_queue = FairQueue()
+        >>> my_queue.add_tenant('a', weight=2)
+        Tenant('a', weight=2, depth=0)
+        >>> for i in range(4):
+        ...     my_queue.put('a', 'a%d' % i)
+        ...     my_queue.put('b', 'b%d' % i)
+        >>> [my_queue.get() for _ in range(6)]
+        ['a0', 'a1', 'b0', 'a2', 'a3', 'b1']
+        """
+        tenant = self._select()
+
+        data, enqueued_at = tenant._queue.popleft()
+        tenant._deficit -= 1
+
+        if not tenant._queue:
+            # An idle tenant doesn't get to save up its deficit
+            tenant._deficit = 0.0
+            self._active.popleft()
+            self._turn_started = False
+        elif tenant._deficit < 1:
+            self._active.rotate(-1)
+            self._turn_started = False
+
+        latency = self._clock() - enqueued_at
+        tenant.dequeued += 1
+        tenant.total_latency += latency
+        if latency > tenant.max_latency:
+            tenant.max_latency = latency
+
+        self._size -= 1
+
+        return data
+
+    def peek(self):
+        """Retrieves the next element, in weighted round-robin order between tenants.
+
+        :return: The retrieved data.
+        :exception: IndexError is raised if the queue is empty.
+
+        >>> my_queue = FairQueue()
+        >>> my_queue.put('a', 1)
+        >>> my_queue.peek(), my_queue.size
+        (1, 1)
+        """
+        return self._select()._queue[0][0]
+
+    def _select(self) -> Tenant:
+        """Returns the tenant whose turn it is, granting deficit to tenants until one can be served."""
+        active = self._active
+        if not active:
+            raise IndexError('queue is empty')
+
+        while True:
+            tenant = active[0]
+
+            if not self._turn_started:
+                tenant._deficit += tenant.weight
+                self._turn_started = True
+
+            if tenant._deficit >= 1:
+                return tenant
+
+            active.rotate(-1)
+            self._turn_started = False
+
+    @staticmethod
+    def _check(weight: float, maxlen: int):
+        if weight <= 0:
+            raise ValueError("weight must be > 0")
+
+        if maxlen is not None and maxlen < 1:
+            raise ValueError("maxlen must be > 0")
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
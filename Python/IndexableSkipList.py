@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018 Jared Gillespie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import collections.abc
+import random
+
+_MAX_LEVEL = 32
+
+
+class Node:
+    """A node containing data with a pointer to the next node, and the number of positions it spans,
+    on each of its levels.
+    """
+    __slots__ = ('data', 'next', 'width')
+
+    def __init__(self, data, level: int):
+        self.data = data
+        self.next = [None] * level
+        self.width = [1] * level
+
+    def __repr__(self):
+        return '%s (level %d)' % (self.data, len(self.next))
+
+
+class IndexableSkipList:
+    """A list of nodes linked on multiple levels, supporting positional access in O(log n).
+    i.e. HEAD ------------> Node3 -> NULL
+         HEAD -> Node1 -> Node2 -> Node3 -> NULL
+
+    Each node appears on a random number of levels, each level linking about half as many nodes as
+    the one below it. Every link stores the number of positions it spans, so a position is found by
+    skipping along the highest level as far as possible and then dropping down a level.
+    The interface is the same as a DoublyLinkedList's.
+    """
+
+    def __init__(self, elements=None):
+        """Instantiates a new instance of an IndexableSkipList.
+
+        :param elements: Optional. The elements initialize with.
+        :exception: TypeError is raised if 'elements' is not iterable.
+
+        >>> my_list = IndexableSkipList()
+        >>> my_list
+        []
+
+        >>> my_list = IndexableSkipList([3, 4, 5])
+        >>> my_list
+        [3, 4, 5]
+        """
+        self._head = Node(None, _MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+
+        if elements is not None:
+            self.extend(elements)
+
+    def __add__(self, other):
+        if not isinstance(other, IndexableSkipList):
+            raise TypeError("other must be an IndexableSkipList")
+
+        new_list = self.copy()
+        new_list.extend(other)
+
+        return new_list
+
+    def __contains__(self, item) -> bool:
+        for data in self:
+            if data == item:
+                return True
+
+        return False
+
+    def __delitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._size)
+            # Remove from the highest index down, so the remaining indexes don't shift
+            for index in sorted(range(start, stop, step), reverse=True):
+                self.remove(index)
+        else:
+            self.remove_item(key)
+
+    def __eq__(self, other):
+        if isinstance(other, (IndexableSkipList, list)):
+            if len(self) != len(other):
+                return False
+
+            for self_data, other_data in zip(self, other):
+                if self_data != other_data:
+                    return False
+
+            return True
+        else:
+            return NotImplemented
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.slice(index.start, index.stop, index.step)
+
+        return self.get(index)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __iter__(self):
+        node = self._head.next[0]
+        while node is not None:
+            yield node.data
+            node = node.next[0]
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return str(list(self))
+
+    def __reversed__(self):
+        """Returns an iterator over the list in reverse.
+
+        :return: A reverse iterator.
+
+        >>> my_list = IndexableSkipList([1, 2, 3])
+        >>> list(reversed(my_list))
+        [3, 2, 1]
+        """
+        return reversed(list(self))
+
+    @property
+    def size(self) -> int:
+        """Returns the size of the list.
+
+        :return: The size.
+
+        >>> my_list = IndexableSkipList([1, 2, 3])
+        >>> my_list.size
+        3
+        """
+        return self._size
+
+    def append(self, data):
+        """Appends the data to the end of the list.
+
+        :param data: The data to append.
+
+        >>> my_list = IndexableSkipList([3, 4])
+        >>> my_list.append(1)
+        >>> my_list
+        [3, 4, 1]
+        """
+        self.insert(self._size, data)
+
+    def copy(self):
+        """Returns a copy of the list.
+
+        :return: A copy of the list.
+
+        >>> my_list = IndexableSkipList([5, 7, -1])
+        >>> my_list.copy()
+        [5, 7, -1]
+        """
+        return IndexableSkipList(self)
+
+    def extend(self, other):
+        """Extends the list with the elements of another.
+
+        :param other: A list or IndexableSkipList to extend the list with.
+        :exception: TypeError is raised if 'other' is not iterable.
+
+        >>> my_list = IndexableSkipList([1])
+        >>> my_list.extend([2, 3, 4])
+        >>> my_list
+        [1, 2, 3, 4]
+        """
+        if not isinstance(other, collections.abc.Iterable):
+            raise TypeError("other must be iterable")
+
+        for data in list(other):
+            self.insert(self._size, data)
+
+    def get(self, index: int):
+        """Gets the data at the specified index.
+
+        :param index: The index to retrieve.
+        :return: The data.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = IndexableSkipList([5, 2, -1, 2])
+        >>> my_list.get(1), my_list.get(-2)
+        (2, -1)
+        """
+        if index < -self._size or index >= self._size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index = self._size + index
+
+        return self._find(index, None).data
+
+    def insert(self, index: int, data):
+        """Inserts the data at the given element.
+        If an element exists at the given position, the element is inserted before it.
+
+        :param index: The index to insert at.
+        :param data: The data to insert.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = IndexableSkipList()
+        >>> my_list.insert(0, 3)
+        >>> my_list.insert(0, 1)
+        >>> my_list.insert(-1, 2)
+        >>> my_list.insert(len(my_list), 4)
+        >>> my_list
+        [1, 2, 3, 4]
+        """
+        if index < -self._size or index > self._size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index = self._size + index
+
+        level = 1
+        bits = random.getrandbits(_MAX_LEVEL - 1)
+        while bits & 1:
+            level += 1
+            bits >>= 1
+
+        head = self._head
+        while self._level < level:
+            # A newly used level of the head spans the whole list
+            head.next[self._level] = None
+            head.width[self._level] = self._size + 1
+            self._level += 1
+
+        update = [None] * self._level
+        positions = [0] * self._level
+        self._find(index, update, positions)
+
+        node = Node(data, level)
+        for i in range(self._level):
+            prev = update[i]
+            if i < level:
+                node.next[i] = prev.next[i]
+                node.width[i] = positions[i] + prev.width[i] + 1 - index
+                prev.next[i] = node
+                prev.width[i] = index - positions[i]
+            else:
+                prev.width[i] += 1
+
+        self._size += 1
+
+    def is_empty(self):
+        """Returns True if the list is empty, otherwise False.
+
+        :return: A boolean indicating whether the list is empty.
+
+        >>> my_list = IndexableSkipList()
+        >>> my_list.is_empty()
+        True
+        """
+        return self._size == 0
+
+    def pop(self):
+        """Removes and returns the data from the beginning of the list.
+
+        :return: The data.
+        :exception: IndexError is raised if list is empty.
+
+        >>> my_list = IndexableSkipList([1, 2, 3])
+        >>> my_list.pop()
+        1
+        """
+        if self._size == 0:
+            raise IndexError("list is empty")
+
+        return self.remove(0)
+
+    def pop_last(self):
+        """Removes and returns the data from the end of the list.
+
+        :return: The data.
+        :exception: IndexError is raised if list is empty.
+
+        >>> my_list = IndexableSkipList([1, 2, 3])
+        >>> my_list.pop_last()
+        3
+        """
+        if self._size == 0:
+            raise IndexError("list is empty")
+
+        return self.remove(self._size - 1)
+
+    def prepend(self, data):
+        """Prepends the data to the beginning of the list.
+
+        :param data: The data to prepend.
+
+        >>> my_list = IndexableSkipList([3, 4])
+        >>> my_list.prepend(1)
+        >>> my_list
+        [1, 3, 4]
+        """
+        self.insert(0, data)
+
+    def remove(self, index: int):
+        """Removes and returns the data at the given index.
+
+        :param index: The index to remove.
+        :return: The data at the index.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = IndexableSkipList([4, 7, 2])
+        >>> my_list.remove(1), my_list
+        (7, [4, 2])
+        """
+        if index < -self._size or index >= self._size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index = self._size + index
+
+        update = [None] * self._level
+        self._find(index, update)
+
+        node = update[0].next[0]
+        for i in range(self._level):
+            prev = update[i]
+            if prev.next[i] is node:
+                prev.next[i] = node.next[i]
+                prev.width[i] += node.width[i] - 1
+            else:
+                prev.width[i] -= 1
+
+        head = self._head
+        while self._level > 1 and head.next[self._level - 1] is None:
+            self._level -= 1
+
+        self._size -= 1
+
+        return node.data
+
+    def remove_item(self, data):
+        """Removes the first occurrence of the given data.
+
+        :param data: The data to remove.
+        :exception: ValueError is raised if item is not found.
+
+        >>> my_list = IndexableSkipList([3, 4, 3])
+        >>> my_list.remove_item(3)
+        >>> my_list
+        [4, 3]
+        """
+        for index, item in enumerate(self):
+            if item == data:
+                self.remove(index)
+                return
+
+        raise ValueError("item not found")
+
+    def reverse(self):
+        """Reverses the list.
+
+        >>> my_list = IndexableSkipList([1, 2, 3])
+        >>> my_list.reverse()
+        >>> my_list
+        [3, 2, 1]
+        """
+        elements = list(self)
+        elements.reverse()
+
+        self.__init__(elements)
+
+    def slice(self, start: int = None, stop: int = None, step: int = None):
+        """Returns a new list of the elements in the given range, as with slicing a list.
+        The start of the range is found in O(log n), and the range is then walked in order.
+
+        :param start: Optional. The index to start at.
+        :param stop: Optional. The index to stop before.
+        :param step: Optional. The step between indexes.
+        :return: The new list.
+
+        >>> my_list = IndexableSkipList([1, 2, 3, 4, 5])
+        >>> my_list[1:4], my_list[::2], my_list[::-1]
+        ([2, 3, 4], [1, 3, 5], [5, 4, 3, 2, 1])
+        """
+        start, stop, step = slice(start, stop, step).indices(self._size)
+        count = len(range(start, stop, step))
+        if count == 0:
+            return IndexableSkipList()
+
+        if step < 0:
+            # Walk forwards from the last index of the range, and reverse
+            first = start + (count - 1) * step
+            elements = self._walk(first, count, -step)
+            elements.reverse()
+        else:
+            elements = self._walk(start, count, step)
+
+        return IndexableSkipList(elements)
+
+    def _find(self, index: int, update, positions=None):
+        """Returns the node at an index. If 'update' is given, it's filled with the last node before the index
+        on each level, and 'positions' with their positions.
+        """
+        node = self._head
+        position = -1
+
+        for i in range(self._level - 1, -1, -1):
+            while node.next[i] is not None and position + node.width[i] < index:
+                position += node.width[i]
+                node = node.next[i]
+
+            if update is not None:
+                update[i] = node
+                if positions is not None:
+                    positions[i] = position
+
+        return node.next[0]
+
+    def _walk(self, start: int, count: int, step: int) -> list:
+        node = self._find(start, None)
+        elements = []
+
+        while True:
+            elements.append(node.data)
+            if len(elements) == count:
+                return elements
+
+            for _ in range(step):
+                node = node.next[0]
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -21,6 +21,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import array
+
 
 class Node:
     """A node containing a key and value with, optionally, a pointer to a next and/or previous node.
@@ -28,6 +30,8 @@ class Node:
 
     There are no restrictions on what type of data can be contained within the node.
     """
+    __slots__ = ('key', 'value', 'next', 'prev')
+
     def __init__(self, key, value):
         self.key = key
         self.value = value
@@ -64,10 +68,17 @@ class LRUCache:
     ('C', ['4:C', '3:D'])
     """
 
-    def __init__(self, capacity: int):
+    def __new__(cls, capacity: int, compact: bool = False):
+        if cls is LRUCache and compact:
+            cls = CompactLRUCache
+
+        return super().__new__(cls)
+
+    def __init__(self, capacity: int, compact: bool = False):
         """Instantiates a new instance of a LRUCache.
 
         :param capacity: The size of the cache.
+        :param compact: Optional. If True, a CompactLRUCache is created instead, which keeps no node per item.
         :exception: ValueError is raised if 'capacity' is < 1.
 
         >>> cache = LRUCache(1)
@@ -183,6 +194,7 @@ class LRUCache:
                 self._append_cache(node)
         else:
             if self._capacity == self._size:
+                self._map.pop(self._cache_tail.key)
                 self._remove_cache(self._cache_tail)
 
             node = Node(key, value)
@@ -190,6 +202,29 @@ class LRUCache:
             self._map[key] = node
             self._append_cache(node)
 
+    def clear(self):
+        """Removes all the items from the cache.
+        Each node's links are dropped as it goes, so the nodes are freed without waiting for a garbage collection.
+
+        >>> cache = LRUCache(2)
+        >>> cache.put(1, "A")
+        >>> cache.put(2, "B")
+        >>> cache.clear()
+        >>> cache, 1 in cache
+        ([], False)
+        """
+        node = self._cache_head
+        while node is not None:
+            next_node = node.next
+            node.prev = None
+            node.next = None
+            node = next_node
+
+        self._cache_head = None
+        self._cache_tail = None
+        self._size = 0
+        self._map.clear()
+
     def is_empty(self):
         """Returns True if the cache is empty, otherwise False.
 
@@ -254,6 +289,219 @@ class LRUCache:
         if node == self._cache_tail:
             self._cache_tail = node.prev
 
+        # Drop the node's links, so a moved node doesn't keep stale ones and a removed node forms no cycle
+        node.prev = None
+        node.next = None
+
+        self._size -= 1
+
+
+class CompactLRUCache(LRUCache):
+    """A LRUCache whose items are kept in slots of parallel columns, rather than as a node per item.
+
+    Keys and values are stored in Python lists and the recency order in arrays of slot numbers, so the items form no
+    reference cycles. The garbage collector then tracks a handful of columns instead of every node, which keeps full
+    collections short, and evicted or removed items are freed by reference counting alone.
+
+    >>> cache = LRUCache(2, compact=True)
+    >>> cache.put(1, "A")
+    >>> cache.put(2, "B")
+    >>> cache.put(3, "C")
+    >>> cache.get(1), cache.get(2), cache
+    (None, 'B', ['2:B', '3:C'])
+
+    >>> other_cache = LRUCache(2, compact=True)
+    >>> other_cache.put(3, "C")
+    >>> other_cache.put(2, "B")
+    >>> cache == other_cache
+    True
+    >>> other_cache = LRUCache(2, compact=True)
+    >>> other_cache.put(3, "D")
+    >>> other_cache.put(2, "B")
+    >>> cache == other_cache
+    False
+    """
+
+    def __init__(self, capacity: int, compact: bool = True):
+        """Instantiates a new instance of a CompactLRUCache.
+
+        :param capacity: The size of the cache.
+        :param compact: Ignored, as the cache is always compact.
+        :exception: ValueError is raised if 'capacity' is < 1.
+
+        >>> cache = CompactLRUCache(1)
+        >>> cache.put(1, "thing")
+        >>> cache
+        ['1:thing']
+        """
+        super().__init__(capacity)
+
+        self._keys = []
+        self._values = []
+        self._prev = array.array('q')
+        self._next = array.array('q')
+        self._cache_head = -1
+        self._cache_tail = -1
+        self._free = -1
+
+    def __eq__(self, other):
+        if isinstance(other, CompactLRUCache):
+            # The map only holds slot numbers, so compare the values in them
+            return ({key: self._values[slot] for key, slot in self._map.items()} ==
+                    {key: other._values[slot] for key, slot in other._map.items()})
+
+        return super().__eq__(other)
+
+    def __repr__(self):
+        s = []
+        slot = self._cache_head
+        while slot >= 0:
+            s.append('%s:%s' % (self._keys[slot], self._values[slot]))
+            slot = self._next[slot]
+
+        return str(s)
+
+    def clear(self):
+        """Removes all the items from the cache, freeing the columns.
+
+        >>> cache = LRUCache(2, compact=True)
+        >>> cache.put(1, "A")
+        >>> cache.clear()
+        >>> cache, 1 in cache
+        ([], False)
+        """
+        self._keys = []
+        self._values = []
+        self._prev = array.array('q')
+        self._next = array.array('q')
+        self._cache_head = -1
+        self._cache_tail = -1
+        self._free = -1
+        self._size = 0
+        self._map.clear()
+
+    def get(self, key):
+        """Retrieves and element from the cache.
+        This element becomes the most recently used.
+
+        :return: The retrieved data.
+
+        >>> cache = LRUCache(2, compact=True)
+        >>> cache.put(1, "A")
+        >>> cache.put(2, "B")
+        >>> cache.get(1), cache
+        ('A', ['1:A', '2:B'])
+        """
+        if key in self._map:
+            slot = self._map[key]
+
+            if slot != self._cache_head:
+                self._remove_cache(slot)
+                self._append_cache(slot)
+
+            return self._values[slot]
+        else:
+            return None
+
+    def put(self, key, value):
+        """Inserts an element into the cache.
+        This element becomes the most recently used.
+
+        :param data: The data.
+
+        >>> cache = LRUCache(3, compact=True)
+        >>> cache.put(1, "A")
+        >>> cache.put(2, "B")
+        >>> cache.put(4, "C")
+        >>> cache
+        ['4:C', '2:B', '1:A']
+        """
+        if key in self._map:
+            slot = self._map[key]
+
+            if slot != self._cache_head:
+                self._remove_cache(slot)
+                self._append_cache(slot)
+        else:
+            if self._capacity == self._size:
+                # Reuse the evicted item's slot
+                slot = self._cache_tail
+                self._map.pop(self._keys[slot])
+                self._remove_cache(slot)
+            else:
+                slot = self._acquire()
+
+            self._keys[slot] = key
+            self._values[slot] = value
+
+            self._map[key] = slot
+            self._append_cache(slot)
+
+    def remove(self, key):
+        """Removes data from the cache, if it exists.
+
+        :param data: The data to remove.
+
+        >>> cache = LRUCache(2, compact=True)
+        >>> cache.put(1, "hi")
+        >>> cache.put(2, "bye")
+        >>> cache.remove(1)
+        >>> cache
+        ['2:bye']
+        """
+        if key in self._map:
+            slot = self._map.pop(key)
+            self._remove_cache(slot)
+            self._release(slot)
+
+    def _acquire(self) -> int:
+        """Returns an empty slot, reusing a free slot if there is one."""
+        slot = self._free
+        if slot < 0:
+            self._keys.append(None)
+            self._values.append(None)
+            self._prev.append(-1)
+            self._next.append(-1)
+            return len(self._keys) - 1
+
+        self._free = self._next[slot]
+
+        return slot
+
+    def _release(self, slot: int):
+        """Frees a removed slot, dropping its key and value."""
+        self._keys[slot] = None
+        self._values[slot] = None
+        self._next[slot] = self._free
+        self._free = slot
+
+    def _append_cache(self, slot: int):
+        self._size += 1
+
+        self._prev[slot] = -1
+        self._next[slot] = self._cache_head
+
+        if self._cache_head < 0:
+            self._cache_tail = slot
+        else:
+            self._prev[self._cache_head] = slot
+
+        self._cache_head = slot
+
+    def _remove_cache(self, slot: int):
+        prev_slot = self._prev[slot]
+        next_slot = self._next[slot]
+
+        if prev_slot < 0:
+            self._cache_head = next_slot
+        else:
+            self._next[prev_slot] = next_slot
+
+        if next_slot < 0:
+            self._cache_tail = prev_slot
+        else:
+            self._prev[next_slot] = prev_slot
+
         self._size -= 1
 
 
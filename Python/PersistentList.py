@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018 Jared Gillespie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from SinglyLinkedList import SinglyLinkedList
+
+
+class PersistentList:
+    """An immutable singly linked list, whose versions share structure.
+
+    The list is a chain of (data, rest) cells. Prepending an element, or taking the first element or the rest of
+    the list, is O(1) and shares every cell with the version it came from. Changing an element further in copies
+    only the cells before it. So copying a list is free, and keeping many versions costs memory for their changes
+    rather than for their sizes.
+
+    For building a list element by element, a TransientList can be appended to in O(1) and then made persistent.
+    """
+
+    __slots__ = ('_head', '_size')
+
+    def __init__(self, elements=None):
+        """Instantiates a new instance of a PersistentList.
+
+        :param elements: Optional. The elements initialize with.
+        :exception: TypeError is raised if 'elements' is not iterable.
+
+        >>> my_list = PersistentList()
+        >>> my_list
+        []
+
+        >>> my_list = PersistentList([3, 4, 5])
+        >>> my_list
+        [3, 4, 5]
+        """
+        head = None
+        size = 0
+
+        if elements is not None:
+            for data in reversed(list(elements)):
+                head = (data, head)
+                size += 1
+
+        self._head = head
+        self._size = size
+
+    def __add__(self, other):
+        if not isinstance(other, PersistentList):
+            raise TypeError("other must be a PersistentList")
+
+        # Only the cells of this list are copied, the other list's are shared
+        return PersistentList._make(_cons(self, other._head), self._size + other._size)
+
+    def __contains__(self, item) -> bool:
+        for data in self:
+            if data == item:
+                return True
+
+        return False
+
+    def __eq__(self, other):
+        if isinstance(other, PersistentList):
+            if self._size != other._size:
+                return False
+
+            self_cell, other_cell = self._head, other._head
+            while self_cell is not other_cell:
+                if self_cell[0] != other_cell[0]:
+                    return False
+                self_cell, other_cell = self_cell[1], other_cell[1]
+
+            return True
+        else:
+            return NotImplemented
+
+    def __getitem__(self, index: int):
+        return self.get(index)
+
+    def __iter__(self):
+        cell = self._head
+        while cell is not None:
+            yield cell[0]
+            cell = cell[1]
+
+    def __len__(self):
+        return self._size
+
+    def __reduce__(self):
+        # Pickle the elements as a flat list, rather than the nested cells
+        return PersistentList, (list(self),)
+
+    def __repr__(self):
+        return str(list(self))
+
+    @classmethod
+    def from_linked_list(cls, linked_list: SinglyLinkedList):
+        """Creates a persistent list with the elements of a SinglyLinkedList, or any other iterable.
+
+        :param linked_list: The SinglyLinkedList.
+        :return: The persistent list.
+
+        >>> PersistentList.from_linked_list(SinglyLinkedList([1, 2, 3]))
+        [1, 2, 3]
+        """
+        return cls(linked_list)
+
+    @classmethod
+    def _make(cls, head, size: int):
+        persistent_list = cls.__new__(cls)
+        persistent_list._head = head
+        persistent_list._size = size
+
+        return persistent_list
+
+    @property
+    def size(self):
+        """Returns the size of the list.
+
+        :return: The size.
+
+        >>> my_list = PersistentList([1, 2, 3])
+        >>> my_list.size
+        3
+        """
+        return self._size
+
+    def append(self, data):
+        """Returns a new list with the data appended to the end.
+        Every cell is copied, so this is O(n). Use a TransientList to append many elements.
+
+        :param data: The data to append.
+        :return: The new list.
+
+        >>> my_list = PersistentList([1, 2])
+        >>> my_list.append(3), my_list
+        ([1, 2, 3], [1, 2])
+        """
+        return PersistentList._make(_cons(self, (data, None)), self._size + 1)
+
+    def copy(self):
+        """Returns a copy of the list. As the list is immutable, this is the list itself.
+
+        :return: A copy of the list.
+
+        >>> my_list = PersistentList([1, 2, 3])
+        >>> my_list.copy() is my_list
+        True
+        """
+        return self
+
+    def get(self, index: int):
+        """Gets the data at the specified index.
+
+        :param index: The index to retrieve.
+        :return: The data.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = PersistentList([5, 2, -1, 2])
+        >>> my_list.get(1), my_list.get(-2)
+        (2, -1)
+        """
+        return self._cell_at(self._index(index))[0]
+
+    def head(self):
+        """Retrieves the first element of the list.
+
+        :return: The data.
+        :exception: IndexError is raised if the list is empty.
+
+        >>> my_list = PersistentList([1, 2, 3])
+        >>> my_list.head()
+        1
+        """
+        if self._head is None:
+            raise IndexError("list is empty")
+
+        return self._head[0]
+
+    def insert(self, index: int, data):
+        """Returns a new list with the data inserted at the given index.
+        The elements after the index are shared with the list, so only the cells before it are copied.
+
+        :param index: The index to insert at.
+        :param data: The data to insert.
+        :return: The new list.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = PersistentList([1, 3])
+        >>> my_list.insert(1, 2), my_list
+        ([1, 2, 3], [1, 3])
+        """
+        if index < -self._size or index > self._size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index = self._size + index
+
+        return self._replace(index, 0, (data,))
+
+    def is_empty(self) -> bool:
+        """Returns True if the list is empty, otherwise False.
+
+        :return: A boolean indicating whether the list is empty.
+
+        >>> my_list = PersistentList()
+        >>> my_list.is_empty()
+        True
+
+        >>> my_list = PersistentList([1])
+        >>> my_list.is_empty()
+        False
+        """
+        return self._size == 0
+
+    def prepend(self, data):
+        """Returns a new list with the data prepended to the beginning. This is O(1).
+
+        :param data: The data to prepend.
+        :return: The new list.
+
+        >>> my_list = PersistentList([2, 3])
+        >>> my_list.prepend(1), my_list
+        ([1, 2, 3], [2, 3])
+        """
+        return PersistentList._make((data, self._head), self._size + 1)
+
+    def remove(self, index: int):
+        """Returns a new list with the element at the given index removed.
+        The elements after the index are shared with the list, so only the cells before it are copied.
+
+        :param index: The index to remove.
+        :return: The new list.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = PersistentList([1, 2, 3])
+        >>> my_list.remove(1), my_list
+        ([1, 3], [1, 2, 3])
+        """
+        return self._replace(self._index(index), 1, ())
+
+    def reverse(self):
+        """Returns a new, reversed list.
+
+        :return: The new list.
+
+        >>> my_list = PersistentList([1, 2, 3])
+        >>> my_list.reverse()
+        [3, 2, 1]
+        """
+        head = None
+        for data in self:
+            head = (data, head)
+
+        return PersistentList._make(head, self._size)
+
+    def set(self, index: int, data):
+        """Returns a new list with the element at the given index replaced by the data.
+        The elements after the index are shared with the list, so only the cells before it are copied.
+
+        :param index: The index to replace.
+        :param data: The data.
+        :return: The new list.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = PersistentList([1, 0, 3])
+        >>> my_list.set(1, 2), my_list
+        ([1, 2, 3], [1, 0, 3])
+        """
+        return self._replace(self._index(index), 1, (data,))
+
+    def tail(self):
+        """Returns the list without its first element. This is O(1), as every cell is shared.
+
+        :return: The new list.
+        :exception: IndexError is raised if the list is empty.
+
+        >>> my_list = PersistentList([1, 2, 3])
+        >>> my_list.tail(), my_list
+        ([2, 3], [1, 2, 3])
+        """
+        if self._head is None:
+            raise IndexError("list is empty")
+
+        return PersistentList._make(self._head[1], self._size - 1)
+
+    def to_linked_list(self) -> SinglyLinkedList:
+        """Returns a mutable SinglyLinkedList with the elements of the list.
+
+        :return: The SinglyLinkedList.
+
+        >>> my_list = PersistentList([1, 2, 3])
+        >>> my_list.to_linked_list()
+        [1, 2, 3]
+        """
+        return SinglyLinkedList(self)
+
+    def transient(self):
+        """Returns a TransientList holding the elements of the list, for changing in bulk.
+
+        :return: The TransientList.
+
+        >>> my_list = PersistentList([1, 2])
+        >>> builder = my_list.transient()
+        >>> builder.extend([3, 4])
+        >>> builder.persistent(), my_list
+        ([1, 2, 3, 4], [1, 2])
+        """
+        return TransientList(self)
+
+    def _cell_at(self, index: int):
+        cell = self._head
+        for i in range(index):
+            cell = cell[1]
+
+        return cell
+
+    def _index(self, index: int) -> int:
+        if index < -self._size or index >= self._size:
+            raise IndexError("index is out of range")
+
+        return self._size + index if index < 0 else index
+
+    def _replace(self, index: int, count: int, elements: tuple):
+        """Returns a new list with 'count' elements at the index replaced by the elements.
+        The cells before the index are copied, and the cells after the replaced elements are shared.
+        """
+        prefix = []
+        cell = self._head
+        for i in range(index):
+            prefix.append(cell[0])
+            cell = cell[1]
+
+        for i in range(count):
+            cell = cell[1]
+
+        for data in reversed(elements):
+            cell = (data, cell)
+        for data in reversed(prefix):
+            cell = (data, cell)
+
+        return PersistentList._make(cell, self._size - count + len(elements))
+
+
+class TransientList:
+    """A mutable builder for a PersistentList.
+
+    Elements can be prepended, appended and extended in O(1) each, and persistent() then returns them as a
+    PersistentList in one pass. The cells of the list the builder started from are shared with the result when
+    nothing has been appended, otherwise they are copied once.
+    """
+
+    def __init__(self, persistent_list: PersistentList = None):
+        """Instantiates a new instance of a TransientList.
+
+        :param persistent_list: Optional. The list to start from.
+
+        >>> builder = TransientList()
+        >>> builder.append(2)
+        >>> builder.prepend(1)
+        >>> builder.persistent()
+        [1, 2]
+        """
+        self._base = PersistentList() if persistent_list is None else persistent_list
+        self._front = []
+        self._back = []
+
+    def __len__(self):
+        return len(self._front) + self._base.size + len(self._back)
+
+    def __repr__(self):
+        return str(self._front[::-1] + list(self._base) + self._back)
+
+    @property
+    def size(self):
+        """Returns the size of the list being built.
+
+        :return: The size.
+
+        >>> builder = PersistentList([1, 2]).transient()
+        >>> builder.append(3)
+        >>> builder.size
+        3
+        """
+        return len(self)
+
+    def append(self, data):
+        """Appends the data to the end of the list being built.
+
+        :param data: The data to append.
+        """
+        self._back.append(data)
+
+    def extend(self, other):
+        """Extends the list being built with the elements of another.
+
+        :param other: An iterable to extend the list with.
+        :exception: TypeError is raised if 'other' is not iterable.
+        """
+        self._back.extend(other)
+
+    def prepend(self, data):
+        """Prepends the data to the beginning of the list being built.
+
+        :param data: The data to prepend.
+        """
+        self._front.append(data)
+
+    def persistent(self) -> PersistentList:
+        """Returns a PersistentList of the elements. The builder can carry on being used afterwards.
+
+        :return: The PersistentList.
+
+        >>> builder = TransientList()
+        >>> builder.extend(range(3))
+        >>> first = builder.persistent()
+        >>> builder.prepend(-1)
+        >>> first, builder.persistent()
+        ([0, 1, 2], [-1, 0, 1, 2])
+        """
+        base = self._base
+
+        head = None
+        for data in reversed(self._back):
+            head = (data, head)
+        if self._back:
+            head = _cons(base, head)
+        else:
+            head = base._head
+        for data in self._front:
+            head = (data, head)
+
+        self._base = PersistentList._make(head, len(self))
+        self._front = []
+        self._back = []
+
+        return self._base
+
+
+def _cons(persistent_list: PersistentList, rest):
+    """Returns a chain of new cells holding the elements of the list, followed by the 'rest' cells."""
+    elements = list(persistent_list)
+
+    for data in reversed(elements):
+        rest = (data, rest)
+
+    return rest
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
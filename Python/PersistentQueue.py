@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018 Jared Gillespie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import collections
+import mmap
+import os
+import pickle
+import struct
+
+_RECORD_HEADER = struct.Struct('<I')
+_SEGMENT_SUFFIX = '.seg'
+_CHECKPOINT_NAME = 'checkpoint'
+
+
+class PersistentQueue:
+    """A queue which supports inserting and removing items in a FIFO manner, backed by files on disk.
+
+    Items are pickled and appended to fixed-size segment files in the given directory. Segments are
+    read back in batches through a memory map and deleted once every item in them has been consumed.
+    The read position is stored in a checkpoint file, and on restart the queue resumes from the last
+    checkpoint. Items retrieved after the last checkpoint are delivered again after a crash.
+
+    In hybrid mode ('memory_threshold' > 0) the head of the queue is held in memory, and items only
+    spill to disk once the threshold is exceeded. Items held in memory are written into the checkpoint,
+    so they survive a clean close, but those put since the last checkpoint are lost in a crash.
+    """
+
+    def __init__(self, directory: str, segment_size: int = 1 << 24, fsync_every: int = 1000,
+                 checkpoint_every: int = 1000, batch_size: int = 1000, memory_threshold: int = 0):
+        """Instantiates a new instance of a PersistentQueue.
+
+        :param directory: The directory to store segments in. Created if it doesn't exist.
+        :param segment_size: Optional. The size in bytes after which a new segment is started.
+        :param fsync_every: Optional. The number of puts after which segments are synced to disk.
+        :param checkpoint_every: Optional. The number of gets after which the read position is checkpointed.
+        :param batch_size: Optional. The number of items read from disk at a time.
+        :param memory_threshold: Optional. The number of items held in memory before spilling to disk.
+        :exception: ValueError is raised if a size or count is out of range.
+
+        >>> import tempfile
+        >>> directory = tempfile.mkdtemp()
+        >>> my_queue = PersistentQueue(directory)
+        >>> my_queue.put(1)
+        >>> my_queue.put(2)
+        >>> my_queue.close()
+        >>> my_queue = PersistentQueue(directory)
+        >>> my_queue.get(), my_queue.size
+        (1, 1)
+        >>> my_queue.close()
+
+        >>> directory = tempfile.mkdtemp()
+        >>> my_queue = PersistentQueue(directory, memory_threshold=3)
+        >>> for i in range(5):
+        ...     my_queue.put(i)
+        >>> my_queue.close()
+        >>> my_queue = PersistentQueue(directory, memory_threshold=3)
+        >>> [my_queue.get() for i in range(my_queue.size)]
+        [0, 1, 2, 3, 4]
+        >>> my_queue.close()
+        """
+        if segment_size < 1:
+            raise ValueError("segment_size must be > 0")
+
+        if fsync_every < 1 or checkpoint_every < 1 or batch_size < 1:
+            raise ValueError("fsync_every, checkpoint_every and batch_size must be > 0")
+
+        if memory_threshold < 0:
+            raise ValueError("memory_threshold must be >= 0")
+
+        self._directory = directory
+        self._segment_size = segment_size
+        self._fsync_every = fsync_every
+        self._checkpoint_every = checkpoint_every
+        self._batch_size = batch_size
+        self._memory_threshold = memory_threshold
+
+        # Items read from disk, or put in memory, and not yet retrieved
+        # Each entry is (item, segment, offset), where segment is None for in-memory items
+        self._buffer = collections.deque()
+        self._disk_unread = 0
+        self._unsynced = 0
+        self._unchecked = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return 'PersistentQueue(%r, size=%d)' % (self._directory, self.size)
+
+    @property
+    def size(self):
+        """Returns the size of the queue.
+
+        :return: The size.
+
+        >>> import tempfile
+        >>> my_queue = PersistentQueue(tempfile.mkdtemp())
+        >>> my_queue.put('a')
+        >>> my_queue.size
+        1
+        >>> my_queue.close()
+        """
+        return len(self._buffer) + self._disk_unread
+
+    def is_empty(self) -> bool:
+        """Returns True if the queue is empty, otherwise False.
+
+        :return: A boolean indicating whether the queue is empty.
+
+        >>> import tempfile
+        >>> my_queue = PersistentQueue(tempfile.mkdtemp())
+        >>> my_queue.is_empty()
+        True
+        >>> my_queue.close()
+        """
+        return self.size == 0
+
+    def put(self, data):
+        """Inserts an element at the end of the queue.
+
+        :param data: The data. Must be picklable.
+
+        >>> import tempfile
+        >>> my_queue = PersistentQueue(tempfile.mkdtemp())
+        >>> my_queue.put(1)
+        >>> my_queue.put(2)
+        >>> my_queue.peek()
+        1
+        >>> my_queue.close()
+        """
+        if self._disk_unread == 0 and len(self._buffer) < self._memory_threshold:
+            self._buffer.append((data, None, 0))
+            return
+
+        record = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+        if self._write_offset > 0 and self._write_offset + _RECORD_HEADER.size + len(record) > self._segment_size:
+            self._roll_segment()
+
+        self._writer.write(_RECORD_HEADER.pack(len(record)))
+        self._writer.write(record)
+        self._write_offset += _RECORD_HEADER.size + len(record)
+        self._disk_unread += 1
+
+        self._unsynced += 1
+        if self._unsynced >= self._fsync_every:
+            self.flush()
+
+    def get(self):
+        """Retrieves and removes the element at the front of the queue.
+
+        :return: The retrieved data.
+        :exception: IndexError is raised if the queue is empty.
+
+        >>> import tempfile
+        >>> my_queue = PersistentQueue(tempfile.mkdtemp())
+        >>> my_queue.put(1)
+        >>> my_queue.put(2)
+        >>> my_queue.get(), my_queue.size
+        (1, 1)
+        >>> my_queue.close()
+        """
+        if not self._buffer:
+            self._fill()
+
+            if not self._buffer:
+                raise IndexError('queue is empty')
+
+        data, segment, offset = self._buffer.popleft()
+
+        if segment is not None:
+            previous_segment = self._consumed_segment
+            self._consumed_segment = segment
+            self._consumed_offset = offset
+
+            self._unchecked += 1
+            if segment != previous_segment or self._unchecked >= self._checkpoint_every:
+                self.checkpoint()
+
+        return data
+
+    def peek(self):
+        """Retrieves the element at the front of the queue.
+
+        :return: The retrieved data.
+        :exception: IndexError is raised if the queue is empty.
+
+        >>> import tempfile
+        >>> my_queue = PersistentQueue(tempfile.mkdtemp())
+        >>> my_queue.put(1)
+        >>> my_queue.peek(), my_queue.size
+        (1, 1)
+        >>> my_queue.close()
+        """
+        if not self._buffer:
+            self._fill()
+
+            if not self._buffer:
+                raise IndexError('queue is empty')
+
+        return self._buffer[0][0]
+
+    def checkpoint(self):
+        """Durably records the read position, and deletes segments which have been fully consumed.
+        Items held in memory are recorded too, along with any items read from disk ahead of them.
+        """
+        head = []
+
+        # Items held in memory always come after any read from disk, and before any still on disk. So they're
+        # recorded with every buffered item ahead of them, and the position after the buffered items.
+        if self._buffer and self._buffer[-1][1] is None:
+            head = [data for data, segment, offset in self._buffer]
+            self._buffer = collections.deque((data, None, 0) for data in head)
+            self._consumed_segment = self._read_segment
+            self._consumed_offset = self._read_offset
+
+        path = os.path.join(self._directory, _CHECKPOINT_NAME)
+        temp_path = path + '.tmp'
+
+        with open(temp_path, 'wb') as f:
+            f.write(b'%d %d\n' % (self._consumed_segment, self._consumed_offset))
+            if head:
+                pickle.dump(head, f, pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(temp_path, path)
+        self._unchecked = 0
+
+        for segment in self._list_segments():
+            if segment >= self._consumed_segment:
+                break
+
+            os.remove(self._segment_path(segment))
+
+    def close(self):
+        """Syncs pending writes, records the read position and closes the queue."""
+        if self._writer.closed:
+            return
+
+        self.flush()
+        self.checkpoint()
+        self._writer.close()
+
+    def flush(self):
+        """Syncs pending writes to disk."""
+        self._writer.flush()
+        os.fsync(self._writer.fileno())
+        self._unsynced = 0
+
+    def _fill(self):
+        if self._disk_unread == 0:
+            return
+
+        if self._read_segment == self._write_segment:
+            self._writer.flush()
+
+        count = 0
+        while count < self._batch_size and self._disk_unread > 0:
+            path = self._segment_path(self._read_segment)
+            length = os.path.getsize(path)
+
+            if self._read_offset >= length:
+                # Segment exhausted, move on to the next one
+                self._read_segment += 1
+                self._read_offset = 0
+
+                if self._read_segment == self._write_segment:
+                    self._writer.flush()
+                continue
+
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ) as m:
+                offset = self._read_offset
+
+                while count < self._batch_size and offset < length:
+                    record_length, = _RECORD_HEADER.unpack_from(m, offset)
+                    start = offset + _RECORD_HEADER.size
+                    offset = start + record_length
+
+                    self._buffer.append((pickle.loads(m[start:offset]), self._read_segment, offset))
+                    self._disk_unread -= 1
+                    count += 1
+
+                self._read_offset = offset
+
+    def _list_segments(self):
+        return sorted(int(name[:-len(_SEGMENT_SUFFIX)]) for name in os.listdir(self._directory)
+                      if name.endswith(_SEGMENT_SUFFIX))
+
+    def _recover(self):
+        self._consumed_segment, self._consumed_offset = 0, 0
+
+        path = os.path.join(self._directory, _CHECKPOINT_NAME)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                self._consumed_segment, self._consumed_offset = (int(v) for v in f.readline().split())
+
+                # Items which were held in memory are at the front of the queue
+                head = f.read()
+                if head:
+                    self._buffer.extend((data, None, 0) for data in pickle.loads(head))
+
+        segments = [s for s in self._list_segments() if s >= self._consumed_segment]
+
+        # Count the records after the checkpoint, truncating a partially written trailing record
+        for segment in segments:
+            offset = self._consumed_offset if segment == self._consumed_segment else 0
+            segment_path = self._segment_path(segment)
+            length = os.path.getsize(segment_path)
+
+            with open(segment_path, 'rb') as f:
+                while offset + _RECORD_HEADER.size <= length:
+                    f.seek(offset)
+                    record_length, = _RECORD_HEADER.unpack(f.read(_RECORD_HEADER.size))
+                    if offset + _RECORD_HEADER.size + record_length > length:
+                        break
+
+                    offset += _RECORD_HEADER.size + record_length
+                    self._disk_unread += 1
+
+            if offset < length:
+                os.truncate(segment_path, offset)
+
+        self._read_segment = self._consumed_segment
+        self._read_offset = self._consumed_offset
+        self._write_segment = segments[-1] if segments else self._consumed_segment
+        self._writer = open(self._segment_path(self._write_segment), 'ab')
+        self._write_offset = self._writer.tell()
+
+        self.checkpoint()
+
+    def _roll_segment(self):
+        self.flush()
+        self._writer.close()
+
+        self._write_segment += 1
+        self._writer = open(self._segment_path(self._write_segment), 'ab')
+        self._write_offset = 0
+
+    def _segment_path(self, segment: int):
+        return os.path.join(self._directory, '%020d%s' % (segment, _SEGMENT_SUFFIX))
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018 Jared Gillespie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from Stack import Stack, TypedStack
+
+
+class PersistentStack:
+    """An immutable stack which supports inserting and removing items in a FILO manner.
+
+    The stack is a chain of (data, rest) cells. Inserting or removing an item returns a new version of
+    the stack in O(1), which shares every cell below the front with the version it came from, so
+    copying a stack is free and any number of versions can be kept at the cost of their differences.
+    """
+
+    __slots__ = ('_head', '_size')
+
+    def __init__(self, elements=None):
+        """Instantiates a new instance of a PersistentStack.
+
+        :param elements: Optional. The elements initialize with.
+        :exception: TypeError is raised if 'elements' is not iterable.
+
+        >>> my_stack = PersistentStack()
+        >>> my_stack
+        []
+
+        The front of the stack is the left-most element.
+        >>> my_stack = PersistentStack([3, 4, 5])
+        >>> my_stack
+        [3, 4, 5]
+        """
+        head = None
+        size = 0
+
+        if elements is not None:
+            for data in reversed(list(elements)):
+                head = (data, head)
+                size += 1
+
+        self._head = head
+        self._size = size
+
+    def __contains__(self, item) -> bool:
+        for data in self:
+            if data == item:
+                return True
+
+        return False
+
+    def __eq__(self, other):
+        if isinstance(other, PersistentStack):
+            if self._size != other._size:
+                return False
+
+            self_cell, other_cell = self._head, other._head
+            while self_cell is not other_cell:
+                if self_cell[0] != other_cell[0]:
+                    return False
+                self_cell, other_cell = self_cell[1], other_cell[1]
+
+            return True
+        else:
+            return NotImplemented
+
+    def __iter__(self):
+        cell = self._head
+        while cell is not None:
+            yield cell[0]
+            cell = cell[1]
+
+    def __len__(self):
+        return self._size
+
+    def __reduce__(self):
+        """Pickles the elements as a flat list, rather than the nested cells, so deep stacks don't hit the recursion limit.
+
+        >>> import pickle
+        >>> my_stack = PersistentStack(range(100000))
+        >>> pickle.loads(pickle.dumps(my_stack)) == my_stack
+        True
+        """
+        return PersistentStack, (list(self),)
+
+    def __repr__(self):
+        return str(list(self))
+
+    @classmethod
+    def from_stack(cls, stack: Stack):
+        """Creates a persistent stack with the elements of a Stack.
+
+        :param stack: The Stack.
+        :return: The persistent stack.
+
+        >>> PersistentStack.from_stack(Stack([1, 2, 3]))
+        [1, 2, 3]
+        """
+        elements = stack._array if isinstance(stack, TypedStack) else stack._elements
+
+        # The front of a Stack is the end of its elements, so the cells can be built bottom up
+        head = None
+        for data in elements:
+            head = (data, head)
+
+        return cls._make(head, len(elements))
+
+    @classmethod
+    def _make(cls, head, size: int):
+        stack = cls.__new__(cls)
+        stack._head = head
+        stack._size = size
+
+        return stack
+
+    @property
+    def size(self):
+        """Returns the size of the stack.
+
+        :return: The size.
+
+        >>> my_stack = PersistentStack([1, 2, 3])
+        >>> my_stack.size
+        3
+        """
+        return self._size
+
+    def copy(self):
+        """Returns a copy of the stack. As the stack is immutable, this is the stack itself.
+
+        :return: A copy of the stack.
+
+        >>> my_stack = PersistentStack([1, 2, 3])
+        >>> my_stack.copy() is my_stack
+        True
+        """
+        return self
+
+    def is_empty(self) -> bool:
+        """Returns True if the stack is empty, otherwise False.
+
+        :return: A boolean indicating whether the stack is empty.
+
+        >>> my_stack = PersistentStack()
+        >>> my_stack.is_empty()
+        True
+
+        >>> my_stack = PersistentStack([1])
+        >>> my_stack.is_empty()
+        False
+        """
+        return self._size == 0
+
+    def push(self, data):
+        """Returns a new stack with the element inserted at the front.
+
+        :param data: The data.
+        :return: The new stack.
+
+        >>> my_stack = PersistentStack([2, 3])
+        >>> my_stack.push(1), my_stack
+        ([1, 2, 3], [2, 3])
+        """
+        return PersistentStack._make((data, self._head), self._size + 1)
+
+    def pop(self):
+        """Returns a new stack with the element at the front removed.
+
+        :return: The new stack.
+        :exception: IndexError is raised if the stack is empty.
+
+        >>> my_stack = PersistentStack([1, 2, 3])
+        >>> my_stack.pop(), my_stack
+        ([2, 3], [1, 2, 3])
+        """
+        if self._head is None:
+            raise IndexError('stack is empty')
+
+        return PersistentStack._make(self._head[1], self._size - 1)
+
+    def peek(self):
+        """Retrieves the element at the front of the stack.
+
+        :return: The retrieved data.
+        :exception: IndexError is raised if the stack is empty.
+
+        >>> my_stack = PersistentStack([1, 2])
+        >>> my_stack.peek()
+        1
+        """
+        if self._head is None:
+            raise IndexError('stack is empty')
+
+        return self._head[0]
+
+    def reverse(self):
+        """Returns a new, reversed stack.
+
+        :return: The new stack.
+
+        >>> my_stack = PersistentStack([1, 2, 3])
+        >>> my_stack.reverse()
+        [3, 2, 1]
+        """
+        head = None
+        for data in self:
+            head = (data, head)
+
+        return PersistentStack._make(head, self._size)
+
+    def to_stack(self, typecode: str = None) -> Stack:
+        """Returns a mutable Stack with the elements of the stack.
+
+        :param typecode: Optional. An array typecode. If given, a TypedStack is returned.
+        :return: The Stack.
+
+        >>> my_stack = PersistentStack([1, 2, 3])
+        >>> my_stack.to_stack()
+        [1, 2, 3]
+        """
+        return Stack(self, typecode=typecode)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
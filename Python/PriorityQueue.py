@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018 Jared Gillespie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+class PriorityQueue:
+    """A queue which supports inserting items with a priority and removing them lowest priority first.
+
+    The queue is backed by an array-based d-ary heap. The position of every item in the heap is indexed,
+    which allows the priority of a queued item to be changed, or the item to be removed, in O(log n).
+    Items must therefore be hashable and unique within the queue.
+    """
+
+    def __init__(self, elements=None, d: int = 2):
+        """Instantiates a new instance of a PriorityQueue.
+
+        :param elements: Optional. The (item, priority) pairs to initialize with.
+        :param d: Optional. The number of children per heap node.
+        :exception: TypeError is raised if 'elements' is not iterable.
+        :exception: ValueError is raised if 'd' is < 2 or an item appears more than once.
+
+        >>> my_queue = PriorityQueue()
+        >>> my_queue
+        []
+
+        The front of the queue is the left-most element.
+        >>> my_queue = PriorityQueue([('a', 3), ('b', 1), ('c', 2)])
+        >>> my_queue
+        [('b', 1), ('a', 3), ('c', 2)]
+        """
+        if d < 2:
+            raise ValueError("d must be >= 2")
+
+        self._d = d
+        self._items = []
+        self._priorities = []
+        self._index = dict()
+
+        if elements is not None:
+            for item, priority in elements:
+                if item in self._index:
+                    raise ValueError("item already in queue")
+
+                self._index[item] = len(self._items)
+                self._items.append(item)
+                self._priorities.append(priority)
+
+            self._heapify()
+
+    def __contains__(self, item) -> bool:
+        return item in self._index
+
+    def __eq__(self, other):
+        if isinstance(other, PriorityQueue):
+            return sorted(zip(self._priorities, self._items)) == sorted(zip(other._priorities, other._items))
+        else:
+            return NotImplemented
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return str(list(zip(self._items, self._priorities)))
+
+    @property
+    def size(self):
+        """Returns the size of the queue.
+
+        :return: The size.
+
+        >>> my_queue = PriorityQueue()
+        >>> my_queue.size
+        0
+
+        >>> my_queue = PriorityQueue([('a', 1), ('b', 2)])
+        >>> my_queue.size
+        2
+        """
+        return len(self._items)
+
+    def copy(self):
+        """Returns a copy of the queue.
+
+        :return: A copy of the queue.
+
+        >>> my_queue = PriorityQueue([('a', 2), ('b', 1)])
+        >>> my_queue.copy()
+        [('b', 1), ('a', 2)]
+        """
+        queue_copy = PriorityQueue(d=self._d)
+        queue_copy._items = self._items[:]
+        queue_copy._priorities = self._priorities[:]
+        queue_copy._index = self._index.copy()
+
+        return queue_copy
+
+    def is_empty(self) -> bool:
+        """Returns True if the queue is empty, otherwise False.
+
+        :return: A boolean indicating whether the queue is empty.
+
+        >>> my_queue = PriorityQueue()
+        >>> my_queue.is_empty()
+        True
+
+        >>> my_queue = PriorityQueue([('a', 1)])
+        >>> my_queue.is_empty()
+        False
+        """
+        return len(self._items) == 0
+
+    def priority(self, item):
+        """Returns the priority of an item in the queue.
+
+        :param item: The item.
+        :return: The priority.
+        :exception: KeyError is raised if the item is not in the queue.
+
+        >>> my_queue = PriorityQueue([('a', 4)])
+        >>> my_queue.priority('a')
+        4
+        """
+        return self._priorities[self._index[item]]
+
+    def put(self, item, priority):
+        """Inserts an item into the queue with the given priority.
+
+        :param item: The item.
+        :param priority: The priority. Lower priorities are retrieved first.
+        :exception: ValueError is raised if the item is already in the queue.
+
+        >>> my_queue = PriorityQueue()
+        >>> my_queue.put('a', 2)
+        >>> my_queue.put('b', 1)
+        >>> my_queue
+        [('b', 1), ('a', 2)]
+        """
+        if item in self._index:
+            raise ValueError("item already in queue")
+
+        pos = len(self._items)
+        self._items.append(item)
+        self._priorities.append(priority)
+        self._index[item] = pos
+        self._sift_up(pos)
+
+    def get(self):
+        """Retrieves and removes the item with the lowest priority.
+
+        :return: The retrieved item.
+        :exception: IndexError is raised if the queue is empty.
+
+        >>> my_queue = PriorityQueue([('a', 2), ('b', 1)])
+        >>> my_queue.get(), my_queue
+        ('b', [('a', 2)])
+        """
+        if len(self._items) == 0:
+            raise IndexError('queue is empty')
+
+        last_item = self._items.pop()
+        last_priority = self._priorities.pop()
+
+        if len(self._items) == 0:
+            del self._index[last_item]
+            return last_item
+
+        item = self._items[0]
+        del self._index[item]
+
+        self._items[0] = last_item
+        self._priorities[0] = last_priority
+        self._index[last_item] = 0
+        self._sift_down(0)
+
+        return item
+
+    def peek(self):
+        """Retrieves the item with the lowest priority.
+
+        :return: The retrieved item.
+        :exception: IndexError is raised if the queue is empty.
+
+        >>> my_queue = PriorityQueue([('a', 2), ('b', 1)])
+        >>> my_queue.peek(), my_queue
+        ('b', [('b', 1), ('a', 2)])
+        """
+        if len(self._items) == 0:
+            raise IndexError('queue is empty')
+
+        return self._items[0]
+
+    def push_pop(self, item, priority):
+        """Inserts an item and then retrieves and removes the item with the lowest priority.
+
+        This is faster than a put followed by a get, as the heap is sifted at most once.
+
+        :param item: The item to insert.
+        :param priority: The priority of the item to insert.
+        :return: The retrieved item.
+        :exception: ValueError is raised if the item is already in the queue.
+
+        >>> my_queue = PriorityQueue([('a', 2), ('b', 3)])
+        >>> my_queue.push_pop('c', 1), my_queue
+        ('c', [('a', 2), ('b', 3)])
+
+        >>> my_queue.push_pop('d', 4), my_queue
+        ('a', [('b', 3), ('d', 4)])
+        """
+        if item in self._index:
+            raise ValueError("item already in queue")
+
+        if len(self._items) == 0 or not self._priorities[0] < priority:
+            return item
+
+        top = self._items[0]
+        del self._index[top]
+
+        self._items[0] = item
+        self._priorities[0] = priority
+        self._index[item] = 0
+        self._sift_down(0)
+
+        return top
+
+    def remove(self, item):
+        """Removes an item from the queue.
+
+        :param item: The item to remove.
+        :exception: KeyError is raised if the item is not in the queue.
+
+        >>> my_queue = PriorityQueue([('a', 1), ('b', 2), ('c', 3)])
+        >>> my_queue.remove('b')
+        >>> my_queue
+        [('a', 1), ('c', 3)]
+        """
+        pos = self._index.pop(item)
+
+        last_item = self._items.pop()
+        last_priority = self._priorities.pop()
+
+        if pos == len(self._items):
+            return
+
+        self._items[pos] = last_item
+        self._priorities[pos] = last_priority
+        self._index[last_item] = pos
+
+        if pos > 0 and last_priority < self._priorities[(pos - 1) // self._d]:
+            self._sift_up(pos)
+        else:
+            self._sift_down(pos)
+
+    def update_priority(self, item, priority):
+        """Changes the priority of an item in the queue.
+
+        :param item: The item.
+        :param priority: The new priority.
+        :exception: KeyError is raised if the item is not in the queue.
+
+        >>> my_queue = PriorityQueue([('a', 1), ('b', 2), ('c', 3)])
+        >>> my_queue.update_priority('c', 0)
+        >>> my_queue.peek()
+        'c'
+
+        >>> my_queue.update_priority('c', 5)
+        >>> my_queue.peek()
+        'a'
+        """
+        pos = self._index[item]
+        old_priority = self._priorities[pos]
+        self._priorities[pos] = priority
+
+        if priority < old_priority:
+            self._sift_up(pos)
+        else:
+            self._sift_down(pos)
+
+    def _heapify(self):
+        if len(self._items) < 2:
+            return
+
+        for pos in range((len(self._items) - 2) // self._d, -1, -1):
+            self._sift_down(pos)
+
+    def _sift_up(self, pos: int):
+        items, priorities, index, d = self._items, self._priorities, self._index, self._d
+
+        item = items[pos]
+        priority = priorities[pos]
+
+        # Shift parents down until the hole is in place, then drop the item in
+        while pos > 0:
+            parent = (pos - 1) // d
+            if not priority < priorities[parent]:
+                break
+
+            items[pos] = items[parent]
+            priorities[pos] = priorities[parent]
+            index[items[pos]] = pos
+            pos = parent
+
+        items[pos] = item
+        priorities[pos] = priority
+        index[item] = pos
+
+    def _sift_down(self, pos: int):
+        items, priorities, index, d = self._items, self._priorities, self._index, self._d
+
+        size = len(items)
+        item = items[pos]
+        priority = priorities[pos]
+
+        # Shift the smallest child up until the hole is in place, then drop the item in
+        while True:
+            first = pos * d + 1
+            if first >= size:
+                break
+
+            child = first
+            child_priority = priorities[first]
+            for i in range(first + 1, min(first + d, size)):
+                if priorities[i] < child_priority:
+                    child = i
+                    child_priority = priorities[i]
+
+            if not child_priority < priority:
+                break
+
+            items[pos] = items[child]
+            priorities[pos] = child_priority
+            index[items[pos]] = pos
+            pos = child
+
+        items[pos] = item
+        priorities[pos] = priority
+        index[item] = pos
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
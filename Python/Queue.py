@@ -21,14 +21,32 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import array
+import struct
+import sys
+
+from CopyOnWriteList import CopyOnWriteList
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, and only needed for to_numpy()
+    numpy = None
+
 
 class Queue:
     """A queue which supports inserting and removing items in a FIFO manner."""
 
-    def __init__(self, elements=None):
+    def __new__(cls, elements=None, typecode=None):
+        if cls is Queue and typecode is not None:
+            cls = TypedQueue
+
+        return super().__new__(cls)
+
+    def __init__(self, elements=None, typecode=None):
         """Instantiates a new instance of a Queue.
 
         :param elements: Optional. The elements initialize with.
+        :param typecode: Optional. An array typecode. If given, a compact TypedQueue is created instead.
         :exception: TypeError is raised if 'elements' is not iterable.
 
         >>> my_queue = Queue()
@@ -40,7 +58,7 @@ class Queue:
         >>> my_queue
         [3, 4, 5]
         """
-        self._elements = [] if elements is None else [e for e in elements]
+        self._elements = CopyOnWriteList(_elements_of(elements))
 
     def __contains__(self, item) -> bool:
         return item in self._elements
@@ -72,6 +90,7 @@ class Queue:
 
     def copy(self):
         """Returns a copy of the queue.
+        The copy shares storage with the queue, and only copies the chunks which either of them changes.
 
         :return: A copy of the queue.
 
@@ -83,7 +102,10 @@ class Queue:
         >>> my_queue.copy()
         [1, 2, 3]
         """
-        return Queue(self._elements[:])
+        queue_copy = Queue()
+        queue_copy._elements = self._elements.copy()
+
+        return queue_copy
 
     def is_empty(self) -> bool:
         """Returns True if the queue is empty, otherwise False.
@@ -145,6 +167,39 @@ class Queue:
 
         return self._elements[-1]
 
+    def put_many(self, data):
+        """Inserts each element of the data at the end of the queue, in order.
+
+        :param data: An iterable of data. An ndarray's elements are read as Python objects, in C order.
+
+        >>> my_queue = Queue([4])
+        >>> my_queue.put_many([3, 2, 1])
+        >>> my_queue
+        [1, 2, 3, 4]
+        """
+        for d in _elements_of(data):
+            self._elements.insert(0, d)
+
+    def get_many(self, n: int = None):
+        """Retrieves and removes up to n elements from the front of the queue.
+
+        :param n: Optional. The maximum number of elements to retrieve. Retrieves all if not given.
+        :return: A list of the retrieved data, front first.
+
+        >>> my_queue = Queue([1, 2, 3, 4])
+        >>> my_queue.get_many(3), my_queue
+        ([4, 3, 2], [1])
+        """
+        n = len(self._elements) if n is None else min(n, len(self._elements))
+        if n <= 0:
+            return []
+
+        data = self._elements[-n:]
+        del self._elements[-n:]
+        data.reverse()
+
+        return data
+
     def reverse(self):
         """Reverses the queue.
 
@@ -153,7 +208,365 @@ class Queue:
         >>> my_queue
         [3, 2, 1]
         """
-        self._elements[:] = self._elements [::-1]
+        self._elements.reverse()
+
+    @classmethod
+    def from_numpy(cls, arr, typecode=None):
+        """Returns a new queue of the elements of an ndarray, or any buffer-protocol object, in C order.
+        The front of the queue is the last element, as for the constructor.
+
+        :param arr: The ndarray.
+        :param typecode: Optional. An array typecode. If given, a TypedQueue is created, copying the buffer directly.
+        :return: The queue.
+        :exception: TypeError is raised if an element doesn't fit the typecode.
+
+        >>> Queue.from_numpy(array.array('q', [1, 2, 3]), typecode='q')
+        [1, 2, 3]
+        """
+        return cls(arr, typecode=typecode)
+
+    def to_numpy(self, dtype=None):
+        """Returns an ndarray of the elements, in the order the queue is shown, i.e. with the front last.
+
+        :param dtype: Optional. The dtype of the ndarray. Without it, numpy infers one from a temporary list.
+        :return: The ndarray.
+        :exception: ImportError is raised if numpy isn't installed.
+
+        >>> numpy is None or Queue([1, 2, 3]).to_numpy('q').tolist() == [1, 2, 3]
+        True
+        """
+        return _to_numpy(self._elements, len(self._elements), dtype)
+
+
+class TypedQueue(Queue):
+    """A queue of numbers which supports inserting and removing items in a FIFO manner.
+
+    The numbers are stored unboxed in an array.array ring buffer of the given typecode, rather than as
+    Python objects in a list. Bulk operations accept and return arrays, or any buffer-protocol object
+    of a matching item type, without per-element overhead.
+    """
+
+    def __init__(self, elements=None, typecode=None):
+        """Instantiates a new instance of a TypedQueue.
+
+        :param elements: Optional. The elements initialize with.
+        :param typecode: The array typecode of the elements, e.g. 'q' or 'd'.
+        :exception: TypeError is raised if 'elements' is not iterable, or an element doesn't fit the typecode.
+        :exception: ValueError is raised if 'typecode' is not a valid typecode.
+
+        >>> my_queue = Queue(typecode='q')
+        >>> my_queue
+        []
+
+        The front of the queue is the right-most element.
+        >>> my_queue = Queue([3, 4, 5], typecode='q')
+        >>> my_queue
+        [3, 4, 5]
+        """
+        if typecode is None:
+            raise ValueError("typecode is required")
+
+        self._array = array.array(typecode)
+        self._head = 0
+        self._size = 0
+
+        if elements is not None:
+            data = _as_array(elements, typecode)
+            data.reverse()
+            self.put_many(data)
+
+    def __contains__(self, item) -> bool:
+        return item in self._ordered()
+
+    def __eq__(self, other):
+        if isinstance(other, TypedQueue):
+            return self._ordered() == other._ordered()
+        elif isinstance(other, Queue):
+            return self._ordered().tolist() == other._elements[::-1]
+        else:
+            return NotImplemented
+
+    def __repr__(self):
+        return str(self._ordered().tolist()[::-1])
+
+    @property
+    def size(self):
+        """Returns the size of the queue.
+
+        :return: The size.
+
+        >>> my_queue = Queue([1, 2, 3], typecode='q')
+        >>> my_queue.size
+        3
+        """
+        return self._size
+
+    @property
+    def typecode(self):
+        return self._array.typecode
+
+    def copy(self):
+        """Returns a copy of the queue.
+
+        :return: A copy of the queue.
+
+        >>> my_queue = Queue([1, 2, 3], typecode='q')
+        >>> my_queue.copy()
+        [1, 2, 3]
+        """
+        queue_copy = TypedQueue(typecode=self._array.typecode)
+        queue_copy.put_many(self._ordered())
+
+        return queue_copy
+
+    def is_empty(self) -> bool:
+        """Returns True if the queue is empty, otherwise False.
+
+        :return: A boolean indicating whether the queue is empty.
+
+        >>> my_queue = Queue(typecode='d')
+        >>> my_queue.is_empty()
+        True
+        """
+        return self._size == 0
+
+    def put(self, data):
+        """Inserts an element at the end of the queue.
+
+        :param data: The data.
+        :exception: TypeError is raised if the data doesn't fit the typecode.
+
+        >>> my_queue = Queue([2, 3, 4], typecode='q')
+        >>> my_queue.put(1)
+        >>> my_queue
+        [1, 2, 3, 4]
+        """
+        if self._size == len(self._array):
+            self._grow(self._size + 1)
+
+        self._array[(self._head + self._size) & (len(self._array) - 1)] = data
+        self._size += 1
+
+    def get(self):
+        """Retrieves and removes the element at the front of the queue.
+
+        :return: The retrieved data.
+
+        >>> my_queue = Queue([1, 2], typecode='q')
+        >>> my_queue.get(), my_queue
+        (2, [1])
+        """
+        if self._size == 0:
+            raise IndexError('queue is empty')
+
+        data = self._array[self._head]
+        self._head = (self._head + 1) & (len(self._array) - 1)
+        self._size -= 1
+
+        return data
+
+    def peek(self):
+        """Retrieves the element at the front of the queue.
+
+        :return: The retrieved data.
+
+        >>> my_queue = Queue([1, 2], typecode='q')
+        >>> my_queue.peek(), my_queue
+        (2, [1, 2])
+        """
+        if self._size == 0:
+            raise IndexError('queue is empty')
+
+        return self._array[self._head]
+
+    def put_many(self, data):
+        """Inserts each element of the data at the end of the queue, in order.
+
+        :param data: An array, buffer-protocol object or iterable of data.
+        :exception: TypeError is raised if the data doesn't fit the typecode.
+
+        >>> my_queue = Queue([4], typecode='q')
+        >>> my_queue.put_many(array.array('q', [3, 2, 1]))
+        >>> my_queue
+        [1, 2, 3, 4]
+        """
+        view = _as_view(data, self._array.typecode)
+        count = len(view)
+
+        if self._size + count > len(self._array):
+            self._grow(self._size + count)
+
+        capacity = len(self._array)
+        start = (self._head + self._size) & (capacity - 1)
+        first = min(count, capacity - start)
+
+        with memoryview(self._array) as buffer:
+            buffer[start:start + first] = view[:first]
+            buffer[:count - first] = view[first:]
+
+        self._size += count
+
+    def get_many(self, n: int = None):
+        """Retrieves and removes up to n elements from the front of the queue.
+
+        :param n: Optional. The maximum number of elements to retrieve. Retrieves all if not given.
+        :return: An array of the retrieved data, front first.
+
+        >>> my_queue = Queue([1, 2, 3, 4], typecode='q')
+        >>> my_queue.get_many(3), my_queue
+        (array('q', [4, 3, 2]), [1])
+        """
+        n = self._size if n is None else max(0, min(n, self._size))
+
+        data = self._ordered(n)
+        self._head = (self._head + n) & (len(self._array) - 1) if self._array else 0
+        self._size -= n
+
+        return data
+
+    def reverse(self):
+        """Reverses the queue.
+
+        >>> my_queue = Queue([1, 2, 3], typecode='q')
+        >>> my_queue.reverse()
+        >>> my_queue
+        [3, 2, 1]
+        """
+        data = self._ordered()
+        data.reverse()
+
+        self._array[:self._size] = data
+        self._head = 0
+
+    def to_numpy(self, dtype=None):
+        """Returns an ndarray of the elements, in the order the queue is shown, i.e. with the front last.
+        The elements are copied once, and the ndarray owns the copy.
+
+        :param dtype: Optional. The dtype of the ndarray. Defaults to the typecode.
+        :return: The ndarray.
+        :exception: ImportError is raised if numpy isn't installed.
+
+        >>> numpy is None or Queue([1, 2, 3], typecode='q').to_numpy().tolist() == [1, 2, 3]
+        True
+        """
+        data = self._ordered()
+        data.reverse()
+
+        return _to_numpy(data, self._size, dtype)
+
+    def _grow(self, minimum: int):
+        capacity = max(8, len(self._array))
+        while capacity < minimum:
+            capacity *= 2
+
+        data = self._ordered()
+        self._array = array.array(data.typecode, bytes(capacity * data.itemsize))
+        self._array[:self._size] = data
+        self._head = 0
+
+    def _ordered(self, n: int = None):
+        """Returns an array of the first n elements (all by default) in FIFO order."""
+        n = self._size if n is None else n
+
+        end = self._head + n
+        if end <= len(self._array):
+            return self._array[self._head:end]
+
+        return self._array[self._head:] + self._array[:end - len(self._array)]
+
+
+_NATIVE_ORDER = '<' if sys.byteorder == 'little' else '>'
+
+# The struct formats a memoryview can cast to and read as Python numbers
+_NATIVE_FORMATS = frozenset('bBhHiIlLqQfd?')
+
+
+def _as_view(data, typecode: str):
+    """Returns a memoryview of the data in the given typecode, converting it only if needed."""
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return memoryview(array.array(typecode, data))
+
+    itemsize = array.array(typecode).itemsize
+    fmt = view.format.lstrip('@=')
+
+    # A standard byte order prefix only needs the bytes swapping if it isn't the machine's own
+    swap = fmt[:1] in '<>!' and fmt[0].replace('!', '>') != _NATIVE_ORDER
+    fmt = fmt.lstrip('<>!')
+
+    # Only reinterpret buffers holding the same kind of number, otherwise convert element-wise
+    if view.itemsize == itemsize and len(fmt) == 1 and _kind(fmt) == _kind(typecode):
+        if view.c_contiguous and not swap:
+            return view.cast('B').cast(typecode)
+
+        data = array.array(typecode, view.tobytes())
+        if swap:
+            data.byteswap()
+        return memoryview(data)
+
+    # memoryview can only read native formats itself
+    if view.format[:1] in '<>!=':
+        values = (value for value, in struct.iter_unpack(view.format, view.tobytes()))
+        return memoryview(array.array(typecode, values))
+
+    if numpy is not None and isinstance(data, numpy.ndarray):
+        return memoryview(array.array(typecode, _elements_of(data)))
+
+    if view.ndim != 1:
+        view = memoryview(view.tobytes()).cast(view.format)
+    return memoryview(array.array(typecode, view.tolist()))
+
+
+def _as_array(data, typecode: str) -> array.array:
+    """Returns a new array of the data in the given typecode, copying a buffer of the same kind in one go."""
+    result = array.array(typecode)
+    result.frombytes(_as_view(data, typecode).cast('B'))
+
+    return result
+
+
+def _elements_of(data):
+    """Returns an iterator of the elements of an ndarray as Python objects, in C order, or any other data as it is.
+    Numbers are read through the buffer in one pass, without an intermediate list or numpy scalar per element.
+    """
+    if numpy is None or not isinstance(data, numpy.ndarray):
+        return data
+
+    try:
+        view = memoryview(data)
+    except ValueError:
+        view = None
+
+    if view is not None and view.c_contiguous and view.format.lstrip('@') in _NATIVE_FORMATS:
+        return iter(view.cast('B').cast(view.format.lstrip('@')))
+
+    # e.g. objects, strings, or numbers in the other byte order, which only numpy can read
+    return map(data.item, range(data.size))
+
+
+def _to_numpy(elements, size: int, dtype=None):
+    """Returns an ndarray of 'size' elements. An array is wrapped without a further copy, and anything else is read
+    in one pass if a dtype is given.
+    """
+    if numpy is None:
+        raise ImportError("to_numpy() requires numpy")
+
+    if isinstance(elements, array.array):
+        result = numpy.frombuffer(elements, dtype=elements.typecode)
+        return result if dtype is None else result.astype(dtype, copy=False)
+
+    if dtype is None:
+        # numpy has to see every element before it can infer a dtype
+        return numpy.array(list(elements))
+
+    return numpy.fromiter(elements, dtype=dtype, count=size)
+
+
+def _kind(fmt: str):
+    if fmt in 'fd':
+        return 'f'
+    return 'u' if fmt.isupper() else 'i'
 
 
 if __name__ == '__main__':
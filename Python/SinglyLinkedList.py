@@ -21,7 +21,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-import collections
+import array
+import collections.abc
+import operator
+import pickle
+import struct
+import sys
+
+from Queue import _NATIVE_FORMATS, _as_view, _elements_of, _to_numpy, numpy
 
 
 class Node:
@@ -30,6 +37,8 @@ class Node:
 
     There are no restrictions on what type of data can be contained within the node.
     """
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -44,12 +53,23 @@ class Node:
 class SinglyLinkedList:
     """A list of singly linked nodes containing data.
     i.e. Node1 -> Node2 -> NULL
+
+    A pointer to the last node is kept, so appending is O(1). The last position accessed by index is also
+    remembered, so accessing or inserting at increasing indexes doesn't walk again from the head each time.
+
+    Optionally, up to 'pool_size' removed nodes are kept in a free-list and reused for inserted data,
+    which saves allocating a node on every insert for queue-like workloads.
+
+    Optionally, an 'indexed' list keeps a map from each piece of data to the nodes containing it, which makes
+    'in' and count O(1) on average, and lets remove_item and index_of fail fast. The data must then be hashable.
     """
 
-    def __init__(self, elements=None):
+    def __init__(self, elements=None, pool_size: int = 0, indexed: bool = False):
         """Instantiates a new instance of a SinglyLinkedList.
 
         :param elements: Optional. The elements initialize with.
+        :param pool_size: Optional. The maximum number of removed nodes to keep for reuse.
+        :param indexed: Optional. Whether to keep a map from data to nodes for fast lookups.
         :exception: TypeError is raised if 'elements' is not iterable.
 
         >>> my_list = SinglyLinkedList()
@@ -61,8 +81,16 @@ class SinglyLinkedList:
         [3, 4, 5]
         """
         self._head = None
+        self._tail = None
         self._size = 0
         self._iter_node = None
+        self._version = 0
+        self._finger_index = 0
+        self._finger_node = None
+        self._pool = None
+        self._pool_size = pool_size
+        self._pool_count = 0
+        self._lookup = {} if indexed else None
 
         if elements is not None:
             self.extend(elements)
@@ -84,10 +112,14 @@ class SinglyLinkedList:
         return new_list
 
     def __contains__(self, item) -> bool:
+        if self._lookup is not None:
+            return item in self._lookup
+
         node = self._head
         while node is not None:
             if node.data == item:
                 return True
+            node = node.next
 
         return False
 
@@ -133,7 +165,12 @@ class SinglyLinkedList:
         self.extend(other)
 
     def __iter__(self):
-        return self
+        node = self._head
+        while node is not None:
+            # Step ahead first, so the current element can be removed while iterating
+            next_node = node.next
+            yield node.data
+            node = next_node
 
     def __len__(self):
         return self._size
@@ -152,6 +189,10 @@ class SinglyLinkedList:
 
         return self._iter_node.data
 
+    def __reduce__(self):
+        # Pickle the elements as a flat list, rather than following each link recursively
+        return self.__class__, (list(self), self._pool_size, self._lookup is not None)
+
     def __repr__(self):
         s = []
         node = self._head
@@ -207,15 +248,32 @@ class SinglyLinkedList:
         >>> my_list
         [3, 4, 1]
         """
-        self._size += 1
+        node = self._acquire(data)
 
         if self._head is None:
-            self._head = Node(data)
+            self._head = node
         else:
-            node = self._head
-            while node.next is not None:
-                node = node.next
-            node.next = Node(data)
+            self._tail.next = node
+        self._tail = node
+
+        self._size += 1
+        self._version += 1
+
+    def concat_move(self, other):
+        """Moves all the elements of another list onto the end of the list, leaving the other list empty.
+        The nodes are relinked rather than copied, so this is O(1).
+
+        :param other: The SinglyLinkedList to move the elements from.
+        :exception: TypeError is raised if 'other' is not a SinglyLinkedList.
+        :exception: ValueError is raised if 'other' is the list itself.
+
+        >>> my_list1 = SinglyLinkedList([1, 2])
+        >>> my_list2 = SinglyLinkedList([3, 4])
+        >>> my_list1.concat_move(my_list2)
+        >>> my_list1, my_list2
+        ([1, 2, 3, 4], [])
+        """
+        self.splice(other, self._size)
 
     def copy(self):
         """Returns a copy of the list.
@@ -230,7 +288,7 @@ class SinglyLinkedList:
         >>> my_list.copy()
         [5, 7, -1]
         """
-        list_copy = SinglyLinkedList()
+        list_copy = SinglyLinkedList(pool_size=self._pool_size, indexed=self._lookup is not None)
 
         node = self._head
         while node is not None:
@@ -239,10 +297,38 @@ class SinglyLinkedList:
 
         return list_copy
 
+    def count(self, data) -> int:
+        """Returns the number of occurrences of the given data.
+
+        :param data: The data to count.
+        :return: The number of occurrences.
+
+        >>> my_list = SinglyLinkedList([3, 4, 3])
+        >>> my_list.count(3)
+        2
+
+        >>> my_list = SinglyLinkedList([3, 4, 3], indexed=True)
+        >>> my_list.count(3), my_list.count(5)
+        (2, 0)
+        """
+        if self._lookup is not None:
+            return len(self._lookup.get(data, ()))
+
+        count = 0
+
+        node = self._head
+        while node is not None:
+            if node.data == data:
+                count += 1
+            node = node.next
+
+        return count
+
     def extend(self, other):
         """Extends the list with the elements of another.
 
-        :param other: A list or SinglyLinkedList to extend the list with.
+        :param other: A list, SinglyLinkedList or ndarray to extend the list with. An ndarray's elements are read
+            as Python objects, in C order.
         :exception: TypeError is raised if 'other' is not iterable.
 
         >>> my_list = SinglyLinkedList([1])
@@ -256,32 +342,72 @@ class SinglyLinkedList:
          >>> my_list1
          [1, 2, 3, 4, 5]
         """
-        if isinstance(other, collections.Iterable):
-            if self._head is None:
-                added_head = False
-                node = None
-
-                for data in other:
-                    if not added_head:
-                        self._head = Node(data)
-                        node = self._head
-                        added_head = True
+        if isinstance(other, collections.abc.Iterable):
+            # Without a pool or an index, nodes can be created directly
+            acquire = Node if self._pool is None and self._lookup is None else self._acquire
+            tail = self._tail
+            count = 0
+
+            try:
+                for data in _elements_of(other):
+                    node = acquire(data)
+                    if tail is None:
+                        self._head = node
                     else:
-                        node.next = Node(data)
-                        node = node.next
-                    self._size += 1
-            else:
-                tail = self._head
-                while tail.next is not None:
-                    tail = tail.next
-
-                for data in other:
-                    tail.next = Node(data)
-                    tail = tail.next
-                    self._size += 1
+                        tail.next = node
+                    tail = node
+                    count += 1
+            finally:
+                self._tail = tail
+                self._size += count
+                self._version += 1
         else:
             raise TypeError("other must be iterable")
 
+    @classmethod
+    def from_buffer(cls, buffer):
+        """Returns a new list of the elements of a buffer-protocol object, e.g. an array or bytes.
+
+        :param buffer: The buffer-protocol object.
+        :return: The list.
+        :exception: TypeError is raised if 'buffer' doesn't support the buffer protocol.
+
+        >>> SinglyLinkedList.from_buffer(array.array('q', [1, 2, 3]))
+        [1, 2, 3]
+        >>> numpy is None or SinglyLinkedList.from_buffer(numpy.array([[1, 2], [3, 4]], dtype='>i4')) == [1, 2, 3, 4]
+        True
+        """
+        return cls(_buffer_elements(buffer))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Returns a new list of the elements serialized by to_bytes().
+        Untyped elements are unpickled, which can run arbitrary code, so the data must come from a trusted source.
+
+        :param data: The bytes, or any bytes-like object.
+        :return: The list.
+        :exception: ValueError is raised if the data isn't a serialized list, or is truncated.
+
+        >>> SinglyLinkedList.from_bytes(SinglyLinkedList([1, 'a', None]).to_bytes())
+        [1, 'a', None]
+        """
+        typecode, elements = _load(data)
+
+        return cls(elements)
+
+    @classmethod
+    def from_numpy(cls, arr):
+        """Returns a new list of the elements of an ndarray, in C order, as Python objects.
+        The nodes are built in one pass over the buffer, without an intermediate list.
+
+        :param arr: The ndarray, or any iterable.
+        :return: The list.
+
+        >>> SinglyLinkedList.from_numpy(array.array('d', [1, 2]))
+        [1.0, 2.0]
+        """
+        return cls(arr)
+
     def get(self, index: int):
         """Gets the data at the specified index.
 
@@ -305,11 +431,36 @@ class SinglyLinkedList:
         if index < 0:
             index = self.size + index
 
+        return self._node_at(index).data
+
+    def index_of(self, data) -> int:
+        """Returns the index of the first occurrence of the given data.
+
+        :param data: The data to find.
+        :return: The index.
+        :exception: ValueError is raised if item is not found.
+
+        >>> my_list = SinglyLinkedList([4, 7, 2, 7])
+        >>> my_list.index_of(7)
+        1
+
+        >>> my_list = SinglyLinkedList([4, 7, 2, 7], indexed=True)
+        >>> my_list.index_of(2), my_list.index_of(7)
+        (2, 1)
+        """
+        if self._lookup is not None and data not in self._lookup:
+            raise ValueError("item not found")
+
+        index = 0
+
         node = self._head
-        for i in range(index):
+        while node is not None:
+            if node.data == data:
+                return index
             node = node.next
+            index += 1
 
-        return node.data
+        raise ValueError("item not found")
 
     def insert(self, index: int, data):
         """Inserts the data at the given element.
@@ -333,24 +484,22 @@ class SinglyLinkedList:
         if index < 0:
             index = self.size + index
 
-        if self._head is None:
-            self._head = Node(data)
-        elif index == 0:
-            head = self._head
-            self._head = Node(data)
-            self._head.next = head
+        if index == 0:
+            self.prepend(data)
+        elif index == self.size:
+            self.append(data)
         else:
-            next_node = self._head
-            prev_node = None
-            for i in range(index):
-                prev_node = next_node
-                next_node = next_node.next
+            prev_node = self._node_at(index - 1)
 
-            new_node = Node(data)
+            new_node = self._acquire(data)
+            new_node.next = prev_node.next
             prev_node.next = new_node
-            new_node.next = next_node
 
-        self._size += 1
+            self._finger_index = index
+            self._finger_node = new_node
+
+            self._size += 1
+            self._version += 1
 
     def is_empty(self):
         """Returns True if the list is empty, otherwise False.
@@ -381,18 +530,19 @@ class SinglyLinkedList:
             raise IndexError("list is empty")
 
         head = self._head
-        if self._size == 1:
-            self._head = None
-        else:
-            self._head = head.next
+        self._head = head.next
+        if self._head is None:
+            self._tail = None
 
         # Update iterable ptr
         if self._iter_node == head:
             self._iter_node = self._head
 
+        self._finger_node = None
         self._size -= 1
+        self._version += 1
 
-        return head.data
+        return self._release(head)
 
     def pop_last(self):
         """Removes and returns the data from the beginning of the list.
@@ -408,28 +558,22 @@ class SinglyLinkedList:
             raise IndexError("list is empty")
 
         if self._size == 1:
-            head = self._head
-            self._head = None
-            self._size -= 1
-            self._iter_node = None
-            return head.data
+            return self.pop()
 
-        next_node = self._head
-        prev_node = None
-
-        while next_node.next is not None:
-            prev_node = next_node
-            next_node = next_node.next
+        tail = self._tail
+        prev_node = self._node_at(self._size - 2)
 
         prev_node.next = None
+        self._tail = prev_node
 
         # Update iterable ptr
-        if self._iter_node == next_node:
+        if self._iter_node == tail:
             self._iter_node = self._head
 
         self._size -= 1
+        self._version += 1
 
-        return next_node.data
+        return self._release(tail)
 
     def prepend(self, data):
         """Prepends the data to the end of the list.
@@ -446,12 +590,16 @@ class SinglyLinkedList:
          >>> my_list
          [1, 3, 4]
          """
-        self._size += 1
-
         head = self._head
 
-        self._head = Node(data)
+        self._head = self._acquire(data)
         self._head.next = head
+        if head is None:
+            self._tail = self._head
+
+        self._finger_node = None
+        self._size += 1
+        self._version += 1
 
     def remove(self, index: int):
         """Removes and returns the data at the given index.
@@ -475,30 +623,22 @@ class SinglyLinkedList:
             index = self.size + index
 
         if index == 0:
-            head = self._head
-            self._head = self._head.next
+            return self.pop()
 
-            # Update iterable ptr
-            if self._iter_node == head:
-                self._iter_node = self._head
+        prev_node = self._node_at(index - 1)
+        node = prev_node.next
 
-            self._size -= 1
-            return head.data
-        else:
-            next_node = self._head
-            prev_node = None
-            for i in range(index):
-                prev_node = next_node
-                next_node = next_node.next
+        prev_node.next = node.next
+        if node is self._tail:
+            self._tail = prev_node
 
-            prev_node.next = next_node.next
-
-            # Update iterable ptr
-            if self._iter_node == next_node:
-                self._iter_node = next_node.next
+        # Update iterable ptr
+        if self._iter_node == node:
+            self._iter_node = node.next
 
-            self._size -= 1
-            return next_node.data
+        self._size -= 1
+        self._version += 1
+        return self._release(node)
 
     def remove_item(self, data):
         """Removes the first occurrence of the given data.
@@ -515,32 +655,29 @@ class SinglyLinkedList:
          >>> my_list.remove_item(3)
          >>> my_list
          [4, 3]
+
+         >>> my_list = SinglyLinkedList([3, 4, 3], indexed=True)
+         >>> my_list.remove_item(4)
+         >>> my_list, 4 in my_list
+         ([3, 3], False)
          """
-        if self._head is None:
+        if self._head is None or self._lookup is not None and data not in self._lookup:
             raise ValueError("item not found")
 
         if self._head.data == data:
-            self._head = self._head.next
-            self._size -= 1
+            self.pop()
             return
 
-        next_node = self._head
-        prev_node = None
-
-        while next_node is not None:
-            if next_node.data == data:
-                if prev_node is not None:
-                    prev_node.next = next_node.next
+        prev_node = self._head
+        node = prev_node.next
 
-                # Update iterable ptr
-                if self._iter_node == next_node:
-                    self._iter_node = prev_node.next
-
-                self._size -= 1
+        while node is not None:
+            if node.data == data:
+                self._unlink_after(prev_node)
                 return
 
-            prev_node = next_node
-            next_node = next_node.next
+            prev_node = node
+            node = node.next
 
         raise ValueError("item not found")
 
@@ -563,8 +700,694 @@ class SinglyLinkedList:
 
             prev_node.next = prev_prev_node
 
+        self._tail = self._head
         self._head = prev_node
-        a = 1
+        self._finger_node = None
+        self._version += 1
+
+    def sort(self, key=None, reverse: bool = False):
+        """Sorts the list in place by relinking its nodes. The sort is stable, and needs no extra memory.
+        Runs of elements already in order are found and kept, so a nearly sorted list sorts in close to linear time.
+
+        :param key: Optional. A function extracting the value to compare from an element. Called on every comparison.
+        :param reverse: Optional. Whether to sort in descending order.
+
+        >>> my_list = SinglyLinkedList([3, 1, 2])
+        >>> my_list.sort()
+        >>> my_list
+        [1, 2, 3]
+
+        >>> my_list = SinglyLinkedList(['bb', 'a', 'cc', 'd'])
+        >>> my_list.sort(key=len, reverse=True)
+        >>> my_list
+        ['bb', 'cc', 'a', 'd']
+        """
+        self._iter_node = None
+        self._finger_node = None
+        self._version += 1
+
+        if self._size > 1:
+            _sort_nodes(self, key, reverse)
+
+    def splice(self, other, at: int):
+        """Moves all the elements of another list into the list before the given index, leaving the other list empty.
+        The nodes are relinked rather than copied, so this is O(1) once the index is found.
+        If the list is indexed, the elements of the other list are added to its index.
+
+        :param other: The SinglyLinkedList to move the elements from.
+        :param at: The index to move the elements to.
+        :exception: IndexError is raised if 'at' is out of bounds.
+        :exception: TypeError is raised if 'other' is not a SinglyLinkedList.
+        :exception: ValueError is raised if 'other' is the list itself.
+
+        >>> my_list1 = SinglyLinkedList([1, 4])
+        >>> my_list2 = SinglyLinkedList([2, 3])
+        >>> my_list1.splice(my_list2, 1)
+        >>> my_list1, my_list2
+        ([1, 2, 3, 4], [])
+        """
+        if not isinstance(other, SinglyLinkedList):
+            raise TypeError("other must be a SinglyLinkedList")
+
+        if other is self:
+            raise ValueError("cannot splice a list into itself")
+
+        if at < -self.size or at > self.size:
+            raise IndexError("index is out of range")
+
+        if at < 0:
+            at = self.size + at
+
+        if other._head is None:
+            return
+
+        head, tail, size = other._head, other._tail, other._size
+        self._take(other)
+
+        if at == 0:
+            tail.next = self._head
+            self._head = head
+            self._finger_node = None
+        else:
+            prev_node = self._node_at(at - 1)
+            tail.next = prev_node.next
+            prev_node.next = head
+
+        if tail.next is None:
+            self._tail = tail
+
+        self._size += size
+        self._version += 1
+
+    def split_at(self, index: int):
+        """Splits the list in two, keeping the elements before the index and returning a list of the rest.
+        The nodes are relinked rather than copied, so this is O(1) once the index is found.
+        If the list is indexed, the index entries of the moved elements are moved too.
+
+        :param index: The index of the first element to move to the new list. May be the size of the list.
+        :return: A list of the elements from the index onwards.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = SinglyLinkedList([1, 2, 3, 4])
+        >>> my_list.split_at(1), my_list
+        ([2, 3, 4], [1])
+        """
+        if index < -self.size or index > self.size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index = self.size + index
+
+        new_list = SinglyLinkedList(pool_size=self._pool_size)
+
+        if index == self._size:
+            new_list._lookup = None if self._lookup is None else {}
+            return new_list
+
+        new_list._tail = self._tail
+        new_list._size = self._size - index
+
+        if index == 0:
+            node = self._head
+            self._head = None
+            self._tail = None
+            self._finger_node = None
+        else:
+            prev_node = self._node_at(index - 1)
+            node = prev_node.next
+            prev_node.next = None
+            self._tail = prev_node
+
+        new_list._head = node
+
+        self._size = index
+        self._iter_node = None
+        self._version += 1
+
+        if self._lookup is not None:
+            if self._head is None:
+                new_list._lookup, self._lookup = self._lookup, {}
+            else:
+                new_list._lookup = {}
+                while node is not None:
+                    self._forget(node)
+                    new_list._lookup.setdefault(node.data, {})[node] = None
+                    node = node.next
+
+        return new_list
+
+    def to_bytes(self) -> bytes:
+        """Returns the list serialized in a compact binary form, which from_bytes() reads back.
+        The elements are pickled in chunks, so they must support pickling.
+
+        :return: The bytes.
+
+        >>> len(SinglyLinkedList([1, 2, 3]).to_bytes()) < 64
+        True
+        """
+        return b''.join(_dump(self, self._size))
+
+    def to_numpy(self, dtype=None):
+        """Returns an ndarray of the elements.
+        Given a dtype, the elements are written straight into the ndarray in one pass.
+
+        :param dtype: Optional. The dtype of the ndarray. Without it, numpy infers one from a temporary list.
+        :return: The ndarray.
+        :exception: ImportError is raised if numpy isn't installed.
+
+        >>> numpy is None or SinglyLinkedList([1, 2, 3]).to_numpy('q').tolist() == [1, 2, 3]
+        True
+        """
+        return _to_numpy(self, self._size, dtype)
+
+    def cursor(self, index: int = 0):
+        """Returns a cursor positioned at the given index, for editing the list as it is walked.
+
+        :param index: Optional. The index to start at. May be the size of the list, i.e. past the end.
+        :return: The cursor.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = SinglyLinkedList([1, 2, 3, 4])
+        >>> cursor = my_list.cursor()
+        >>> while not cursor.at_end():
+        ...     if cursor.data % 2 == 0:
+        ...         cursor.insert_before(cursor.remove_here() * 10)
+        ...     else:
+        ...         cursor.move(1)
+        >>> my_list
+        [1, 20, 3, 40]
+        """
+        return Cursor(self, index)
+
+    def _acquire(self, data) -> Node:
+        """Returns a node containing the data, reusing a pooled node if there is one."""
+        node = self._pool
+        if node is None:
+            node = Node(data)
+        else:
+            self._pool = node.next
+            self._pool_count -= 1
+
+            node.data = data
+            node.next = None
+
+        if self._lookup is not None:
+            self._lookup.setdefault(data, {})[node] = None
+
+        return node
+
+    def _release(self, node: Node):
+        """Returns the data of a removed node, and keeps the node for reuse if the pool isn't full."""
+        data = node.data
+
+        if self._lookup is not None:
+            self._forget(node)
+
+        if self._pool_count < self._pool_size:
+            node.data = None
+            node.next = self._pool
+            self._pool = node
+            self._pool_count += 1
+
+        return data
+
+    def _node_at(self, index: int) -> Node:
+        """Returns the node at a non-negative index, walking from the last accessed position where possible.
+        The position is remembered, so walking the list by index is amortized O(1) per step.
+        """
+        if index == self._size - 1:
+            return self._tail
+
+        if self._finger_node is not None and self._finger_index <= index:
+            node = self._finger_node
+            for i in range(index - self._finger_index):
+                node = node.next
+        else:
+            node = self._head
+            for i in range(index):
+                node = node.next
+
+        self._finger_index = index
+        self._finger_node = node
+
+        return node
+
+    def _take(self, other):
+        """Empties another list whose nodes are about to be linked into the list, taking their lookup entries."""
+        if self._lookup is not None:
+            if not self._lookup and other._lookup is not None:
+                self._lookup, other._lookup = other._lookup, self._lookup
+            else:
+                node = other._head
+                while node is not None:
+                    self._lookup.setdefault(node.data, {})[node] = None
+                    node = node.next
+
+        if other._lookup is not None:
+            other._lookup = {}
+
+        other._head = None
+        other._tail = None
+        other._size = 0
+        other._iter_node = None
+        other._finger_node = None
+        other._version += 1
+
+    def _assign(self, node: Node, data):
+        """Replaces the data of a node in the list."""
+        if self._lookup is not None:
+            self._forget(node)
+            self._lookup.setdefault(data, {})[node] = None
+
+        node.data = data
+
+    def _forget(self, node: Node):
+        """Removes a node from the lookup map."""
+        nodes = self._lookup[node.data]
+        del nodes[node]
+        if not nodes:
+            del self._lookup[node.data]
+
+    def _link_after(self, node: Node, data) -> Node:
+        """Links a new node containing the data after the given node, or at the head if the node is None."""
+        new_node = self._acquire(data)
+
+        if node is None:
+            new_node.next = self._head
+            self._head = new_node
+        else:
+            new_node.next = node.next
+            node.next = new_node
+
+        if new_node.next is None:
+            self._tail = new_node
+
+        self._finger_node = None
+        self._size += 1
+        self._version += 1
+
+        return new_node
+
+    def _unlink_after(self, node: Node):
+        """Unlinks the node after the given node, or the head if the node is None, and returns its data."""
+        if node is None:
+            removed = self._head
+            self._head = removed.next
+        else:
+            removed = node.next
+            node.next = removed.next
+
+        if removed is self._tail:
+            self._tail = node
+
+        # Update iterable ptr
+        if self._iter_node == removed:
+            self._iter_node = removed.next
+
+        self._finger_node = None
+        self._size -= 1
+        self._version += 1
+
+        return self._release(removed)
+
+
+class Cursor:
+    """A position within a SinglyLinkedList, which can be moved and can edit the list around it.
+
+    A cursor is positioned at an element, or past the last element. It keeps hold of the previous node too,
+    so inserting and removing at the cursor are O(1). Moving forwards is O(k), but as the list is singly linked,
+    moving backwards walks again from the head.
+
+    Any number of cursors can walk the same list, but once the list is changed by anything other than the cursor
+    itself, the cursor is invalidated.
+    """
+
+    def __init__(self, linked_list: SinglyLinkedList, index: int = 0):
+        """Instantiates a new instance of a Cursor.
+
+        :param linked_list: The list.
+        :param index: Optional. The index to start at. May be the size of the list, i.e. past the end.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = SinglyLinkedList([1, 2, 3])
+        >>> Cursor(my_list, 1)
+        Cursor(index=1, data=2)
+        """
+        if index < 0 or index > linked_list.size:
+            raise IndexError("index is out of range")
+
+        self._list = linked_list
+        self._version = linked_list._version
+        self._index = 0
+        self._prev = None
+        self._node = linked_list._head
+        self._advance(index)
+
+    def __repr__(self):
+        if self._node is None:
+            return 'Cursor(index=%d, at end)' % self._index
+        return 'Cursor(index=%d, data=%r)' % (self._index, self._node.data)
+
+    @property
+    def data(self):
+        """Returns the data at the cursor.
+
+        :return: The data.
+        :exception: IndexError is raised if the cursor is past the end.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+        """
+        return self._current().data
+
+    @data.setter
+    def data(self, value):
+        self._list._assign(self._current(), value)
+
+    @property
+    def index(self) -> int:
+        """Returns the index of the cursor.
+
+        :return: The index.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+        """
+        self._check()
+        return self._index
+
+    def at_end(self) -> bool:
+        """Returns True if the cursor is past the last element, otherwise False.
+
+        :return: A boolean indicating whether the cursor is past the end.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+        """
+        self._check()
+        return self._node is None
+
+    def insert_after(self, data):
+        """Inserts the data after the element at the cursor. The cursor doesn't move.
+
+        :param data: The data to insert.
+        :exception: IndexError is raised if the cursor is past the end.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+
+        >>> my_list = SinglyLinkedList([1, 3])
+        >>> cursor = my_list.cursor()
+        >>> cursor.insert_after(2)
+        >>> cursor, my_list
+        (Cursor(index=0, data=1), [1, 2, 3])
+        """
+        node = self._current()
+
+        self._list._link_after(node, data)
+        self._version = self._list._version
+
+    def insert_before(self, data):
+        """Inserts the data before the element at the cursor, or at the end if the cursor is past the end.
+        The cursor stays on the same element.
+
+        :param data: The data to insert.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+
+        >>> my_list = SinglyLinkedList([1, 3])
+        >>> cursor = my_list.cursor(1)
+        >>> cursor.insert_before(2)
+        >>> cursor, my_list
+        (Cursor(index=2, data=3), [1, 2, 3])
+        """
+        self._check()
+
+        self._prev = self._list._link_after(self._prev, data)
+        self._version = self._list._version
+        self._index += 1
+
+    def move(self, k: int):
+        """Moves the cursor by k elements, forwards if k is positive or backwards if k is negative.
+        Moving backwards is O(n), as the cursor walks again from the head.
+
+        :param k: The number of elements to move by.
+        :exception: IndexError is raised if the cursor would move out of bounds.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+
+        >>> my_list = SinglyLinkedList([1, 2, 3])
+        >>> cursor = my_list.cursor()
+        >>> cursor.move(2)
+        >>> cursor.move(-1)
+        >>> cursor
+        Cursor(index=1, data=2)
+        """
+        self._check()
+
+        index = self._index + k
+        if index < 0 or index > self._list.size:
+            raise IndexError("cursor is out of range")
+
+        if k < 0:
+            self._index = 0
+            self._prev = None
+            self._node = self._list._head
+            self._advance(index)
+        else:
+            self._advance(k)
+
+    def remove_here(self):
+        """Removes and returns the element at the cursor. The cursor moves to the next element.
+
+        :return: The data.
+        :exception: IndexError is raised if the cursor is past the end.
+        :exception: RuntimeError is raised if the list has changed since the cursor was created.
+
+        >>> my_list = SinglyLinkedList([1, 2, 3])
+        >>> cursor = my_list.cursor(1)
+        >>> cursor.remove_here(), cursor, my_list
+        (2, Cursor(index=1, data=3), [1, 3])
+        """
+        node = self._current()
+        self._node = node.next
+
+        data = self._list._unlink_after(self._prev)
+        self._version = self._list._version
+
+        return data
+
+    def _advance(self, k: int):
+        for i in range(k):
+            self._prev = self._node
+            self._node = self._node.next
+        self._index += k
+
+    def _check(self):
+        if self._version != self._list._version:
+            raise RuntimeError("list changed since the cursor was created")
+
+    def _current(self) -> Node:
+        self._check()
+
+        if self._node is None:
+            raise IndexError("cursor is at the end of the list")
+
+        return self._node
+
+
+def _sort_nodes(linked_list, key, reverse: bool):
+    """Sorts the chain of nodes of a linked list by their data with a bottom-up natural merge sort.
+    The new head and tail are set on the list, even when a comparison raises an exception.
+
+    Each pass splits the chain into runs which are already in order, reversing strictly descending runs as it goes,
+    and merges neighbouring pairs of runs. Only the 'next' links are changed, so no extra memory is needed.
+    """
+    if key is None:
+        precedes = operator.gt if reverse else operator.lt
+    elif reverse:
+        def precedes(a, b):
+            return key(b) < key(a)
+    else:
+        def precedes(a, b):
+            return key(a) < key(b)
+
+    # An exception stops any further comparisons, and is raised once every node is linked up again
+    error = None
+
+    def take_run(node):
+        nonlocal error
+        run, tail, rest = node, node, node.next
+
+        try:
+            if error is None and rest is not None and precedes(rest.data, node.data):
+                node.next = None
+                while error is None and rest is not None and precedes(rest.data, run.data):
+                    next_node = rest.next
+                    rest.next = run
+                    run = rest
+                    rest = next_node
+            else:
+                while error is None and rest is not None and not precedes(rest.data, tail.data):
+                    tail = rest
+                    rest = rest.next
+        except BaseException as e:
+            error = e
+
+        tail.next = None
+        return run, tail, rest
+
+    def merge(a, a_tail, b, b_tail):
+        nonlocal error
+        head = tail = None
+
+        try:
+            while error is None and a is not None and b is not None:
+                if precedes(b.data, a.data):
+                    node, b = b, b.next
+                else:
+                    node, a = a, a.next
+
+                if tail is None:
+                    head = node
+                else:
+                    tail.next = node
+                tail = node
+        except BaseException as e:
+            error = e
+
+        if a is None:
+            a, a_tail = b, b_tail
+        elif b is not None:
+            a_tail.next = b
+            a_tail = b_tail
+
+        if tail is None:
+            return a, a_tail
+
+        tail.next = a
+        return head, a_tail
+
+    head = linked_list._head
+
+    while True:
+        merged_head = merged_tail = None
+        runs = 0
+
+        node = head
+        while node is not None:
+            run, run_tail, node = take_run(node)
+            if node is not None:
+                other, other_tail, node = take_run(node)
+                run, run_tail = merge(run, run_tail, other, other_tail)
+
+            if merged_tail is None:
+                merged_head = run
+            else:
+                merged_tail.next = run
+            merged_tail = run_tail
+            runs += 1
+
+        head = merged_head
+        if runs == 1 or error is not None:
+            break
+
+    linked_list._head = head
+    linked_list._tail = merged_tail
+
+    if error is not None:
+        raise error
+
+
+_MAGIC = b'LNKL'
+_HEADER = struct.Struct('<4sBcBQ')
+_LENGTH = struct.Struct('<I')
+_CHUNK_SIZE = 4096
+
+
+def _dump(elements, size: int, typecode: str = None):
+    """Yields the serialized form of the elements in pieces, so it can be written out as it's produced.
+
+    The form is a header of a magic number, format version, typecode (NUL for any data), byte order and size.
+    Typed elements follow as the raw bytes of an array. Any other elements follow as records, each a 4-byte length
+    and a pickled list of up to _CHUNK_SIZE elements.
+    """
+    yield _HEADER.pack(_MAGIC, 1, (typecode or '\0').encode(), sys.byteorder == 'big', size)
+
+    if typecode is not None:
+        yield elements.tobytes()
+        return
+
+    chunk = []
+    for data in elements:
+        chunk.append(data)
+        if len(chunk) == _CHUNK_SIZE:
+            yield from _dump_chunk(chunk)
+            chunk = []
+
+    if chunk:
+        yield from _dump_chunk(chunk)
+
+
+def _dump_chunk(chunk: list):
+    record = pickle.dumps(chunk, protocol=pickle.HIGHEST_PROTOCOL)
+    yield _LENGTH.pack(len(record))
+    yield record
+
+
+def _load(data):
+    """Reads the serialized form of some elements, and returns their typecode, or None, and the elements.
+    Typed elements are returned as an array, and any others as an iterator. Only trusted data should be read, as
+    untyped elements are unpickled.
+    """
+    view = memoryview(data).cast('B')
+    if len(view) < _HEADER.size:
+        raise ValueError("data is truncated")
+
+    magic, version, typecode, big_endian, size = _HEADER.unpack_from(view)
+    if magic != _MAGIC or version != 1:
+        raise ValueError("data is not a serialized linked list")
+
+    if typecode != b'\0':
+        elements = array.array(typecode.decode())
+        end = _HEADER.size + size * elements.itemsize
+        if len(view) < end:
+            raise ValueError("data is truncated")
+
+        elements.frombytes(view[_HEADER.size:end])
+        if big_endian != (sys.byteorder == 'big'):
+            elements.byteswap()
+
+        return elements.typecode, elements
+
+    return None, _load_chunks(view, size)
+
+
+def _load_chunks(view: memoryview, size: int):
+    offset = _HEADER.size
+    while size > 0:
+        if len(view) < offset + _LENGTH.size:
+            raise ValueError("data is truncated")
+
+        length, = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+
+        if len(view) < offset + length:
+            raise ValueError("data is truncated")
+
+        chunk = pickle.loads(view[offset:offset + length])
+        offset += length
+        size -= len(chunk)
+
+        yield from chunk
+
+
+def _buffer_elements(buffer):
+    """Returns an iterator of the elements of a buffer-protocol object, flattening it if it has several dimensions.
+    Numbers are read in one pass, without an intermediate list.
+    """
+    if numpy is not None and isinstance(buffer, numpy.ndarray):
+        return _elements_of(buffer)
+
+    view = memoryview(buffer)
+    typecode = view.format.lstrip('@=<>!')
+    if typecode in _NATIVE_FORMATS and typecode != '?':
+        return iter(_as_view(view, typecode))
+
+    # e.g. booleans or chars, which arrays can't hold
+    if view.ndim != 1:
+        view = memoryview(view.tobytes()).cast(view.format)
+    return iter(view.tolist())
 
 
 if __name__ == '__main__':
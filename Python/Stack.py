@@ -21,14 +21,26 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import array
+
+from CopyOnWriteList import CopyOnWriteList
+from Queue import _as_array, _as_view, _elements_of, _to_numpy
+
 
 class Stack:
     """A stack which supports inserting and removing items in a FILO manner."""
 
-    def __init__(self, elements=None):
+    def __new__(cls, elements=None, typecode=None, **kwargs):
+        if cls is Stack and typecode is not None:
+            cls = TypedStack
+
+        return super().__new__(cls)
+
+    def __init__(self, elements=None, typecode=None):
         """Instantiates a new instance of a Stack.
 
         :param elements: Optional. The elements initialize with.
+        :param typecode: Optional. An array typecode. If given, a compact TypedStack is created instead.
         :exception: TypeError is raised if 'elements' is not iterable.
 
         >>> my_stack = Stack()
@@ -40,7 +52,8 @@ class Stack:
         >>> my_stack
         [3, 4, 5]
         """
-        self._elements = [] if elements is None else [e for e in elements]
+        # The front of the stack is kept at the end of the list, so it can be inserted and removed in O(1)
+        self._elements = CopyOnWriteList(None if elements is None else reversed(list(_elements_of(elements))))
 
     def __contains__(self, item) -> bool:
         return item in self._elements
@@ -52,7 +65,7 @@ class Stack:
             return NotImplemented
 
     def __repr__(self):
-        return str(self._elements)
+        return str(self._elements[::-1])
 
     @property
     def size(self):
@@ -72,6 +85,7 @@ class Stack:
 
     def copy(self):
         """Returns a copy of the stack.
+        The copy shares storage with the stack, and only copies the chunks which either of them changes.
 
         :return: A copy of the stack.
 
@@ -83,7 +97,10 @@ class Stack:
         >>> my_stack.copy()
         [1, 2, 3]
         """
-        return Stack(self._elements[:])
+        stack_copy = Stack()
+        stack_copy._elements = self._elements.copy()
+
+        return stack_copy
 
     def is_empty(self) -> bool:
         """Returns True if the stack is empty, otherwise False.
@@ -115,7 +132,7 @@ class Stack:
         >>> my_stack
         [1, 2, 3, 4]
         """
-        self._elements.insert(0, data)
+        self._elements.append(data)
 
     def get(self):
         """Retrieves and removes the element at the front of the stack.
@@ -129,7 +146,7 @@ class Stack:
         if len(self._elements) == 0:
             raise IndexError('stack is empty')
 
-        return self._elements.pop(0)
+        return self._elements.pop()
 
     def peek(self):
         """Retrieves the element at the front of the stack.
@@ -143,7 +160,38 @@ class Stack:
         if len(self._elements) == 0:
             raise IndexError('stack is empty')
 
-        return self._elements[0]
+        return self._elements[-1]
+
+    def put_many(self, data):
+        """Inserts each element of the data at the front of the stack, in order.
+
+        :param data: An iterable of data. An ndarray's elements are read as Python objects, in C order.
+
+        >>> my_stack = Stack([4])
+        >>> my_stack.put_many([3, 2, 1])
+        >>> my_stack
+        [1, 2, 3, 4]
+        """
+        self._elements.extend(_elements_of(data))
+
+    def get_many(self, n: int = None):
+        """Retrieves and removes up to n elements from the front of the stack.
+
+        :param n: Optional. The maximum number of elements to retrieve. Retrieves all if not given.
+        :return: A list of the retrieved data, front first.
+
+        >>> my_stack = Stack([1, 2, 3, 4])
+        >>> my_stack.get_many(3), my_stack
+        ([1, 2, 3], [4])
+        """
+        n = len(self._elements) if n is None else max(0, min(n, len(self._elements)))
+
+        start = len(self._elements) - n
+        data = self._elements[start:]
+        del self._elements[start:]
+        data.reverse()
+
+        return data
 
     def reverse(self):
         """Reverses the queue.
@@ -153,7 +201,368 @@ class Stack:
         >>> my_stack
         [3, 2, 1]
         """
-        self._elements[:] = self._elements [::-1]
+        self._elements.reverse()
+
+    @classmethod
+    def from_numpy(cls, arr, typecode=None):
+        """Returns a new stack of the elements of an ndarray, or any buffer-protocol object, in C order.
+        The front of the stack is the first element, as for the constructor.
+
+        :param arr: The ndarray.
+        :param typecode: Optional. An array typecode. If given, a TypedStack is created, copying the buffer directly.
+        :return: The stack.
+        :exception: TypeError is raised if an element doesn't fit the typecode.
+
+        >>> Stack.from_numpy(array.array('q', [1, 2, 3]), typecode='q')
+        [1, 2, 3]
+        """
+        if typecode is None:
+            return cls(arr)
+
+        return cls(arr, typecode=typecode)
+
+    def to_numpy(self, dtype=None):
+        """Returns an ndarray of the elements, in the order the stack is shown, i.e. with the front first.
+
+        :param dtype: Optional. The dtype of the ndarray. Without it, numpy infers one from a temporary list.
+        :return: The ndarray.
+        :exception: ImportError is raised if numpy isn't installed.
+
+        >>> from Queue import numpy
+
+        >>> numpy is None or Stack([1, 2, 3]).to_numpy('q').tolist() == [1, 2, 3]
+        True
+        """
+        return _to_numpy(reversed(self._elements), len(self._elements), dtype)
+
+
+class TypedStack(Stack):
+    """A stack of numbers which supports inserting and removing items in a FILO manner.
+
+    The numbers are stored unboxed in an array.array of the given typecode, with the front of the stack
+    at the end of the array. Bulk operations accept and return arrays, or any buffer-protocol object
+    of a matching item type, without per-element overhead.
+    """
+
+    def __init__(self, elements=None, typecode=None):
+        """Instantiates a new instance of a TypedStack.
+
+        :param elements: Optional. The elements initialize with.
+        :param typecode: The array typecode of the elements, e.g. 'q' or 'd'.
+        :exception: TypeError is raised if 'elements' is not iterable, or an element doesn't fit the typecode.
+        :exception: ValueError is raised if 'typecode' is not a valid typecode.
+
+        >>> my_stack = Stack(typecode='d')
+        >>> my_stack
+        []
+
+        The front of the stack is the left-most element.
+        >>> my_stack = Stack([3, 4, 5], typecode='q')
+        >>> my_stack
+        [3, 4, 5]
+        """
+        if typecode is None:
+            raise ValueError("typecode is required")
+
+        self._array = array.array(typecode) if elements is None else _as_array(elements, typecode)
+        self._array.reverse()
+
+    def __contains__(self, item) -> bool:
+        return item in self._array
+
+    def __eq__(self, other):
+        if isinstance(other, TypedStack):
+            return self._array == other._array
+        elif isinstance(other, Stack):
+            return self._array.tolist() == other._elements
+        else:
+            return NotImplemented
+
+    def __repr__(self):
+        return str(self._array.tolist()[::-1])
+
+    @property
+    def size(self):
+        """Returns the size of the stack.
+
+        :return: The size.
+
+        >>> my_stack = Stack([1, 2, 3], typecode='q')
+        >>> my_stack.size
+        3
+        """
+        return len(self._array)
+
+    @property
+    def typecode(self):
+        return self._array.typecode
+
+    def copy(self):
+        """Returns a copy of the stack.
+
+        :return: A copy of the stack.
+
+        >>> my_stack = Stack([1, 2, 3], typecode='q')
+        >>> my_stack.copy()
+        [1, 2, 3]
+        """
+        stack_copy = TypedStack(typecode=self._array.typecode)
+        stack_copy._array = self._array[:]
+
+        return stack_copy
+
+    def is_empty(self) -> bool:
+        """Returns True if the stack is empty, otherwise False.
+
+        :return: A boolean indicating whether the stack is empty.
+
+        >>> my_stack = Stack(typecode='q')
+        >>> my_stack.is_empty()
+        True
+        """
+        return len(self._array) == 0
+
+    def put(self, data):
+        """Inserts an element at the front of the stack.
+
+        :param data: The data.
+        :exception: TypeError is raised if the data doesn't fit the typecode.
+
+        >>> my_stack = Stack([2, 3, 4], typecode='q')
+        >>> my_stack.put(1)
+        >>> my_stack
+        [1, 2, 3, 4]
+        """
+        self._array.append(data)
+
+    def get(self):
+        """Retrieves and removes the element at the front of the stack.
+
+        :return: The retrieved data.
+
+        >>> my_stack = Stack([1, 2], typecode='q')
+        >>> my_stack.get(), my_stack
+        (1, [2])
+        """
+        if len(self._array) == 0:
+            raise IndexError('stack is empty')
+
+        return self._array.pop()
+
+    def peek(self):
+        """Retrieves the element at the front of the stack.
+
+        :return: The retrieved data.
+
+        >>> my_stack = Stack([1, 2], typecode='q')
+        >>> my_stack.peek(), my_stack
+        (1, [1, 2])
+        """
+        if len(self._array) == 0:
+            raise IndexError('stack is empty')
+
+        return self._array[-1]
+
+    def put_many(self, data):
+        """Inserts each element of the data at the front of the stack, in order.
+
+        :param data: An array, buffer-protocol object or iterable of data.
+        :exception: TypeError is raised if the data doesn't fit the typecode.
+
+        >>> my_stack = Stack([4], typecode='q')
+        >>> my_stack.put_many(array.array('q', [3, 2, 1]))
+        >>> my_stack
+        [1, 2, 3, 4]
+        """
+        self._array.frombytes(_as_view(data, self._array.typecode).cast('B'))
+
+    def get_many(self, n: int = None):
+        """Retrieves and removes up to n elements from the front of the stack.
+
+        :param n: Optional. The maximum number of elements to retrieve. Retrieves all if not given.
+        :return: An array of the retrieved data, front first.
+
+        >>> my_stack = Stack([1, 2, 3, 4], typecode='q')
+        >>> my_stack.get_many(3), my_stack
+        (array('q', [1, 2, 3]), [4])
+        """
+        n = len(self._array) if n is None else max(0, min(n, len(self._array)))
+
+        start = len(self._array) - n
+        data = self._array[start:]
+        del self._array[start:]
+        data.reverse()
+
+        return data
+
+    def reverse(self):
+        """Reverses the stack.
+
+        >>> my_stack = Stack([1, 2, 3], typecode='q')
+        >>> my_stack.reverse()
+        >>> my_stack
+        [3, 2, 1]
+        """
+        self._array.reverse()
+
+    def to_numpy(self, dtype=None):
+        """Returns an ndarray of the elements, in the order the stack is shown, i.e. with the front first.
+        The elements are copied once, and the ndarray owns the copy.
+
+        :param dtype: Optional. The dtype of the ndarray. Defaults to the typecode.
+        :return: The ndarray.
+        :exception: ImportError is raised if numpy isn't installed.
+
+        >>> from Queue import numpy
+
+        >>> numpy is None or Stack([1, 2, 3], typecode='q').to_numpy().tolist() == [1, 2, 3]
+        True
+        """
+        return _to_numpy(self._array[::-1], len(self._array), dtype)
+
+
+class AggregateStack(Stack):
+    """A stack which supports inserting and removing items in a FILO manner, and aggregating them in O(1).
+
+    The aggregate of each element with every element behind it is stored alongside the element, so
+    the aggregate of the whole stack is always at the front. The aggregating function must be
+    associative, e.g. min, max or operator.add, and is applied from the front of the stack to the back.
+    """
+
+    def __init__(self, elements=None, function=min):
+        """Instantiates a new instance of an AggregateStack.
+
+        :param elements: Optional. The elements initialize with.
+        :param function: Optional. The associative function of two elements to aggregate with.
+        :exception: TypeError is raised if 'elements' is not iterable.
+
+        >>> my_stack = AggregateStack([3, 4, 5], function=max)
+        >>> my_stack, my_stack.aggregate()
+        ([3, 4, 5], 5)
+        """
+        self._function = function
+        self._elements = []
+        self._aggregates = []
+
+        if elements is not None:
+            self.put_many(reversed(list(_elements_of(elements))))
+
+    @property
+    def function(self):
+        return self._function
+
+    def aggregate(self):
+        """Returns the aggregate of every element in the stack.
+
+        :return: The aggregate.
+        :exception: IndexError is raised if the stack is empty.
+
+        >>> my_stack = AggregateStack([4, 2, 7], function=min)
+        >>> my_stack.aggregate()
+        2
+        >>> my_stack.get(), my_stack.get(), my_stack.aggregate()
+        (4, 2, 7)
+        """
+        if len(self._aggregates) == 0:
+            raise IndexError('stack is empty')
+
+        return self._aggregates[-1]
+
+    def copy(self):
+        """Returns a copy of the stack.
+
+        :return: A copy of the stack.
+
+        >>> my_stack = AggregateStack([1, 2, 3])
+        >>> my_stack.copy()
+        [1, 2, 3]
+        """
+        stack_copy = AggregateStack(function=self._function)
+        stack_copy._elements = self._elements[:]
+        stack_copy._aggregates = self._aggregates[:]
+
+        return stack_copy
+
+    def put(self, data):
+        """Inserts an element at the front of the stack.
+
+        :param data: The data.
+
+        >>> my_stack = AggregateStack([2, 3], function=max)
+        >>> my_stack.put(5)
+        >>> my_stack, my_stack.aggregate()
+        ([5, 2, 3], 5)
+        """
+        if self._aggregates:
+            self._aggregates.append(self._function(data, self._aggregates[-1]))
+        else:
+            self._aggregates.append(data)
+
+        self._elements.append(data)
+
+    def get(self):
+        """Retrieves and removes the element at the front of the stack.
+
+        :return: The retrieved data.
+
+        >>> my_stack = AggregateStack([1, 2])
+        >>> my_stack.get(), my_stack
+        (1, [2])
+        """
+        if len(self._elements) == 0:
+            raise IndexError('stack is empty')
+
+        self._aggregates.pop()
+
+        return self._elements.pop()
+
+    def put_many(self, data):
+        """Inserts each element of the data at the front of the stack, in order.
+
+        :param data: An iterable of data.
+
+        >>> my_stack = AggregateStack([4], function=min)
+        >>> my_stack.put_many([3, 2, 1])
+        >>> my_stack, my_stack.aggregate()
+        ([1, 2, 3, 4], 1)
+        """
+        function = self._function
+        aggregates = self._aggregates
+        aggregate = aggregates[-1] if aggregates else None
+
+        for d in _elements_of(data):
+            aggregate = d if not aggregates else function(d, aggregate)
+            aggregates.append(aggregate)
+            self._elements.append(d)
+
+    def get_many(self, n: int = None):
+        """Retrieves and removes up to n elements from the front of the stack.
+
+        :param n: Optional. The maximum number of elements to retrieve. Retrieves all if not given.
+        :return: A list of the retrieved data, front first.
+
+        >>> my_stack = AggregateStack([1, 2, 3, 4])
+        >>> my_stack.get_many(3), my_stack
+        ([1, 2, 3], [4])
+        """
+        data = super().get_many(n)
+        del self._aggregates[len(self._elements):]
+
+        return data
+
+    def reverse(self):
+        """Reverses the stack.
+
+        >>> my_stack = AggregateStack([1, 2, 3], function=max)
+        >>> my_stack.reverse()
+        >>> my_stack
+        [3, 2, 1]
+        """
+        elements = self._elements[::-1]
+
+        self._elements = []
+        self._aggregates = []
+        self.put_many(elements)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018 Jared Gillespie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import collections.abc
+
+
+class Node:
+    """A node containing a list of data with, optionally, a pointer to a next and/or previous node.
+    i.e. Node1 <-> Node2 OR NULL <- Node1 -> NULL
+    """
+    __slots__ = ('elements', 'next', 'prev')
+
+    def __init__(self, elements):
+        self.elements = elements
+        self.next = None
+        self.prev = None
+
+    def __repr__(self):
+        return '%s -> %s -> %s' % ('NULL' if self.prev is None else self.prev.elements, self.elements,
+                                   'NULL' if self.next is None else self.next.elements)
+
+
+class UnrolledLinkedList:
+    """A list of doubly linked nodes, each containing up to 'capacity' elements.
+    i.e. NULL <- [1, 2, 3] <-> [4, 5] -> NULL
+
+    Storing many elements per node cuts the number of nodes, and so the memory and pointer-chasing of
+    walking the list, by up to a factor of 'capacity'. A node which overflows is split in half, and a node
+    which falls below a quarter full is merged with a neighbour when they fit in one node.
+    Indexing skips over whole nodes at a time, starting from the closer end.
+    """
+
+    def __init__(self, elements=None, capacity: int = 64):
+        """Instantiates a new instance of an UnrolledLinkedList.
+
+        :param elements: Optional. The elements initialize with.
+        :param capacity: Optional. The maximum number of elements per node.
+        :exception: TypeError is raised if 'elements' is not iterable.
+        :exception: ValueError is raised if 'capacity' is < 2.
+
+        >>> my_list = UnrolledLinkedList()
+        >>> my_list
+        []
+
+        >>> my_list = UnrolledLinkedList([3, 4, 5])
+        >>> my_list
+        [3, 4, 5]
+        """
+        if capacity < 2:
+            raise ValueError("capacity must be > 1")
+
+        self._capacity = capacity
+        self._head = None
+        self._tail = None
+        self._size = 0
+
+        if elements is not None:
+            self.extend(elements)
+
+    def __add__(self, other):
+        if not isinstance(other, UnrolledLinkedList):
+            raise TypeError("other must be an UnrolledLinkedList")
+
+        new_list = self.copy()
+        new_list.extend(other)
+
+        return new_list
+
+    def __contains__(self, item) -> bool:
+        node = self._head
+        while node is not None:
+            if item in node.elements:
+                return True
+            node = node.next
+
+        return False
+
+    def __delitem__(self, key):
+        self.remove_item(key)
+
+    def __eq__(self, other):
+        if isinstance(other, (UnrolledLinkedList, list)):
+            if len(self) != len(other):
+                return False
+
+            for self_data, other_data in zip(self, other):
+                if self_data != other_data:
+                    return False
+
+            return True
+        else:
+            return NotImplemented
+
+    def __getitem__(self, index: int):
+        return self.get(index)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __iter__(self):
+        node = self._head
+        while node is not None:
+            yield from node.elements
+            node = node.next
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return str(list(self))
+
+    def __reversed__(self):
+        """Returns an iterator over the list in reverse.
+
+        :return: A reverse iterator.
+
+        >>> my_list = UnrolledLinkedList([1, 2, 3])
+        >>> list(reversed(my_list))
+        [3, 2, 1]
+        """
+        node = self._tail
+        while node is not None:
+            yield from reversed(node.elements)
+            node = node.prev
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def size(self) -> int:
+        """Returns the size of the list.
+
+        :return: The size.
+
+        >>> my_list = UnrolledLinkedList()
+        >>> my_list.size
+        0
+
+        >>> my_list = UnrolledLinkedList([1, 2, 3])
+        >>> my_list.size
+        3
+        """
+        return self._size
+
+    def append(self, data):
+        """Appends the data to the end of the list.
+
+        :param data: The data to append.
+
+        >>> my_list = UnrolledLinkedList([3, 4])
+        >>> my_list.append(1)
+        >>> my_list
+        [3, 4, 1]
+        """
+        if self._tail is None or len(self._tail.elements) >= self._capacity:
+            self._link_after(self._tail, Node([data]))
+        else:
+            self._tail.elements.append(data)
+
+        self._size += 1
+
+    def copy(self):
+        """Returns a copy of the list.
+
+        :return: A copy of the list.
+
+        >>> my_list = UnrolledLinkedList([5, 7, -1])
+        >>> my_list.copy()
+        [5, 7, -1]
+        """
+        list_copy = UnrolledLinkedList(capacity=self._capacity)
+
+        node = self._head
+        while node is not None:
+            list_copy._link_after(list_copy._tail, Node(node.elements[:]))
+            node = node.next
+
+        list_copy._size = self._size
+
+        return list_copy
+
+    def extend(self, other):
+        """Extends the list with the elements of another.
+
+        :param other: A list or UnrolledLinkedList to extend the list with.
+        :exception: TypeError is raised if 'other' is not iterable.
+
+        >>> my_list = UnrolledLinkedList([1])
+        >>> my_list.extend([2, 3, 4])
+        >>> my_list
+        [1, 2, 3, 4]
+        """
+        if not isinstance(other, collections.abc.Iterable):
+            raise TypeError("other must be iterable")
+
+        elements = list(other)
+        capacity = self._capacity
+        start = 0
+
+        if self._tail is not None and len(self._tail.elements) < capacity:
+            start = capacity - len(self._tail.elements)
+            self._tail.elements.extend(elements[:start])
+
+        # Fill new nodes to three quarters, leaving room for inserts without splitting
+        step = max(1, capacity * 3 // 4)
+        for i in range(start, len(elements), step):
+            self._link_after(self._tail, Node(elements[i:i + step]))
+
+        self._size += len(elements)
+
+    def get(self, index: int):
+        """Gets the data at the specified index.
+
+        :param index: The index to retrieve.
+        :return: The data.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = UnrolledLinkedList([5, 2, -1, 2])
+        >>> my_list.get(1), my_list.get(-2)
+        (2, -1)
+        """
+        node, offset = self._locate(index)
+
+        return node.elements[offset]
+
+    def insert(self, index: int, data):
+        """Inserts the data at the given element.
+        If an element exists at the given position, the element is inserted before it.
+
+        :param index: The index to insert at.
+        :param data: The data to insert.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = UnrolledLinkedList()
+        >>> my_list.insert(0, 3)
+        >>> my_list.insert(0, 1)
+        >>> my_list.insert(-1, 2)
+        >>> my_list.insert(len(my_list), 4)
+        >>> my_list
+        [1, 2, 3, 4]
+        """
+        if index < -self._size or index > self._size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index = self._size + index
+
+        if index == self._size:
+            self.append(data)
+            return
+
+        node, offset = self._locate(index)
+        node.elements.insert(offset, data)
+        self._size += 1
+
+        if len(node.elements) > self._capacity:
+            half = len(node.elements) // 2
+            self._link_after(node, Node(node.elements[half:]))
+            del node.elements[half:]
+
+    def is_empty(self):
+        """Returns True if the list is empty, otherwise False.
+
+        :return: A boolean indicating whether the list is empty.
+
+        >>> my_list = UnrolledLinkedList()
+        >>> my_list.is_empty()
+        True
+        """
+        return self._size == 0
+
+    def pop(self):
+        """Removes and returns the data from the beginning of the list.
+
+        :return: The data.
+        :exception: IndexError is raised if list is empty.
+
+        >>> my_list = UnrolledLinkedList([1, 2, 3])
+        >>> my_list.pop()
+        1
+        """
+        if self._head is None:
+            raise IndexError("list is empty")
+
+        node = self._head
+        data = node.elements.pop(0)
+        self._size -= 1
+
+        if not node.elements:
+            self._unlink(node)
+
+        return data
+
+    def pop_last(self):
+        """Removes and returns the data from the end of the list.
+
+        :return: The data.
+        :exception: IndexError is raised if list is empty.
+
+        >>> my_list = UnrolledLinkedList([1, 2, 3])
+        >>> my_list.pop_last()
+        3
+        """
+        if self._tail is None:
+            raise IndexError("list is empty")
+
+        node = self._tail
+        data = node.elements.pop()
+        self._size -= 1
+
+        if not node.elements:
+            self._unlink(node)
+
+        return data
+
+    def prepend(self, data):
+        """Prepends the data to the beginning of the list.
+
+        :param data: The data to prepend.
+
+        >>> my_list = UnrolledLinkedList([3, 4])
+        >>> my_list.prepend(1)
+        >>> my_list
+        [1, 3, 4]
+        """
+        if self._head is None or len(self._head.elements) >= self._capacity:
+            node = Node([data])
+
+            if self._head is None:
+                self._head = self._tail = node
+            else:
+                node.next = self._head
+                self._head.prev = node
+                self._head = node
+        else:
+            self._head.elements.insert(0, data)
+
+        self._size += 1
+
+    def remove(self, index: int):
+        """Removes and returns the data at the given index.
+
+        :param index: The index to remove.
+        :return: The data at the index.
+        :exception: IndexError is raised if index is out of bounds.
+
+        >>> my_list = UnrolledLinkedList([4, 7, 2])
+        >>> my_list.remove(1), my_list
+        (7, [4, 2])
+        """
+        node, offset = self._locate(index)
+        data = node.elements.pop(offset)
+        self._size -= 1
+
+        self._rebalance(node)
+
+        return data
+
+    def remove_item(self, data):
+        """Removes the first occurrence of the given data.
+
+        :param data: The data to remove.
+        :exception: ValueError is raised if item is not found.
+
+        >>> my_list = UnrolledLinkedList([3, 4, 3])
+        >>> my_list.remove_item(3)
+        >>> my_list
+        [4, 3]
+        """
+        node = self._head
+
+        while node is not None:
+            if data in node.elements:
+                node.elements.remove(data)
+                self._size -= 1
+                self._rebalance(node)
+                return
+
+            node = node.next
+
+        raise ValueError("item not found")
+
+    def reverse(self):
+        """Reverses the list.
+
+        >>> my_list = UnrolledLinkedList([1, 2, 3])
+        >>> my_list.reverse()
+        >>> my_list
+        [3, 2, 1]
+        """
+        node = self._head
+        while node is not None:
+            node.elements.reverse()
+            node.next, node.prev = node.prev, node.next
+            node = node.prev
+
+        self._head, self._tail = self._tail, self._head
+
+    def _link_after(self, node: Node, new_node: Node):
+        """Links a new node after the given node, or as the only node if the given node is None."""
+        if node is None:
+            self._head = self._tail = new_node
+            return
+
+        new_node.prev = node
+        new_node.next = node.next
+
+        if node.next is None:
+            self._tail = new_node
+        else:
+            node.next.prev = new_node
+
+        node.next = new_node
+
+    def _locate(self, index: int):
+        """Returns the node containing an index, and the offset of the index within the node."""
+        if index < -self._size or index >= self._size:
+            raise IndexError("index is out of range")
+
+        if index < 0:
+            index = self._size + index
+
+        if index < self._size // 2:  # closer to head, start search from there
+            node = self._head
+            while index >= len(node.elements):
+                index -= len(node.elements)
+                node = node.next
+
+            return node, index
+        else:  # otherwise, start from tail
+            index = self._size - index
+            node = self._tail
+            while index > len(node.elements):
+                index -= len(node.elements)
+                node = node.prev
+
+            return node, len(node.elements) - index
+
+    def _rebalance(self, node: Node):
+        """Removes a node which has emptied, or merges it with a neighbour once it falls below a quarter full."""
+        if not node.elements:
+            self._unlink(node)
+            return
+
+        if len(node.elements) >= self._capacity // 4:
+            return
+
+        if node.next is not None and len(node.elements) + len(node.next.elements) <= self._capacity:
+            node.elements.extend(node.next.elements)
+            self._unlink(node.next)
+        elif node.prev is not None and len(node.elements) + len(node.prev.elements) <= self._capacity:
+            node.prev.elements.extend(node.elements)
+            self._unlink(node)
+
+    def _unlink(self, node: Node):
+        if node.prev is None:
+            self._head = node.next
+        else:
+            node.prev.next = node.next
+
+        if node.next is None:
+            self._tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
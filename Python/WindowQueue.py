@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018 Jared Gillespie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import collections
+
+from Stack import AggregateStack
+
+
+class WindowQueue:
+    """A queue which supports inserting and removing items in a FIFO manner, and aggregating them in O(1).
+
+    The queue is made of two AggregateStacks. Items are put onto an inbox stack, and moved in bulk to an
+    outbox stack when it runs dry, so put and get are amortized O(1). The aggregating function must be
+    associative, e.g. min, max or operator.add, and is applied from the front of the queue to the back.
+    If 'maxlen' is given, putting an item into a full queue evicts the item at the front.
+    """
+
+    def __init__(self, elements=None, function=min, maxlen: int = None):
+        """Instantiates a new instance of a WindowQueue.
+
+        :param elements: Optional. The elements initialize with.
+        :param function: Optional. The associative function of two elements to aggregate with.
+        :param maxlen: Optional. The maximum number of elements in the window.
+        :exception: TypeError is raised if 'elements' is not iterable.
+        :exception: ValueError is raised if 'maxlen' is < 1.
+
+        >>> my_queue = WindowQueue(function=max)
+        >>> my_queue
+        []
+
+        The front of the queue is the right-most element.
+        >>> my_queue = WindowQueue([3, 4, 5], function=max)
+        >>> my_queue, my_queue.aggregate()
+        ([3, 4, 5], 5)
+        """
+        if maxlen is not None and maxlen < 1:
+            raise ValueError("maxlen must be > 0")
+
+        self._function = function
+        self._maxlen = maxlen
+
+        # The inbox is aggregated back to front, so both stacks combine in queue order
+        self._inbox = AggregateStack(function=lambda a, b: function(b, a))
+        self._outbox = AggregateStack(function=function)
+
+        if elements is not None:
+            self.put_many(reversed(list(elements)))
+
+    def __contains__(self, item) -> bool:
+        return item in self._outbox or item in self._inbox
+
+    def __eq__(self, other):
+        if isinstance(other, WindowQueue):
+            return self._ordered() == other._ordered()
+        else:
+            return NotImplemented
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return str(self._ordered()[::-1])
+
+    @property
+    def function(self):
+        return self._function
+
+    @property
+    def maxlen(self):
+        return self._maxlen
+
+    @property
+    def size(self):
+        """Returns the size of the queue.
+
+        :return: The size.
+
+        >>> my_queue = WindowQueue([1, 2, 3])
+        >>> my_queue.size
+        3
+        """
+        return self._inbox.size + self._outbox.size
+
+    def aggregate(self):
+        """Returns the aggregate of every element in the queue.
+
+        :return: The aggregate.
+        :exception: IndexError is raised if the queue is empty.
+
+        >>> my_queue = WindowQueue([3, 1, 2], function=min)
+        >>> my_queue.aggregate()
+        1
+        >>> my_queue.get(), my_queue.get(), my_queue.aggregate()
+        (2, 1, 3)
+        """
+        if self._outbox.is_empty():
+            if self._inbox.is_empty():
+                raise IndexError('queue is empty')
+
+            return self._inbox.aggregate()
+        elif self._inbox.is_empty():
+            return self._outbox.aggregate()
+
+        return self._function(self._outbox.aggregate(), self._inbox.aggregate())
+
+    def copy(self):
+        """Returns a copy of the queue.
+
+        :return: A copy of the queue.
+
+        >>> my_queue = WindowQueue([1, 2, 3])
+        >>> my_queue.copy()
+        [1, 2, 3]
+        """
+        queue_copy = WindowQueue(function=self._function, maxlen=self._maxlen)
+        queue_copy._inbox = self._inbox.copy()
+        queue_copy._outbox = self._outbox.copy()
+
+        return queue_copy
+
+    def is_empty(self) -> bool:
+        """Returns True if the queue is empty, otherwise False.
+
+        :return: A boolean indicating whether the queue is empty.
+
+        >>> my_queue = WindowQueue()
+        >>> my_queue.is_empty()
+        True
+        """
+        return self._inbox.is_empty() and self._outbox.is_empty()
+
+    def put(self, data):
+        """Inserts an element at the end of the queue, evicting the front element if the queue is full.
+
+        :param data: The data.
+
+        >>> my_queue = WindowQueue([2, 3], function=max, maxlen=2)
+        >>> my_queue.put(1)
+        >>> my_queue, my_queue.aggregate()
+        ([1, 2], 2)
+        """
+        if self._maxlen is not None and self.size == self._maxlen:
+            self.get()
+
+        self._inbox.put(data)
+
+    def put_many(self, data):
+        """Inserts each element of the data at the end of the queue, in order.
+
+        :param data: An iterable of data.
+
+        >>> my_queue = WindowQueue([4], function=min)
+        >>> my_queue.put_many([3, 2, 1])
+        >>> my_queue, my_queue.aggregate()
+        ([1, 2, 3, 4], 1)
+        """
+        if self._maxlen is None:
+            self._inbox.put_many(data)
+        else:
+            for d in data:
+                self.put(d)
+
+    def get(self):
+        """Retrieves and removes the element at the front of the queue.
+
+        :return: The retrieved data.
+        :exception: IndexError is raised if the queue is empty.
+
+        >>> my_queue = WindowQueue([1, 2])
+        >>> my_queue.get(), my_queue
+        (2, [1])
+        """
+        if self._outbox.is_empty():
+            self._transfer()
+
+        return self._outbox.get()
+
+    def peek(self):
+        """Retrieves the element at the front of the queue.
+
+        :return: The retrieved data.
+        :exception: IndexError is raised if the queue is empty.
+
+        >>> my_queue = WindowQueue([1, 2])
+        >>> my_queue.peek(), my_queue
+        (2, [1, 2])
+        """
+        if self._outbox.is_empty():
+            self._transfer()
+
+        return self._outbox.peek()
+
+    def _ordered(self):
+        """Returns a list of the elements, front first."""
+        return self._outbox._elements[::-1] + self._inbox._elements
+
+    def _transfer(self):
+        if self._outbox.is_empty():
+            self._outbox.put_many(self._inbox.get_many())
+
+
+class MonotonicQueue:
+    """A queue which supports inserting and removing items in a FIFO manner, and retrieving their
+    maximum or minimum in O(1).
+
+    Alongside the elements, a monotonic queue holds each element which is not dominated by a newer one.
+    Its front is the extremum of the whole queue. Each element enters and leaves it at most once,
+    so put and get are amortized O(1).
+    If 'maxlen' is given, putting an item into a full queue evicts the item at the front.
+    """
+
+    def __init__(self, elements=None, function=max, maxlen: int = None):
+        """Instantiates a new instance of a MonotonicQueue.
+
+        :param elements: Optional. The elements initialize with.
+        :param function: Optional. Either max or min.
+        :param maxlen: Optional. The maximum number of elements in the window.
+        :exception: TypeError is raised if 'elements' is not iterable.
+        :exception: ValueError is raised if 'function' is not max or min, or 'maxlen' is < 1.
+
+        The front of the queue is the right-most element.
+        >>> my_queue = MonotonicQueue([3, 5, 4])
+        >>> my_queue, my_queue.aggregate()
+        ([3, 5, 4], 5)
+        """
+        if function is not max and function is not min:
+            raise ValueError("function must be max or min")
+
+        if maxlen is not None and maxlen < 1:
+            raise ValueError("maxlen must be > 0")
+
+        self._function = function
+        self._maxlen = maxlen
+        self._elements = collections.deque()
+        self._extrema = collections.deque()
+        self._head_seq = 0
+
+        if elements is not None:
+            self.put_many(reversed(list(elements)))
+
+    def __contains__(self, item) -> bool:
+        return item in self._elements
+
+    def __eq__(self, other):
+        if isinstance(other, MonotonicQueue):
+            return self._elements == other._elements
+        else:
+            return NotImplemented
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __repr__(self):
+        return str(list(reversed(self._elements)))
+
+    @property
+    def function(self):
+        return self._function
+
+    @property
+    def maxlen(self):
+        return self._maxlen
+
+    @property
+    def size(self):
+        """Returns the size of the queue.
+
+        :return: The size.
+
+        >>> my_queue = MonotonicQueue([1, 2, 3])
+        >>> my_queue.size
+        3
+        """
+        return len(self._elements)
+
+    def aggregate(self):
+        """Returns the maximum or minimum of every element in the queue.
+
+        :return: The aggregate.
+        :exception: IndexError is raised if the queue is empty.
+
+        >>> my_queue = MonotonicQueue([3, 1, 2], function=min)
+        >>> my_queue.aggregate()
+        1
+        >>> my_queue.get(), my_queue.get(), my_queue.aggregate()
+        (2, 1, 3)
+        """
+        if len(self._extrema) == 0:
+            raise IndexError('queue is empty')
+
+        return self._extrema[0][0]
+
+    def copy(self):
+        """Returns a copy of the queue.
+
+        :return: A copy of the queue.
+
+        >>> my_queue = MonotonicQueue([1, 2, 3])
+        >>> my_queue.copy()
+        [1, 2, 3]
+        """
+        queue_copy = MonotonicQueue(function=self._function, maxlen=self._maxlen)
+        queue_copy._elements = self._elements.copy()
+        queue_copy._extrema = self._extrema.copy()
+        queue_copy._head_seq = self._head_seq
+
+        return queue_copy
+
+    def is_empty(self) -> bool:
+        """Returns True if the queue is empty, otherwise False.
+
+        :return: A boolean indicating whether the queue is empty.
+
+        >>> my_queue = MonotonicQueue()
+        >>> my_queue.is_empty()
+        True
+        """
+        return len(self._elements) == 0
+
+    def put(self, data):
+        """Inserts an element at the end of the queue, evicting the front element if the queue is full.
+
+        :param data: The data.
+
+        >>> my_queue = MonotonicQueue([2, 3], maxlen=2)
+        >>> my_queue.put(1)
+        >>> my_queue, my_queue.aggregate()
+        ([1, 2], 2)
+        """
+        if self._maxlen is not None and len(self._elements) == self._maxlen:
+            self.get()
+
+        extrema = self._extrema
+
+        # Drop every older element which can no longer be the extremum
+        if self._function is max:
+            while extrema and extrema[-1][0] < data:
+                extrema.pop()
+        else:
+            while extrema and data < extrema[-1][0]:
+                extrema.pop()
+
+        extrema.append((data, self._head_seq + len(self._elements)))
+        self._elements.append(data)
+
+    def put_many(self, data):
+        """Inserts each element of the data at the end of the queue, in order.
+
+        :param data: An iterable of data.
+
+        >>> my_queue = MonotonicQueue([4])
+        >>> my_queue.put_many([3, 2, 1])
+        >>> my_queue, my_queue.aggregate()
+        ([1, 2, 3, 4], 4)
+        """
+        for d in data:
+            self.put(d)
+
+    def get(self):
+        """Retrieves and removes the element at the front of the queue.
+
+        :return: The retrieved data.
+        :exception: IndexError is raised if the queue is empty.
+
+        >>> my_queue = MonotonicQueue([1, 2])
+        >>> my_queue.get(), my_queue
+        (2, [1])
+        """
+        if len(self._elements) == 0:
+            raise IndexError('queue is empty')
+
+        if self._extrema[0][1] == self._head_seq:
+            self._extrema.popleft()
+
+        self._head_seq += 1
+
+        return self._elements.popleft()
+
+    def peek(self):
+        """Retrieves the element at the front of the queue.
+
+        :return: The retrieved data.
+        :exception: IndexError is raised if the queue is empty.
+
+        >>> my_queue = MonotonicQueue([1, 2])
+        >>> my_queue.peek(), my_queue
+        (2, [1, 2])
+        """
+        if len(self._elements) == 0:
+            raise IndexError('queue is empty')
+
+        return self._elements[0]
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
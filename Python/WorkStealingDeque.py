@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018 Jared Gillespie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import collections
+import concurrent.futures
+import os
+import random
+import threading
+
+
+class WorkStealingDeque:
+    """A deque which one owner thread uses as a stack, and other threads steal from as a queue.
+
+    The owner inserts and removes items at the bottom in a FILO manner, keeping recently created work
+    local, while thieves remove the oldest items from the top. Each operation is a single atomic
+    operation on a collections.deque, so neither the owner nor thieves take a lock.
+    """
+
+    def __init__(self, elements=None):
+        """Instantiates a new instance of a WorkStealingDeque.
+
+        :param elements: Optional. The elements initialize with, from top to bottom.
+        :exception: TypeError is raised if 'elements' is not iterable.
+
+        >>> my_deque = WorkStealingDeque()
+        >>> my_deque
+        []
+
+        The bottom of the deque is the right-most element.
+        >>> my_deque = WorkStealingDeque([3, 4, 5])
+        >>> my_deque
+        [3, 4, 5]
+        """
+        self._elements = collections.deque() if elements is None else collections.deque(elements)
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __repr__(self):
+        return str(list(self._elements))
+
+    @property
+    def size(self):
+        """Returns the size of the deque.
+
+        :return: The size.
+
+        >>> my_deque = WorkStealingDeque([1, 2, 3])
+        >>> my_deque.size
+        3
+        """
+        return len(self._elements)
+
+    def is_empty(self) -> bool:
+        """Returns True if the deque is empty, otherwise False.
+
+        :return: A boolean indicating whether the deque is empty.
+
+        >>> my_deque = WorkStealingDeque()
+        >>> my_deque.is_empty()
+        True
+        """
+        return len(self._elements) == 0
+
+    def push(self, data):
+        """Inserts an element at the bottom of the deque. Only the owner should push.
+
+        :param data: The data.
+
+        >>> my_deque = WorkStealingDeque([1, 2])
+        >>> my_deque.push(3)
+        >>> my_deque
+        [1, 2, 3]
+        """
+        self._elements.append(data)
+
+    def pop(self):
+        """Retrieves and removes the element at the bottom of the deque. Only the owner should pop.
+
+        :return: The retrieved data.
+        :exception: IndexError is raised if the deque is empty.
+
+        >>> my_deque = WorkStealingDeque([1, 2])
+        >>> my_deque.pop(), my_deque
+        (2, [1])
+        """
+        return self._elements.pop()
+
+    def steal(self):
+        """Retrieves and removes the element at the top of the deque. Any thread may steal.
+
+        :return: The retrieved data.
+        :exception: IndexError is raised if the deque is empty.
+
+        >>> my_deque = WorkStealingDeque([1, 2])
+        >>> my_deque.steal(), my_deque
+        (1, [2])
+        """
+        return self._elements.popleft()
+
+
+class WorkStealingExecutor(concurrent.futures.Executor):
+    """An executor which runs tasks on a pool of threads, each with its own WorkStealingDeque.
+
+    Tasks submitted from a worker go onto that worker's deque, and tasks submitted from elsewhere go onto
+    a shared queue. An idle worker runs its own newest task first, then the shared queue's oldest, and
+    otherwise steals the oldest task of another worker.
+    For fork-join tasks, waiting on a subtask with join() runs other tasks instead of blocking the worker.
+    """
+
+    def __init__(self, max_workers: int = None):
+        """Instantiates a new instance of a WorkStealingExecutor.
+
+        :param max_workers: Optional. The number of worker threads. Defaults to the number of CPUs.
+        :exception: ValueError is raised if 'max_workers' is < 1.
+
+        >>> with WorkStealingExecutor(2) as executor:
+        ...     list(executor.map(abs, [-1, -2, 3]))
+        [1, 2, 3]
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be > 0")
+
+        self._deques = [WorkStealingDeque() for _ in range(max_workers)]
+        self._injected = collections.deque()
+        self._local = threading.local()
+        self._condition = threading.Condition()
+        self._idle = 0
+        self._shutdown = False
+
+        self._threads = [threading.Thread(target=self._work, args=(i,), daemon=True) for i in range(max_workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def join(self, future: concurrent.futures.Future):
+        """Waits for a future and returns its result. On a worker, other tasks are run while waiting.
+
+        :param future: The future.
+        :return: The result of the future.
+
+        >>> def fib(executor, n):
+        ...     if n < 2:
+        ...         return n
+        ...     a = executor.submit(fib, executor, n - 1)
+        ...     return fib(executor, n - 2) + executor.join(a)
+        >>> with WorkStealingExecutor(4) as executor:
+        ...     executor.join(executor.submit(fib, executor, 15))
+        610
+        """
+        index = getattr(self._local, 'index', None)
+
+        if index is not None:
+            while not future.done():
+                work = self._find(index)
+                if work is None:
+                    concurrent.futures.wait([future], timeout=0.001)
+                else:
+                    self._run(work)
+
+        return future.result()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+
+        if cancel_futures:
+            for deque in [self._injected] + [d._elements for d in self._deques]:
+                while deque:
+                    try:
+                        deque.popleft()[0].cancel()
+                    except IndexError:
+                        break
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = concurrent.futures.Future()
+        work = (future, fn, args, kwargs)
+        index = getattr(self._local, 'index', None)
+
+        # Enqueue under the lock, so a worker can't go idle or exit between the enqueue and the notify
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+
+            if index is None:
+                self._injected.append(work)
+            else:
+                self._deques[index].push(work)
+
+            if self._idle:
+                self._condition.notify()
+
+        return future
+
+    def _find(self, index: int):
+        try:
+            return self._deques[index].pop()
+        except IndexError:
+            pass
+
+        try:
+            return self._injected.popleft()
+        except IndexError:
+            pass
+
+        # Start from a random victim so thieves spread out over the other workers
+        count = len(self._deques)
+        start = random.randrange(count)
+        for i in range(count):
+            victim = (start + i) % count
+            if victim != index:
+                try:
+                    return self._deques[victim].steal()
+                except IndexError:
+                    pass
+
+        return None
+
+    @staticmethod
+    def _run(work):
+        future, fn, args, kwargs = work
+
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def _work(self, index: int):
+        self._local.index = index
+
+        while True:
+            work = self._find(index)
+
+            if work is None:
+                with self._condition:
+                    # submit() enqueues under the lock, so looking again here can't miss a task before waiting
+                    work = self._find(index)
+
+                    if work is None:
+                        if self._shutdown:
+                            return
+
+                        self._idle += 1
+                        self._condition.wait()
+                        self._idle -= 1
+                        continue
+
+            self._run(work)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()